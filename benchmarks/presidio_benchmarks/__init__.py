@@ -0,0 +1,40 @@
+"""Performance benchmarks for Presidio."""
+import logging
+
+from presidio_benchmarks.corpus import CorpusGenerator
+from presidio_benchmarks.scenarios import (
+    Scenario,
+    AnalyzeScenario,
+    BatchAnalyzeScenario,
+    AnonymizeScenario,
+    ImageRedactScenario,
+    ImportScenario,
+    SCENARIOS,
+)
+from presidio_benchmarks.runner import (
+    ScenarioResult,
+    BenchmarkReport,
+    Regression,
+    run_scenario,
+    run_benchmarks,
+    compare_to_baseline,
+)
+
+logging.getLogger("presidio-benchmarks").addHandler(logging.NullHandler())
+
+__all__ = [
+    "CorpusGenerator",
+    "Scenario",
+    "AnalyzeScenario",
+    "BatchAnalyzeScenario",
+    "AnonymizeScenario",
+    "ImageRedactScenario",
+    "ImportScenario",
+    "SCENARIOS",
+    "ScenarioResult",
+    "BenchmarkReport",
+    "Regression",
+    "run_scenario",
+    "run_benchmarks",
+    "compare_to_baseline",
+]
@@ -0,0 +1,136 @@
+import argparse
+import logging
+import sys
+from typing import List
+
+from presidio_benchmarks.runner import (
+    COMPARED_METRICS,
+    BenchmarkReport,
+    ScenarioResult,
+    compare_to_baseline,
+    run_benchmarks,
+)
+from presidio_benchmarks.scenarios import SCENARIOS
+
+COLUMNS = (
+    ("scenario", "{:<36}"),
+    ("items_per_second", "{:>12.1f}"),
+    ("mb_per_second", "{:>10.3f}"),
+    ("p50_latency_ms", "{:>10.2f}"),
+    ("p99_latency_ms", "{:>10.2f}"),
+    ("peak_memory_mb", "{:>10.1f}"),
+)
+HEADERS = ("scenario", "items/s", "MB/s", "p50 ms", "p99 ms", "peak MB")
+
+
+def format_results(results: List[ScenarioResult]) -> str:
+    """Format benchmark results as a text table."""
+    widths = [len(fmt.format(0 if i else "")) for i, (_, fmt) in enumerate(COLUMNS)]
+    lines = [
+        " ".join(
+            header.ljust(width) if i == 0 else header.rjust(width)
+            for i, (header, width) in enumerate(zip(HEADERS, widths))
+        )
+    ]
+    for result in results:
+        lines.append(
+            " ".join(fmt.format(getattr(result, name)) for name, fmt in COLUMNS)
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the benchmarks and optionally compare them to a baseline."""
+    parser = argparse.ArgumentParser(
+        prog="presidio_benchmarks",
+        description="Run Presidio performance benchmarks.",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="scenario to run (can be repeated), defaults to all scenarios "
+        "which are not slow",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="run all scenarios, including slow ones"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the scenarios and exit"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="timed passes over the inputs"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="inputs processed before measuring"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="corpus random seed")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip peak memory measurement"
+    )
+    parser.add_argument("-o", "--output", help="save the results to a JSON file")
+    parser.add_argument(
+        "-b", "--baseline", help="compare the results to a saved JSON baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="relative change allowed before reporting a regression (default 0.1)",
+    )
+    parser.add_argument(
+        "--metric",
+        dest="metrics",
+        action="append",
+        choices=list(COMPARED_METRICS),
+        help="metric to compare to the baseline (can be repeated), defaults to all",
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS:
+            reason = scenario.unavailable_reason()
+            status = f" (unavailable: {reason})" if reason else ""
+            if scenario.slow:
+                status += " (slow)"
+            print(f"{scenario.name:<36} {scenario.description}{status}")
+        return 0
+
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("presidio-benchmarks").setLevel(logging.INFO)
+    if args.scenarios:
+        scenarios = [s for s in SCENARIOS if s.name in args.scenarios]
+    else:
+        scenarios = [s for s in SCENARIOS if args.all or not s.slow]
+    report = run_benchmarks(
+        scenarios,
+        seed=args.seed,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        measure_memory=not args.no_memory,
+    )
+    print(format_results(report.results))
+
+    if args.output:
+        report.save(args.output)
+
+    if args.baseline:
+        regressions = compare_to_baseline(
+            report,
+            BenchmarkReport.load(args.baseline),
+            tolerance=args.tolerance,
+            metrics=args.metrics,
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regressions compared to {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions compared to {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
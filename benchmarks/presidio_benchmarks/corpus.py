@@ -0,0 +1,305 @@
+import random
+import string
+from typing import List, Tuple, Dict, Optional
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Daniel", "Nancy", "Matthew", "Lisa",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris",
+]
+CITIES = [
+    "Seattle", "New York", "Chicago", "Boston", "Denver", "Austin", "Atlanta",
+    "San Francisco", "Los Angeles", "Miami", "Portland", "Phoenix",
+]
+DOMAINS = ["example.com", "mail.test", "contoso.com", "fabrikam.org", "corp.local"]
+LOG_LEVELS = ["INFO", "INFO", "INFO", "DEBUG", "WARN", "ERROR"]
+LOG_ACTIONS = ["login", "logout", "update_profile", "payment", "password_reset"]
+
+CHAT_TEMPLATES = [
+    "Hi, this is {PERSON}, can you call me back at {PHONE_NUMBER}?",
+    "My email is {EMAIL_ADDRESS} if you need anything else.",
+    "Sure, please charge my card {CREDIT_CARD} for the order.",
+    "I moved to {LOCATION} last week, my new number is {PHONE_NUMBER}.",
+    "My SSN is {US_SSN}, let me know if you need more details.",
+    "Ok thanks! See you tomorrow at {DATE_TIME}.",
+    "The server at {IP_ADDRESS} is down again, {PERSON} is looking into it.",
+    "Please wire the money to {IBAN_CODE} by {DATE_TIME}.",
+    "Check out {URL} for the full details.",
+    "Sounds good, talk soon.",
+    "Can you send the report to {EMAIL_ADDRESS} and cc {PERSON}?",
+]
+
+DOCUMENT_TEMPLATE = (
+    "Customer {PERSON} ({EMAIL_ADDRESS}, {PHONE_NUMBER}) from {LOCATION} "
+    "paid with {CREDIT_CARD} on {DATE_TIME}. SSN on file: {US_SSN}. "
+    "Refunds go to {IBAN_CODE}. Last login from {IP_ADDRESS}.\n"
+)
+
+
+class CorpusGenerator:
+    """
+    Generate synthetic texts, tables and images containing fake PII.
+
+    The generated values are valid for the relevant recognizers
+    (e.g. credit card numbers pass the Luhn checksum), so that benchmarks
+    go through the same code paths as real data.
+
+    :param seed: Seed for the random generator, for reproducible corpora
+    """
+
+    def __init__(self, seed: int = 42):
+        self.random = random.Random(seed)
+        self._generators = {
+            "PERSON": self.person,
+            "EMAIL_ADDRESS": self.email_address,
+            "PHONE_NUMBER": self.phone_number,
+            "CREDIT_CARD": self.credit_card,
+            "US_SSN": self.us_ssn,
+            "IP_ADDRESS": self.ip_address,
+            "IBAN_CODE": self.iban_code,
+            "URL": self.url,
+            "DATE_TIME": self.date_time,
+            "LOCATION": self.location,
+        }
+
+    @property
+    def entities(self) -> List[str]:
+        """Return the entity types this generator produces."""
+        return list(self._generators)
+
+    def value(self, entity: str) -> str:
+        """Return a fake value of a given entity type."""
+        return self._generators[entity]()
+
+    def person(self) -> str:
+        """Return a fake full name."""
+        return f"{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}"
+
+    def email_address(self) -> str:
+        """Return a fake email address."""
+        first = self.random.choice(FIRST_NAMES).lower()
+        last = self.random.choice(LAST_NAMES).lower()
+        return f"{first}.{last}@{self.random.choice(DOMAINS)}"
+
+    def phone_number(self) -> str:
+        """Return a fake US phone number."""
+        return (
+            f"({self.random.randint(201, 989)}) "
+            f"{self.random.randint(200, 999)}-{self.random.randint(0, 9999):04d}"
+        )
+
+    def credit_card(self) -> str:
+        """Return a fake 16 digits Visa number with a valid checksum."""
+        digits = [4] + [self.random.randint(0, 9) for _ in range(14)]
+        digits.append(self._luhn_check_digit(digits))
+        number = "".join(str(d) for d in digits)
+        return "-".join(number[i : i + 4] for i in range(0, 16, 4))
+
+    def us_ssn(self) -> str:
+        """Return a fake US social security number."""
+        return (
+            f"{self.random.randint(100, 665)}-{self.random.randint(10, 99)}-"
+            f"{self.random.randint(1000, 9999)}"
+        )
+
+    def ip_address(self) -> str:
+        """Return a fake IPv4 address."""
+        return ".".join(str(self.random.randint(1, 254)) for _ in range(4))
+
+    def iban_code(self) -> str:
+        """Return a fake German IBAN with valid check digits."""
+        bban = "".join(self.random.choice(string.digits) for _ in range(18))
+        # Move the country code and placeholder check digits to the end,
+        # converting letters to numbers (D=13, E=14)
+        check_digits = 98 - int(bban + "131400") % 97
+        return f"DE{check_digits:02d}{bban}"
+
+    def url(self) -> str:
+        """Return a fake URL."""
+        path = "".join(self.random.choice(string.ascii_lowercase) for _ in range(8))
+        return f"https://www.{self.random.choice(DOMAINS)}/{path}"
+
+    def date_time(self) -> str:
+        """Return a fake date."""
+        return (
+            f"{self.random.randint(1, 12):02d}/{self.random.randint(1, 28):02d}/"
+            f"{self.random.randint(1990, 2023)}"
+        )
+
+    def location(self) -> str:
+        """Return a fake city name."""
+        return self.random.choice(CITIES)
+
+    def chat_messages(self, count: int) -> List[str]:
+        """
+        Return short chat messages, most of them containing PII.
+
+        :param count: Number of messages to generate
+        """
+        return [
+            self.fill_template(self.random.choice(CHAT_TEMPLATES))[0]
+            for _ in range(count)
+        ]
+
+    def log_text(self, size_bytes: int = 1_000_000) -> str:
+        """
+        Return application log lines with PII, of approximately the given size.
+
+        :param size_bytes: Approximate size of the returned text in bytes
+        """
+        lines = []
+        size = 0
+        while size < size_bytes:
+            month, day = self.random.randint(1, 12), self.random.randint(1, 28)
+            hour, minute = self.random.randint(0, 23), self.random.randint(0, 59)
+            line = (
+                f"2023-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:00Z "
+                f"{self.random.choice(LOG_LEVELS)} "
+                f"action={self.random.choice(LOG_ACTIONS)} "
+                f"user={self.email_address()} ip={self.ip_address()} "
+                f"latency_ms={self.random.randint(1, 900)}\n"
+            )
+            lines.append(line)
+            size += len(line)
+        return "".join(lines)
+
+    def table(self, rows: int) -> Dict[str, List[str]]:
+        """
+        Return a table of customer records, as a dictionary of columns.
+
+        :param rows: Number of rows in the table
+        """
+        columns = {
+            "name": self.person,
+            "email": self.email_address,
+            "phone": self.phone_number,
+            "ssn": self.us_ssn,
+            "city": self.location,
+            "amount": lambda: f"{self.random.uniform(1, 5000):.2f}",
+            "notes": lambda: self.random.choice(CHAT_TEMPLATES).split("{")[0],
+        }
+        return {
+            name: [generate() for _ in range(rows)]
+            for name, generate in columns.items()
+        }
+
+    def csv_text(self, rows: int) -> str:
+        """
+        Return a table of customer records in CSV format.
+
+        :param rows: Number of rows in the table
+        """
+        table = self.table(rows)
+        lines = [",".join(table)]
+        lines.extend(",".join(f'"{v}"' for v in row) for row in zip(*table.values()))
+        return "\n".join(lines) + "\n"
+
+    def financial_document(self, transactions: int) -> str:
+        """
+        Return a bank statement listing a transfer to an IBAN on each line.
+
+        A third of the IBANs are written in groups of 4 characters,
+        and some lines reference an invoice number which isn't an IBAN.
+
+        :param transactions: Number of lines in the statement
+        """
+        lines = []
+        for i in range(transactions):
+            iban = self.iban_code()
+            if i % 3 == 0:
+                iban = " ".join(iban[j : j + 4] for j in range(0, len(iban), 4))
+            month, day = self.random.randint(1, 12), self.random.randint(1, 28)
+            lines.append(
+                f"2023-{month:02d}-{day:02d} SEPA transfer to {iban} "
+                f"EUR {self.random.uniform(1, 5000):.2f} ref INV{i:06d}\n"
+            )
+        return "".join(lines)
+
+    def pii_dense_document(
+        self, paragraphs: int
+    ) -> Tuple[str, List[Tuple[str, int, int]]]:
+        """
+        Return a document densely packed with PII, with the PII locations.
+
+        Useful for benchmarking anonymization without running detection.
+
+        :param paragraphs: Number of paragraphs, each with 9 PII values
+        :return: The text and a list of (entity_type, start, end) tuples
+        """
+        text = ""
+        spans = []
+        for _ in range(paragraphs):
+            paragraph, paragraph_spans = self.fill_template(DOCUMENT_TEMPLATE)
+            spans.extend(
+                (entity, start + len(text), end + len(text))
+                for entity, start, end in paragraph_spans
+            )
+            text += paragraph
+        return text, spans
+
+    def scanned_image(
+        self, lines: int = 10, width: int = 1200, noise: Optional[float] = 0.01
+    ) -> "Image":  # noqa F821
+        """
+        Return a grayscale image of PII text, resembling a scanned document.
+
+        Requires Pillow.
+
+        :param lines: Number of text lines in the image
+        :param width: Image width in pixels
+        :param noise: Fraction of pixels to set to random gray levels
+        """
+        from PIL import Image, ImageDraw, ImageFont
+
+        line_height = 40
+        image = Image.new("L", (width, line_height * (lines + 1)), color=255)
+        draw = ImageDraw.Draw(image)
+        try:
+            font = ImageFont.load_default(size=24)
+        except TypeError:
+            # Pillow < 10.1 does not support sizing the default font
+            font = ImageFont.load_default()
+        for i in range(lines):
+            text = self.fill_template(self.random.choice(CHAT_TEMPLATES))[0]
+            draw.text((20, 20 + i * line_height), text, fill=0, font=font)
+
+        if noise:
+            pixels = image.load()
+            for _ in range(int(image.width * image.height * noise)):
+                x = self.random.randrange(image.width)
+                y = self.random.randrange(image.height)
+                pixels[x, y] = self.random.randint(100, 255)
+        return image
+
+    def fill_template(self, template: str) -> Tuple[str, List[Tuple[str, int, int]]]:
+        """
+        Replace {ENTITY_TYPE} placeholders with fake values.
+
+        :param template: Text with placeholders
+        :return: The text and a list of (entity_type, start, end) of the values
+        """
+        text = ""
+        spans = []
+        for literal, entity, _, _ in string.Formatter().parse(template):
+            text += literal
+            if entity:
+                value = self.value(entity)
+                spans.append((entity, len(text), len(text) + len(value)))
+                text += value
+        return text, spans
+
+    @staticmethod
+    def _luhn_check_digit(digits: List[int]) -> int:
+        total = 0
+        for i, digit in enumerate(reversed(digits)):
+            if i % 2 == 0:
+                digit *= 2
+                if digit > 9:
+                    digit -= 9
+            total += digit
+        return (10 - total % 10) % 10
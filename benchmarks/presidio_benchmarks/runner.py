@@ -0,0 +1,255 @@
+import json
+import logging
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional
+
+from presidio_benchmarks.corpus import CorpusGenerator
+from presidio_benchmarks.scenarios import Scenario
+
+logger = logging.getLogger("presidio-benchmarks")
+
+# Metrics compared against the baseline, and whether higher values are better
+COMPARED_METRICS = {
+    "items_per_second": True,
+    "mb_per_second": True,
+    "p50_latency_ms": False,
+    "p99_latency_ms": False,
+    "peak_memory_mb": False,
+}
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Measurements of a single scenario.
+
+    :param scenario: Name of the scenario
+    :param items: Number of processed inputs, over all repetitions
+    :param total_bytes: Size of the processed inputs, over all repetitions
+    :param items_per_second: Throughput in inputs per second
+    :param mb_per_second: Throughput in megabytes of input per second
+    :param p50_latency_ms: Median latency of processing a single input
+    :param p99_latency_ms: 99th percentile latency of processing a single input
+    :param peak_memory_mb: Peak memory allocated by Python while processing the inputs
+    :param setup_seconds: Time spent creating the engines and the inputs
+    """
+
+    scenario: str
+    items: int
+    total_bytes: int
+    items_per_second: float
+    mb_per_second: float
+    p50_latency_ms: float
+    p99_latency_ms: float
+    peak_memory_mb: float
+    setup_seconds: float
+
+
+@dataclass
+class Regression:
+    """A metric of a scenario which is worse than its baseline value."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Return the relative change from the baseline."""
+        return (self.current - self.baseline) / self.baseline
+
+    def __str__(self) -> str:
+        """Return a human readable description of the regression."""
+        return (
+            f"{self.scenario}: {self.metric} {self.baseline:.3f} -> "
+            f"{self.current:.3f} ({self.change:+.1%})"
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run, with details on the environment it ran on."""
+
+    results: List[ScenarioResult]
+    environment: Dict[str, str] = field(default_factory=dict)
+
+    def save(self, path: str) -> None:
+        """Save the report as JSON, e.g. for using it as a baseline."""
+        with open(path, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "BenchmarkReport":
+        """Load a report saved using `save`."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(
+            results=[ScenarioResult(**result) for result in data["results"]],
+            environment=data.get("environment", {}),
+        )
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Return a percentile of values, interpolating between the closest ranks.
+
+    :param values: The values, not necessarily sorted
+    :param q: The percentile, between 0 and 100
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = (len(values) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def run_scenario(
+    scenario: Scenario,
+    corpus: CorpusGenerator,
+    repeat: int = 3,
+    warmup: int = 1,
+    measure_memory: bool = True,
+) -> ScenarioResult:
+    """
+    Run a scenario and measure its throughput, latency and memory.
+
+    Latency and throughput are measured without memory tracing,
+    which slows Python code down. Peak memory is measured in a separate pass.
+
+    :param scenario: The scenario to run
+    :param corpus: Generator of the scenario's inputs
+    :param repeat: Number of timed passes over the inputs
+    :param warmup: Number of inputs to process before measuring,
+    e.g. for lazy loading and caches
+    :param measure_memory: Whether to measure the peak memory
+    """
+    setup_start = time.perf_counter()
+    scenario.setup(corpus)
+    setup_seconds = time.perf_counter() - setup_start
+
+    for item in scenario.inputs[:warmup]:
+        scenario.run(item)
+
+    latencies = []
+    run_start = time.perf_counter()
+    for _ in range(repeat):
+        for item in scenario.inputs:
+            start = time.perf_counter()
+            scenario.run(item)
+            latencies.append(time.perf_counter() - start)
+    run_seconds = time.perf_counter() - run_start
+    total_bytes = repeat * sum(scenario.item_size(item) for item in scenario.inputs)
+
+    peak_memory = 0
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            for item in scenario.inputs:
+                scenario.run(item)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return ScenarioResult(
+        scenario=scenario.name,
+        items=len(latencies),
+        total_bytes=total_bytes,
+        items_per_second=len(latencies) / run_seconds,
+        mb_per_second=total_bytes / 1e6 / run_seconds,
+        p50_latency_ms=percentile(latencies, 50) * 1000,
+        p99_latency_ms=percentile(latencies, 99) * 1000,
+        peak_memory_mb=peak_memory / 1e6,
+        setup_seconds=setup_seconds,
+    )
+
+
+def run_benchmarks(
+    scenarios: List[Scenario],
+    seed: int = 42,
+    repeat: int = 3,
+    warmup: int = 1,
+    measure_memory: bool = True,
+) -> BenchmarkReport:
+    """
+    Run scenarios, skipping the ones which can't run in this environment.
+
+    :param scenarios: The scenarios to run
+    :param seed: Seed of the corpus generator, the same seed generates the same inputs
+    :param repeat: Number of timed passes over the inputs of each scenario
+    :param warmup: Number of inputs to process before measuring
+    :param measure_memory: Whether to measure the peak memory
+    """
+    results = []
+    for scenario in scenarios:
+        reason = scenario.unavailable_reason()
+        if reason:
+            logger.warning(f"Skipping {scenario.name}: {reason}")
+            continue
+        logger.info(f"Running {scenario.name}")
+        results.append(
+            run_scenario(
+                scenario,
+                CorpusGenerator(seed),
+                repeat=repeat,
+                warmup=warmup,
+                measure_memory=measure_memory,
+            )
+        )
+
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "seed": str(seed),
+    }
+    return BenchmarkReport(results=results, environment=environment)
+
+
+def compare_to_baseline(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    tolerance: float = 0.1,
+    metrics: Optional[List[str]] = None,
+) -> List[Regression]:
+    """
+    Return the metrics which regressed compared to a baseline report.
+
+    Scenarios missing from either report are ignored.
+
+    :param report: The current results
+    :param baseline: The baseline results
+    :param tolerance: Allowed relative change before a metric is considered
+    a regression (e.g. 0.1 for 10%)
+    :param metrics: Metrics to compare, defaults to all of COMPARED_METRICS
+    """
+    baseline_results = {result.scenario: result for result in baseline.results}
+    regressions = []
+    for result in report.results:
+        baseline_result = baseline_results.get(result.scenario)
+        if not baseline_result:
+            continue
+        for metric in metrics or COMPARED_METRICS:
+            higher_is_better = COMPARED_METRICS[metric]
+            baseline_value = getattr(baseline_result, metric)
+            current_value = getattr(result, metric)
+            if not baseline_value:
+                continue
+            change = (current_value - baseline_value) / baseline_value
+            if (higher_is_better and change < -tolerance) or (
+                not higher_is_better and change > tolerance
+            ):
+                regressions.append(
+                    Regression(
+                        scenario=result.scenario,
+                        metric=metric,
+                        baseline=baseline_value,
+                        current=current_value,
+                    )
+                )
+    return regressions
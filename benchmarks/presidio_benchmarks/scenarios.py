@@ -0,0 +1,497 @@
+import importlib.util
+import shutil
+import subprocess
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Dict, Iterable, Iterator, Tuple
+
+from presidio_benchmarks.corpus import CorpusGenerator
+
+TRANSFORMERS_MODEL = "elastic/distilbert-base-uncased-finetuned-conll03-english"
+
+
+class Scenario(ABC):
+    """
+    A benchmarked workload: a set of inputs and the operation run on each input.
+
+    Engines and inputs are created in `setup`, which is not measured.
+
+    :param name: Unique name of the scenario
+    :param description: Short description, shown when listing scenarios
+    :param slow: Whether the scenario takes minutes to run.
+    Slow scenarios only run when explicitly selected.
+    """
+
+    required_modules: Tuple[str, ...] = ()
+
+    def __init__(self, name: str, description: str, slow: bool = False):
+        self.name = name
+        self.description = description
+        self.slow = slow
+        self.inputs: List[Any] = []
+
+    def unavailable_reason(self) -> Optional[str]:
+        """Return why this scenario cannot run in this environment, if it can't."""
+        for module in self.required_modules:
+            if importlib.util.find_spec(module) is None:
+                return f"{module} is not installed"
+        return None
+
+    @abstractmethod
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Create the engines and the inputs of the scenario."""
+
+    @abstractmethod
+    def run(self, item: Any) -> None:
+        """Process a single input."""
+
+    def item_size(self, item: Any) -> int:
+        """Return the size of an input in bytes, used for computing throughput."""
+        return len(item.encode("utf-8"))
+
+
+class AnalyzeScenario(Scenario):
+    """
+    Run `AnalyzerEngine.analyze` on each text.
+
+    :param texts: Function generating the texts from a corpus generator
+    :param use_nlp: Whether to run the NLP engine (spaCy) and the NER recognizer.
+    If False, only the pattern based recognizers run.
+    :param nlp_configuration: NLP engine configuration (see NlpEngineProvider),
+    defaults to the default spaCy configuration
+    :param required_modules: Modules required in addition to presidio_analyzer,
+    e.g. by the NLP engine
+    """
+
+    required_modules = ("presidio_analyzer",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        texts,  # noqa ANN001
+        use_nlp: bool = True,
+        slow: bool = False,
+        nlp_configuration: Optional[Dict] = None,
+        required_modules: Tuple[str, ...] = (),
+    ):
+        super().__init__(name, description, slow=slow)
+        self.texts = texts
+        self.use_nlp = use_nlp
+        self.nlp_configuration = nlp_configuration
+        self.required_modules = AnalyzeScenario.required_modules + required_modules
+        self.analyzer = None
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Create the analyzer engine and the texts."""
+        self.analyzer = create_analyzer_engine(self.use_nlp, self.nlp_configuration)
+        self.inputs = self.texts(corpus)
+
+    def run(self, item: str) -> None:
+        """Analyze a text."""
+        self.analyzer.analyze(item, language="en")
+
+
+class BatchAnalyzeScenario(Scenario):
+    """
+    Run `BatchAnalyzerEngine` on tables (dictionaries of columns).
+
+    :param tables: Function generating the tables from a corpus generator
+    :param use_nlp: Whether to run the NLP engine (spaCy) and the NER recognizer
+    """
+
+    required_modules = ("presidio_analyzer",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        tables,  # noqa ANN001
+        use_nlp: bool = True,
+    ):
+        super().__init__(name, description)
+        self.tables = tables
+        self.use_nlp = use_nlp
+        self.batch_analyzer = None
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Create the batch analyzer engine and the tables."""
+        from presidio_analyzer import BatchAnalyzerEngine
+
+        self.batch_analyzer = BatchAnalyzerEngine(create_analyzer_engine(self.use_nlp))
+        self.inputs = self.tables(corpus)
+
+    def run(self, item: Dict[str, List[str]]) -> None:
+        """Analyze all the values of a table."""
+        for result in self.batch_analyzer.analyze_dict(item, language="en"):
+            _consume(result.recognizer_results)
+
+    def item_size(self, item: Dict[str, List[str]]) -> int:
+        """Return the total size of the table's values."""
+        return sum(len(v.encode("utf-8")) for values in item.values() for v in values)
+
+
+class ColumnAnalyzeScenario(BatchAnalyzeScenario):
+    """Run `BatchAnalyzerEngine.analyze_column` on each column of tables."""
+
+    def run(self, item: Dict[str, List[str]]) -> None:
+        """Analyze all the columns of a table."""
+        for values in item.values():
+            for _ in self.batch_analyzer.analyze_column(values, language="en"):
+                pass
+
+
+class RecognizerScenario(Scenario):
+    """
+    Run a single predefined recognizer on each text, without NLP artifacts.
+
+    :param recognizer: Class name of the recognizer, e.g. "IbanRecognizer"
+    :param texts: Function generating the texts from a corpus generator
+    """
+
+    required_modules = ("presidio_analyzer",)
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        recognizer: str,
+        texts,  # noqa ANN001
+    ):
+        super().__init__(name, description)
+        self.recognizer_name = recognizer
+        self.texts = texts
+        self.recognizer = None
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Create the recognizer and the texts."""
+        from presidio_analyzer import predefined_recognizers
+
+        self.recognizer = getattr(predefined_recognizers, self.recognizer_name)()
+        self.inputs = self.texts(corpus)
+
+    def run(self, item: str) -> None:
+        """Run the recognizer on a text."""
+        self.recognizer.analyze(item, entities=self.recognizer.supported_entities)
+
+
+class AnonymizeScenario(Scenario):
+    """
+    Run `AnonymizerEngine.anonymize` on PII dense documents with known PII spans.
+
+    :param paragraphs: Number of paragraphs per document (9 PII values each)
+    :param documents: Number of documents
+    """
+
+    required_modules = ("presidio_anonymizer",)
+
+    def __init__(
+        self, name: str, description: str, paragraphs: int, documents: int
+    ):
+        super().__init__(name, description)
+        self.paragraphs = paragraphs
+        self.documents = documents
+        self.anonymizer = None
+        self.operators = None
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Create the anonymizer engine, the documents and their PII spans."""
+        from presidio_anonymizer import AnonymizerEngine
+        from presidio_anonymizer.entities import OperatorConfig, RecognizerResult
+
+        self.anonymizer = AnonymizerEngine()
+        self.operators = {
+            "DEFAULT": OperatorConfig("replace"),
+            "PERSON": OperatorConfig("hash", {"hash_type": "sha256"}),
+            "CREDIT_CARD": OperatorConfig(
+                "mask", {"masking_char": "*", "chars_to_mask": 12, "from_end": False}
+            ),
+            "US_SSN": OperatorConfig("redact"),
+            "IBAN_CODE": OperatorConfig("encrypt", {"key": "WmZq4t7w!z%C&F)J"}),
+        }
+        self.inputs = []
+        for _ in range(self.documents):
+            text, spans = corpus.pii_dense_document(self.paragraphs)
+            results = [
+                RecognizerResult(entity_type=entity, start=start, end=end, score=0.9)
+                for entity, start, end in spans
+            ]
+            self.inputs.append((text, results))
+
+    def run(self, item: Tuple[str, List]) -> None:
+        """Anonymize a document."""
+        text, results = item
+        self.anonymizer.anonymize(
+            text=text, analyzer_results=results, operators=self.operators
+        )
+
+    def item_size(self, item: Tuple[str, List]) -> int:
+        """Return the size of the document."""
+        return len(item[0].encode("utf-8"))
+
+
+class ImageRedactScenario(Scenario):
+    """
+    Run `ImageRedactorEngine.redact` on synthetic scanned documents.
+
+    Requires Pillow, pytesseract and the tesseract binary.
+
+    :param images: Number of images
+    :param lines: Number of text lines in each image
+    """
+
+    required_modules = ("PIL", "pytesseract", "presidio_image_redactor")
+
+    def __init__(self, name: str, description: str, images: int, lines: int):
+        super().__init__(name, description)
+        self.images = images
+        self.lines = lines
+        self.redactor = None
+
+    def unavailable_reason(self) -> Optional[str]:
+        """Return why this scenario cannot run, also checking for tesseract."""
+        reason = super().unavailable_reason()
+        if not reason and shutil.which("tesseract") is None:
+            reason = "tesseract is not installed"
+        return reason
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Create the image redactor engine and the images."""
+        from presidio_image_redactor import ImageRedactorEngine
+
+        self.redactor = ImageRedactorEngine()
+        self.inputs = [
+            corpus.scanned_image(lines=self.lines) for _ in range(self.images)
+        ]
+
+    def run(self, item: "Image") -> None:  # noqa F821
+        """Redact an image."""
+        self.redactor.redact(item)
+
+    def item_size(self, item: "Image") -> int:  # noqa F821
+        """Return the size of the raw image in bytes."""
+        return len(item.tobytes())
+
+
+class ImportScenario(Scenario):
+    """
+    Import packages in a fresh interpreter, measuring cold start time.
+
+    Latency includes the interpreter startup, which is the same across runs.
+
+    :param modules: Modules to import, each one in a separate interpreter
+    :param imports: Number of imports of each module
+    """
+
+    def __init__(
+        self, name: str, description: str, modules: List[str], imports: int = 5
+    ):
+        super().__init__(name, description)
+        self.modules = modules
+        self.imports = imports
+
+    def unavailable_reason(self) -> Optional[str]:
+        """Return why this scenario cannot run, if any module is not installed."""
+        for module in self.modules:
+            if importlib.util.find_spec(module) is None:
+                return f"{module} is not installed"
+        return None
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        """Set the modules to import as inputs."""
+        self.inputs = self.modules * self.imports
+
+    def run(self, item: str) -> None:
+        """Import a module in a new interpreter."""
+        subprocess.run([sys.executable, "-c", f"import {item}"], check=True)
+
+    def item_size(self, item: str) -> int:
+        """Return 0, as imports have no input size."""
+        return 0
+
+
+def create_analyzer_engine(
+    use_nlp: bool = True, nlp_configuration: Optional[Dict] = None
+) -> "AnalyzerEngine":  # noqa F821
+    """
+    Create an English AnalyzerEngine.
+
+    :param use_nlp: Whether to use the default NLP engine (spaCy).
+    If False, the NLP engine is replaced by a no-op engine and the
+    NER recognizer is removed, leaving only pattern based recognizers.
+    :param nlp_configuration: Configuration of the NLP engine, if not the default
+    """
+    from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+    from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+    if use_nlp and nlp_configuration:
+        provider = NlpEngineProvider(nlp_configuration=nlp_configuration)
+        return AnalyzerEngine(nlp_engine=provider.create_engine())
+    if use_nlp:
+        return AnalyzerEngine()
+
+    nlp_engine = _create_no_op_nlp_engine()
+    registry = RecognizerRegistry()
+    registry.load_predefined_recognizers(nlp_engine=nlp_engine)
+    registry.remove_recognizer("SpacyRecognizer")
+    return AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+
+
+def _create_no_op_nlp_engine() -> "NlpEngine":  # noqa F821
+    from presidio_analyzer.nlp_engine import NlpEngine, NlpArtifacts
+
+    class NoOpNlpEngine(NlpEngine):
+        """NLP engine returning empty NLP artifacts, for isolating NLP costs."""
+
+        def process_text(self, text: str, language: str) -> NlpArtifacts:
+            return NlpArtifacts(
+                entities=[],
+                tokens=[],
+                tokens_indices=[],
+                lemmas=[],
+                nlp_engine=self,
+                language=language,
+            )
+
+        def process_batch(
+            self, texts: Iterable[str], language: str, **kwargs
+        ) -> Iterator[Tuple[str, NlpArtifacts]]:
+            for text in texts:
+                yield text, self.process_text(text, language)
+
+        def is_stopword(self, word: str, language: str) -> bool:
+            return False
+
+        def is_punct(self, word: str, language: str) -> bool:
+            return False
+
+    return NoOpNlpEngine()
+
+
+def _transformers_configuration(**options: Any) -> Dict:
+    """Return a configuration of the transformers NLP engine, see NlpEngineProvider."""
+    return {
+        "nlp_engine_name": "transformers",
+        "models": [
+            {
+                "lang_code": "en",
+                "model_name": {
+                    "spacy": "en_core_web_sm",
+                    "transformers": TRANSFORMERS_MODEL,
+                    **options,
+                },
+            }
+        ],
+    }
+
+
+def _consume(results: Any) -> None:
+    """Exhaust (possibly nested) lazy results, so that all the work is measured."""
+    if isinstance(results, (list, str)) or not hasattr(results, "__iter__"):
+        return
+    for result in results:
+        _consume(getattr(result, "recognizer_results", None))
+
+
+SCENARIOS: List[Scenario] = [
+    ImportScenario(
+        "import_analyzer",
+        "Cold import of presidio_analyzer in a new interpreter",
+        modules=["presidio_analyzer"],
+    ),
+    ImportScenario(
+        "import_anonymizer",
+        "Cold import of presidio_anonymizer in a new interpreter",
+        modules=["presidio_anonymizer"],
+    ),
+    AnalyzeScenario(
+        "analyzer_chat_nlp",
+        "Short chat messages, all recognizers including spaCy NER",
+        texts=lambda corpus: corpus.chat_messages(200),
+    ),
+    AnalyzeScenario(
+        "analyzer_chat_no_nlp",
+        "Short chat messages, pattern recognizers only",
+        texts=lambda corpus: corpus.chat_messages(200),
+        use_nlp=False,
+    ),
+    AnalyzeScenario(
+        "analyzer_log_100kb_no_nlp",
+        "100 KB application log, pattern recognizers only",
+        texts=lambda corpus: [corpus.log_text(100_000) for _ in range(3)],
+        use_nlp=False,
+    ),
+    AnalyzeScenario(
+        "analyzer_log_1mb_no_nlp",
+        "1 MB application log, pattern recognizers only",
+        texts=lambda corpus: [corpus.log_text(1_000_000)],
+        use_nlp=False,
+        slow=True,
+    ),
+    RecognizerScenario(
+        "recognizer_iban_financial",
+        "IbanRecognizer on bank statements with 2000 IBANs each",
+        recognizer="IbanRecognizer",
+        texts=lambda corpus: [corpus.financial_document(2000) for _ in range(3)],
+    ),
+    AnalyzeScenario(
+        "analyzer_csv_nlp",
+        "500 rows CSV table as a single text, all recognizers",
+        texts=lambda corpus: [corpus.csv_text(500) for _ in range(3)],
+    ),
+    BatchAnalyzeScenario(
+        "batch_analyzer_table_nlp",
+        "BatchAnalyzerEngine.analyze_dict on a 500 rows table",
+        tables=lambda corpus: [corpus.table(500) for _ in range(3)],
+    ),
+    BatchAnalyzeScenario(
+        "batch_analyzer_table_no_nlp",
+        "BatchAnalyzerEngine.analyze_dict on a 500 rows table, "
+        "pattern recognizers only",
+        tables=lambda corpus: [corpus.table(500) for _ in range(3)],
+        use_nlp=False,
+    ),
+    ColumnAnalyzeScenario(
+        "batch_analyzer_columns_no_nlp",
+        "BatchAnalyzerEngine.analyze_column on a 500 rows table, "
+        "pattern recognizers only",
+        tables=lambda corpus: [corpus.table(500) for _ in range(3)],
+        use_nlp=False,
+    ),
+    AnalyzeScenario(
+        "analyzer_chat_transformers_pytorch",
+        "Short chat messages, transformers NER model on PyTorch",
+        texts=lambda corpus: corpus.chat_messages(200),
+        nlp_configuration=_transformers_configuration(backend="pytorch"),
+        required_modules=("torch", "transformers"),
+        slow=True,
+    ),
+    AnalyzeScenario(
+        "analyzer_chat_transformers_onnx",
+        "Short chat messages, transformers NER model on ONNX Runtime",
+        texts=lambda corpus: corpus.chat_messages(200),
+        nlp_configuration=_transformers_configuration(backend="onnx"),
+        required_modules=("transformers", "onnxruntime", "optimum"),
+        slow=True,
+    ),
+    AnalyzeScenario(
+        "analyzer_chat_transformers_onnx_int8",
+        "Short chat messages, int8 quantized transformers NER model on ONNX Runtime",
+        texts=lambda corpus: corpus.chat_messages(200),
+        nlp_configuration=_transformers_configuration(backend="onnx", quantize=True),
+        required_modules=("transformers", "onnxruntime", "optimum"),
+        slow=True,
+    ),
+    AnonymizeScenario(
+        "anonymizer_dense",
+        "Anonymize documents with 900 PII entities each, mixed operators",
+        paragraphs=100,
+        documents=20,
+    ),
+    ImageRedactScenario(
+        "image_redactor_scanned",
+        "Redact synthetic scanned documents with 10 lines of text",
+        images=5,
+        lines=10,
+    ),
+]
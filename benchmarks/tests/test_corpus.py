@@ -0,0 +1,89 @@
+import re
+
+import pytest
+
+from presidio_benchmarks import CorpusGenerator
+
+
+def luhn_checksum(number: str) -> int:
+    digits = [int(d) for d in number]
+    total = sum(digits[-1::-2])
+    total += sum(sum(divmod(2 * d, 10)) for d in digits[-2::-2])
+    return total % 10
+
+
+def test_when_same_seed_then_same_corpus():
+    assert CorpusGenerator(seed=1).chat_messages(20) == CorpusGenerator(
+        seed=1
+    ).chat_messages(20)
+    assert CorpusGenerator(seed=1).chat_messages(20) != CorpusGenerator(
+        seed=2
+    ).chat_messages(20)
+
+
+def test_when_credit_card_then_luhn_checksum_is_valid():
+    corpus = CorpusGenerator()
+    for _ in range(100):
+        number = corpus.credit_card().replace("-", "")
+        assert len(number) == 16
+        assert luhn_checksum(number) == 0
+
+
+def test_when_iban_then_check_digits_are_valid():
+    corpus = CorpusGenerator()
+    for _ in range(100):
+        iban = corpus.iban_code()
+        rearranged = iban[4:] + iban[:4]
+        numeric = "".join(str(int(c, 36)) for c in rearranged)
+        assert int(numeric) % 97 == 1
+
+
+def test_when_fill_template_then_spans_point_to_values():
+    corpus = CorpusGenerator()
+    text, spans = corpus.fill_template("Call {PERSON} at {PHONE_NUMBER}.")
+
+    assert text.startswith("Call ")
+    assert [entity for entity, _, _ in spans] == ["PERSON", "PHONE_NUMBER"]
+    _, start, end = spans[1]
+    assert re.fullmatch(r"\(\d{3}\) \d{3}-\d{4}", text[start:end])
+
+
+def test_when_pii_dense_document_then_spans_are_shifted_per_paragraph():
+    corpus = CorpusGenerator()
+    text, spans = corpus.pii_dense_document(paragraphs=3)
+
+    assert len(spans) == 27
+    for entity, start, end in spans:
+        if entity == "EMAIL_ADDRESS":
+            assert "@" in text[start:end]
+
+
+@pytest.mark.parametrize("size", [1000, 100_000])
+def test_when_log_text_then_approximate_size(size):
+    text = CorpusGenerator().log_text(size)
+
+    assert size <= len(text) < size + 200
+    assert text.endswith("\n")
+
+
+def test_when_table_then_columns_have_same_length():
+    table = CorpusGenerator().table(rows=10)
+
+    assert set(table) >= {"name", "email", "phone", "ssn"}
+    assert all(len(values) == 10 for values in table.values())
+
+
+def test_when_csv_text_then_header_and_rows():
+    lines = CorpusGenerator().csv_text(rows=5).splitlines()
+
+    assert lines[0].startswith("name,email")
+    assert len(lines) == 6
+
+
+def test_when_financial_document_then_iban_on_each_line():
+    text = CorpusGenerator().financial_document(transactions=6)
+    lines = text.splitlines()
+
+    assert len(lines) == 6
+    assert all(" DE" in line for line in lines)
+    assert re.search(r"DE\d{2}( \d{4}){4} \d{2}", lines[0])
@@ -0,0 +1,142 @@
+from typing import Any
+
+import pytest
+
+from presidio_benchmarks import (
+    BenchmarkReport,
+    CorpusGenerator,
+    Scenario,
+    ScenarioResult,
+    compare_to_baseline,
+    run_benchmarks,
+    run_scenario,
+)
+from presidio_benchmarks.__main__ import main
+from presidio_benchmarks.runner import percentile
+
+
+class CountingScenario(Scenario):
+    def __init__(self, name="counting", required_modules=()):
+        super().__init__(name, "Counts processed items")
+        self.required_modules = required_modules
+        self.processed = 0
+
+    def setup(self, corpus: CorpusGenerator) -> None:
+        self.inputs = corpus.chat_messages(10)
+
+    def run(self, item: Any) -> None:
+        self.processed += 1
+
+
+def create_result(scenario="counting", **kwargs):
+    values = dict(
+        scenario=scenario,
+        items=10,
+        total_bytes=1000,
+        items_per_second=100.0,
+        mb_per_second=1.0,
+        p50_latency_ms=10.0,
+        p99_latency_ms=20.0,
+        peak_memory_mb=5.0,
+        setup_seconds=1.0,
+    )
+    values.update(kwargs)
+    return ScenarioResult(**values)
+
+
+@pytest.mark.parametrize(
+    "q, expected", [(0, 1), (50, 50.5), (99, 99.01), (100, 100)]
+)
+def test_when_percentile_then_interpolated(q, expected):
+    assert percentile(list(range(100, 0, -1)), q) == pytest.approx(expected)
+
+
+def test_when_run_scenario_then_all_inputs_measured():
+    scenario = CountingScenario()
+
+    result = run_scenario(scenario, CorpusGenerator(), repeat=3, warmup=2)
+
+    # warmup + timed repetitions + memory pass
+    assert scenario.processed == 2 + 30 + 10
+    assert result.items == 30
+    assert result.total_bytes == 3 * sum(len(i) for i in scenario.inputs)
+    assert result.items_per_second > 0
+    assert result.p99_latency_ms >= result.p50_latency_ms
+
+
+def test_when_scenario_unavailable_then_skipped():
+    available = CountingScenario("available")
+    unavailable = CountingScenario("unavailable", ("not_a_real_module",))
+
+    report = run_benchmarks([available, unavailable], repeat=1)
+
+    assert [result.scenario for result in report.results] == ["available"]
+
+
+def test_when_report_saved_then_loaded_back(tmp_path):
+    report = BenchmarkReport(results=[create_result()], environment={"seed": "42"})
+    path = str(tmp_path / "report.json")
+
+    report.save(path)
+
+    assert BenchmarkReport.load(path) == report
+
+
+def test_when_within_tolerance_then_no_regressions():
+    baseline = BenchmarkReport(results=[create_result()])
+    report = BenchmarkReport(
+        results=[create_result(items_per_second=95.0, p99_latency_ms=21.0)]
+    )
+
+    assert compare_to_baseline(report, baseline, tolerance=0.1) == []
+
+
+def test_when_worse_than_tolerance_then_regressions_returned():
+    baseline = BenchmarkReport(results=[create_result()])
+    report = BenchmarkReport(
+        results=[
+            create_result(items_per_second=80.0, p99_latency_ms=30.0),
+            create_result(scenario="new", items_per_second=1.0),
+        ]
+    )
+
+    regressions = compare_to_baseline(report, baseline, tolerance=0.1)
+
+    assert {r.metric for r in regressions} == {"items_per_second", "p99_latency_ms"}
+    assert all(r.scenario == "counting" for r in regressions)
+
+
+def test_when_improved_then_no_regressions():
+    baseline = BenchmarkReport(results=[create_result()])
+    report = BenchmarkReport(
+        results=[create_result(items_per_second=500.0, p50_latency_ms=1.0)]
+    )
+
+    assert compare_to_baseline(report, baseline) == []
+
+
+def test_when_cli_compares_to_baseline_then_exit_code_reflects_regressions(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        "presidio_benchmarks.__main__.SCENARIOS", [CountingScenario()]
+    )
+    output = str(tmp_path / "current.json")
+    assert main(["--repeat", "1", "--no-memory", "-o", output]) == 0
+
+    fast_baseline = str(tmp_path / "baseline.json")
+    BenchmarkReport(
+        results=[create_result(items_per_second=1e12, mb_per_second=1e12)]
+    ).save(fast_baseline)
+
+    assert main(["--repeat", "1", "--no-memory", "-b", output, "--tolerance", "100"]) == 0
+    assert (
+        main(
+            [
+                "--repeat", "1", "--no-memory",
+                "-b", fast_baseline,
+                "--metric", "items_per_second",
+            ]
+        )
+        == 1
+    )
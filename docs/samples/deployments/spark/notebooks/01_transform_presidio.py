@@ -22,9 +22,7 @@
 
 # COMMAND ----------
 
-from presidio_analyzer import AnalyzerEngine
-from presidio_anonymizer import AnonymizerEngine
-from presidio_anonymizer.entities import OperatorConfig
+from presidio_anonymizer.udf import EngineConfig, anonymize_series
 from pyspark.sql.types import StringType
 from pyspark.sql.functions import input_file_name, regexp_replace
 from pyspark.sql.functions import col, pandas_udf
@@ -77,33 +75,20 @@ display(input_df)
 
 # COMMAND ----------
 
-analyzer = AnalyzerEngine()
-anonymizer = AnonymizerEngine()
-broadcasted_analyzer = sc.broadcast(analyzer)
-broadcasted_anonymizer = sc.broadcast(anonymizer)
-
-# define a pandas UDF function and a series function over it.
-# Note that analyzer and anonymizer are broadcasted.
-
-
-def anonymize_text(text: str) -> str:
-    analyzer = broadcasted_analyzer.value
-    anonymizer = broadcasted_anonymizer.value
-    analyzer_results = analyzer.analyze(text=text, language="en")
-    anonymized_results = anonymizer.anonymize(
-        text=text,
-        analyzer_results=analyzer_results,
-        operators={"DEFAULT": OperatorConfig("replace", {"new_value": "<ANONYMIZED>"})},
-    )
-    return anonymized_results.text
+# Only this configuration is shipped to the workers. Each Python worker creates
+# its engines from it once, and analyzes each batch of rows as one NLP batch.
+engine_config = EngineConfig(
+    language="en",
+    operators={"DEFAULT": {"type": "replace", "new_value": "<ANONYMIZED>"}},
+)
 
 
-def anonymize_series(s: pd.Series) -> pd.Series:
-    return s.apply(anonymize_text)
+def anonymize_text_series(s: pd.Series) -> pd.Series:
+    return anonymize_series(s, engine_config)
 
 
 # define a the function as pandas UDF
-anonymize = pandas_udf(anonymize_series, returnType=StringType())
+anonymize = pandas_udf(anonymize_text_series, returnType=StringType())
 
 # apply the udf
 anonymized_df = input_df.withColumn(
@@ -4,16 +4,24 @@ import logging
 import os
 from logging.config import fileConfig
 from pathlib import Path
-from typing import Tuple
+from typing import List, Tuple, Optional
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, g
+from presidio_anonymizer.services.admission_controller import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
 from werkzeug.exceptions import HTTPException
 
 from presidio_analyzer.analyzer_engine import AnalyzerEngine
 from presidio_analyzer.analyzer_request import AnalyzerRequest
+from presidio_analyzer.app_tracer import AppTracer, OtlpHttpSpanExporter
+from presidio_analyzer.metrics import MultiprocessMetrics, metrics_registry
 
 DEFAULT_PORT = "3000"
 
+ADMISSION_CONTROLLED_ENDPOINTS = ("analyze",)
+
 LOGGING_CONF_FILE = "logging.ini"
 
 WELCOME_MESSAGE = r"""
@@ -32,19 +40,83 @@ class Server:
     """HTTP Server for calling Presidio Analyzer."""
 
     def __init__(self):
-        fileConfig(Path(Path(__file__).parent, LOGGING_CONF_FILE))
+        fileConfig(
+            Path(Path(__file__).parent, LOGGING_CONF_FILE),
+            disable_existing_loggers=False,
+        )
         self.logger = logging.getLogger("presidio-analyzer")
         self.logger.setLevel(os.environ.get("LOG_LEVEL", self.logger.level))
         self.app = Flask(__name__)
         self.logger.info("Starting analyzer engine")
-        self.engine = AnalyzerEngine()
+        self.engine = AnalyzerEngine(app_tracer=_create_app_tracer())
+        warm_up_languages = _get_warm_up_languages(self.engine)
+        if warm_up_languages:
+            self.logger.info(f"Warming up analyzer engine for {warm_up_languages}")
+            self.engine.warm_up(languages=warm_up_languages)
+        self.admission_controller = AdmissionController(
+            max_concurrent_requests=_get_env_int("MAX_CONCURRENT_REQUESTS"),
+            max_inflight_bytes=_get_env_int("MAX_INFLIGHT_BYTES"),
+            max_request_bytes=_get_env_int("MAX_REQUEST_BYTES"),
+            max_queue_size=_get_env_int("MAX_QUEUE_SIZE"),
+            queue_timeout=float(os.environ.get("QUEUE_TIMEOUT", "10")),
+            small_request_bytes=_get_env_int("SMALL_REQUEST_BYTES") or 0,
+        )
+        self.multiprocess_metrics = None
+        if os.environ.get("METRICS_MULTIPROC_DIR"):
+            self.multiprocess_metrics = MultiprocessMetrics(
+                metrics_registry, os.environ["METRICS_MULTIPROC_DIR"]
+            )
         self.logger.info(WELCOME_MESSAGE)
 
+        @self.app.before_request
+        def admit_request() -> None:
+            """Limit the in-flight work, rejecting requests when overloaded."""
+            if request.endpoint in ADMISSION_CONTROLLED_ENDPOINTS:
+                # None for chunked requests, rejected when a byte limit is set
+                size = request.content_length
+                self.admission_controller.acquire(size)
+                g.admitted_size = size or 0
+
+        @self.app.teardown_request
+        def release_request(exception: Optional[BaseException]) -> None:
+            """Release the capacity held by an admitted request, record metrics."""
+            size = g.pop("admitted_size", None)
+            if size is not None:
+                self.admission_controller.release(size)
+            if self.multiprocess_metrics:
+                self.multiprocess_metrics.write_snapshot()
+
         @self.app.route("/health")
         def health() -> str:
             """Return basic health probe result."""
             return "Presidio Analyzer service is up"
 
+        @self.app.route("/ready")
+        def ready() -> Tuple[str, int]:
+            """
+            Return readiness probe result, served once the engine is created.
+
+            Unless the NLP models are loaded lazily, they are loaded (and warmed up)
+            by then. Lazily loaded models are loaded by their language's first request,
+            loaded_languages lists the models currently in memory.
+            """
+            return (
+                jsonify(
+                    ready=True,
+                    languages=self.engine.supported_languages,
+                    loaded_languages=_get_loaded_languages(self.engine),
+                ),
+                200,
+            )
+
+        @self.app.route("/metrics")
+        def metrics() -> Response:
+            """Return the latency metrics in Prometheus format."""
+            exporter = self.multiprocess_metrics or metrics_registry
+            return Response(
+                exporter.to_prometheus(), mimetype="text/plain; version=0.0.4"
+            )
+
         @self.app.route("/analyze", methods=["POST"])
         def analyze() -> Tuple[str, int]:
             """Execute the analyzer function."""
@@ -120,11 +192,73 @@ class Server:
                 )
                 return jsonify(error=e.args[0]), 500
 
+        @self.app.errorhandler(AdmissionRejectedError)
+        def admission_rejected(e):
+            response = jsonify(error=e.message)
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, e.status_code
+
         @self.app.errorhandler(HTTPException)
         def http_exception(e):
             return jsonify(error=e.description), e.code
 
 
+def _create_app_tracer() -> AppTracer:
+    """Create an AppTracer exporting spans to an OTLP collector, if configured."""
+    endpoint = os.environ.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+    return AppTracer(
+        sample_rate=float(os.environ.get("TRACE_SAMPLE_RATE", "1")),
+        exporter=OtlpHttpSpanExporter(endpoint=endpoint) if endpoint else None,
+    )
+
+
+def _get_warm_up_languages(engine: AnalyzerEngine) -> List[str]:
+    """
+    Return the languages to warm up, according to the WARM_UP environment variable.
+
+    When the NLP models are loaded lazily, warming up is off by default,
+    and is limited to the first max_loaded_models languages, so that it
+    doesn't load models which would be evicted right away.
+    """
+    nlp_engine = engine.nlp_engine
+    lazy_load = getattr(nlp_engine, "lazy_load", False)
+    default = "false" if lazy_load else "true"
+    if os.environ.get("WARM_UP", default).lower() != "true":
+        return []
+
+    languages = list(engine.supported_languages)
+    models = getattr(nlp_engine, "nlp", None)
+    max_loaded_models = getattr(models, "max_loaded_models", None)
+    if lazy_load and max_loaded_models is not None:
+        languages = languages[:max_loaded_models]
+    return languages
+
+
+def _get_loaded_languages(engine: AnalyzerEngine) -> List[str]:
+    """Return the languages whose NLP model is in memory."""
+    models = getattr(engine.nlp_engine, "nlp", None)
+    if hasattr(models, "loaded_languages"):
+        return models.loaded_languages
+    return list(engine.supported_languages)
+
+
+def _get_env_int(name: str) -> Optional[int]:
+    """Return an integer environment variable, or None if it is not set."""
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+def create_app() -> Flask:
+    """
+    Create the analyzer WSGI application.
+
+    Used by production WSGI servers, for example:
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+    """
+    server = Server()
+    return server.app
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", DEFAULT_PORT))
     server = Server()
@@ -6,6 +6,7 @@ from presidio_analyzer.pattern import Pattern
 from presidio_analyzer.analysis_explanation import AnalysisExplanation
 from presidio_analyzer.recognizer_result import RecognizerResult
 from presidio_analyzer.dict_analyzer_result import DictAnalyzerResult
+from presidio_analyzer.column_profile import ColumnProfile
 from presidio_analyzer.entity_recognizer import EntityRecognizer
 from presidio_analyzer.local_recognizer import LocalRecognizer
 from presidio_analyzer.pattern_recognizer import PatternRecognizer
@@ -13,6 +14,11 @@ from presidio_analyzer.remote_recognizer import RemoteRecognizer
 from presidio_analyzer.recognizer_registry import RecognizerRegistry
 from presidio_analyzer.analyzer_engine import AnalyzerEngine
 from presidio_analyzer.batch_analyzer_engine import BatchAnalyzerEngine
+from presidio_analyzer.streaming_analyzer import StreamingAnalyzer
+from presidio_analyzer.incremental_analyzer import (
+    AnalysisSnapshot,
+    IncrementalAnalyzer,
+)
 from presidio_analyzer.analyzer_request import AnalyzerRequest
 from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
 from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
@@ -39,6 +45,7 @@ __all__ = [
     "AnalysisExplanation",
     "RecognizerResult",
     "DictAnalyzerResult",
+    "ColumnProfile",
     "EntityRecognizer",
     "LocalRecognizer",
     "PatternRecognizer",
@@ -49,4 +56,7 @@ __all__ = [
     "ContextAwareEnhancer",
     "LemmaContextAwareEnhancer",
     "BatchAnalyzerEngine",
+    "StreamingAnalyzer",
+    "AnalysisSnapshot",
+    "IncrementalAnalyzer",
 ]
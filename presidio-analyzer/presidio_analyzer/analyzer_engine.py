@@ -1,21 +1,41 @@
 import json
 import logging
-from typing import List, Optional
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Dict, Iterable
 
 from presidio_analyzer import (
     RecognizerRegistry,
     RecognizerResult,
     EntityRecognizer,
+    PatternRecognizer,
 )
 from presidio_analyzer.app_tracer import AppTracer
 from presidio_analyzer.context_aware_enhancers import (
     ContextAwareEnhancer,
     LemmaContextAwareEnhancer,
 )
+from presidio_analyzer.engine_spec import (
+    get_cached_engine,
+    nlp_engine_to_configuration,
+    recognizer_from_spec,
+    recognizer_to_spec,
+)
+from presidio_analyzer.metrics import metrics_registry
 from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider, NlpArtifacts
+from presidio_analyzer.text_chunking import split_text
+from presidio_analyzer.text_prefilter import TextPrefilter
 
 logger = logging.getLogger("presidio-analyzer")
 
+WARM_UP_TEXT = (
+    "My name is John Smith, I live in Seattle. Call me at 212-555-5555 "
+    "or email john.smith@example.com before 01/02/2023."
+)
+
 
 class AnalyzerEngine:
     """
@@ -69,11 +89,19 @@ class AnalyzerEngine:
         self.nlp_engine = nlp_engine
         self.registry = registry
 
-        # load all recognizers
+        # load all recognizers, or only on first use of each language
+        # if the NLP engine loads its models lazily
         if not registry.recognizers:
-            registry.load_predefined_recognizers(
-                nlp_engine=self.nlp_engine, languages=self.supported_languages
-            )
+            if getattr(self.nlp_engine, "lazy_load", False):
+                registry.load_predefined_recognizers(
+                    nlp_engine=self.nlp_engine,
+                    languages=self.supported_languages,
+                    lazy=True,
+                )
+            else:
+                registry.load_predefined_recognizers(
+                    nlp_engine=self.nlp_engine, languages=self.supported_languages
+                )
 
         self.log_decision_process = log_decision_process
         self.default_score_threshold = default_score_threshold
@@ -86,6 +114,58 @@ class AnalyzerEngine:
             context_aware_enhancer = LemmaContextAwareEnhancer()
 
         self.context_aware_enhancer = context_aware_enhancer
+        self._recognizer_load_lock = threading.Lock()
+
+    def warm_up(
+        self,
+        languages: Optional[List[str]] = None,
+        sample_texts: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, float]:
+        """
+        Load and prepare everything needed for serving requests.
+
+        Loads all recognizers and NLP models, compiles the regexes of all patterns
+        and analyzes sample texts, so that the first requests are not slower
+        than the rest.
+
+        :param languages: Languages to warm up, defaults to all supported languages
+        :param sample_texts: Texts to analyze per language,
+        a short text with common entities is used for languages not in it
+        :return: The warm up duration in seconds per language
+        """
+        languages = languages if languages else self.supported_languages
+        sample_texts = sample_texts if sample_texts else {}
+        durations = {}
+        for language in languages:
+            start_time = time.perf_counter()
+            recognizers = self.registry.get_recognizers(
+                language=language, all_fields=True
+            )
+            for recognizer in recognizers:
+                self._load_recognizer(recognizer)
+                if isinstance(recognizer, PatternRecognizer):
+                    recognizer.compile_patterns()
+
+            for text in sample_texts.get(language, [WARM_UP_TEXT]):
+                self.analyze(text=text, language=language)
+
+            durations[language] = time.perf_counter() - start_time
+            metrics_registry.observe(
+                "warm_up_duration_seconds", durations[language], language=language
+            )
+            logger.info(
+                f"Warmed up language {language} in {durations[language]:.2f} seconds"
+            )
+        return durations
+
+    def _load_recognizer(self, recognizer: EntityRecognizer) -> None:
+        """Load a recognizer if not loaded, ensuring it is only loaded once."""
+        if recognizer.is_loaded:
+            return
+        with self._recognizer_load_lock:
+            if not recognizer.is_loaded:
+                recognizer.load()
+                recognizer.is_loaded = True
 
     def get_recognizers(self, language: Optional[str] = None) -> List[EntityRecognizer]:
         """
@@ -122,6 +202,82 @@ class AnalyzerEngine:
 
         return list(set(supported_entities))
 
+    def to_spec(self) -> Dict:
+        """
+        Describe this engine by a small, JSON serializable dictionary.
+
+        The spec holds the NLP engine's configuration, the registry's recognizers
+        (by class and constructor arguments), the context enhancer's parameters
+        and the thresholds, instead of loaded models and compiled state.
+        It is cheap to send to worker processes or cluster executors,
+        which create the engine with `from_spec`.
+        The app tracer isn't part of the spec.
+
+        :return: The engine's spec
+        """
+        enhancer = self.context_aware_enhancer
+        if type(enhancer) is not LemmaContextAwareEnhancer:
+            raise ValueError(
+                f"Context enhancer {type(enhancer).__name__} "
+                "can't be described by a spec"
+            )
+        # Predefined recognizers of lazily loaded languages are described
+        # by their language, so they are only created on first use
+        lazy_languages = self.registry.get_lazy_languages()
+        return {
+            "supported_languages": list(self.supported_languages),
+            "default_score_threshold": self.default_score_threshold,
+            "log_decision_process": self.log_decision_process,
+            "nlp_configuration": nlp_engine_to_configuration(self.nlp_engine),
+            "recognizers": [
+                recognizer_to_spec(recognizer)
+                for recognizer in self.registry.recognizers
+            ],
+            "lazy_languages": lazy_languages,
+            "context_aware_enhancer": {
+                "context_similarity_factor": enhancer.context_similarity_factor,
+                "min_score_with_context_similarity": (
+                    enhancer.min_score_with_context_similarity
+                ),
+                "context_prefix_count": enhancer.context_prefix_count,
+                "context_suffix_count": enhancer.context_suffix_count,
+            },
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict, use_cache: bool = True) -> "AnalyzerEngine":
+        """
+        Create an engine from its description by `to_spec`.
+
+        :param spec: The engine's spec
+        :param use_cache: Whether to return the engine already created
+        in this process for an equal spec, creating it only on first use
+        :return: The engine
+        """
+        if use_cache:
+            return get_cached_engine(spec, partial(cls.from_spec, use_cache=False))
+
+        nlp_engine = NlpEngineProvider(
+            nlp_configuration=spec["nlp_configuration"]
+        ).create_engine()
+        registry = RecognizerRegistry(
+            [recognizer_from_spec(recognizer) for recognizer in spec["recognizers"]]
+        )
+        if spec.get("lazy_languages"):
+            registry.load_predefined_recognizers(
+                languages=spec["lazy_languages"], nlp_engine=nlp_engine, lazy=True
+            )
+        return cls(
+            registry=registry,
+            nlp_engine=nlp_engine,
+            log_decision_process=spec.get("log_decision_process", False),
+            default_score_threshold=spec.get("default_score_threshold", 0),
+            supported_languages=spec["supported_languages"],
+            context_aware_enhancer=LemmaContextAwareEnhancer(
+                **spec.get("context_aware_enhancer", {})
+            ),
+        )
+
     def analyze(
         self,
         text: str,
@@ -169,67 +325,113 @@ class AnalyzerEngine:
         >>> print(results)
         [type: PHONE_NUMBER, start: 19, end: 31, score: 0.85]
         """
+        analyze_start_time = time.perf_counter()
         all_fields = not entities
 
-        recognizers = self.registry.get_recognizers(
-            language=language,
-            entities=entities,
-            all_fields=all_fields,
-            ad_hoc_recognizers=ad_hoc_recognizers,
-        )
-
-        if all_fields:
-            # Since all_fields=True, list all entities by iterating
-            # over all recognizers
-            entities = self.get_supported_entities(language=language)
-
-        # run the nlp pipeline over the given text, store the results in
-        # a NlpArtifacts instance
-        if not nlp_artifacts:
-            nlp_artifacts = self.nlp_engine.process_text(text, language)
-
-        if self.log_decision_process:
-            self.app_tracer.trace(
-                correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
+        with self.app_tracer.span(
+            "analyze", correlation_id=correlation_id, language=language
+        ) as analyze_span:
+            recognizers = self.registry.get_recognizers(
+                language=language,
+                entities=entities,
+                all_fields=all_fields,
+                ad_hoc_recognizers=ad_hoc_recognizers,
             )
 
-        results = []
-        for recognizer in recognizers:
-            # Lazy loading of the relevant recognizers
-            if not recognizer.is_loaded:
-                recognizer.load()
-                recognizer.is_loaded = True
-
-            # analyze using the current recognizer and append the results
-            current_results = recognizer.analyze(
-                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            if all_fields:
+                # Since all_fields=True, list all entities by iterating
+                # over all recognizers
+                entities = self.get_supported_entities(language=language)
+
+            # run the nlp pipeline over the given text, store the results in
+            # a NlpArtifacts instance
+            if not nlp_artifacts:
+                with self.app_tracer.span("nlp") as span:
+                    nlp_artifacts = self.nlp_engine.process_text(text, language)
+                    span.set_attribute("tokens", len(nlp_artifacts.tokens))
+
+            # Serializing the nlp artifacts is expensive,
+            # so it's only done for sampled requests
+            log_decision_process = (
+                self.log_decision_process and self.app_tracer.is_sampled(correlation_id)
             )
-            if current_results:
-                # add recognizer name to recognition metadata inside results
-                # if not exists
-                self.__add_recognizer_id_if_not_exists(current_results, recognizer)
-                results.extend(current_results)
-
-        results = self._enhance_using_context(
-            text, results, nlp_artifacts, recognizers, context
+            if log_decision_process:
+                self.app_tracer.trace(
+                    correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
+                )
+
+            results = []
+            # Pattern prefilters are checked once for all recognizers
+            with TextPrefilter.scope(text):
+                for recognizer in recognizers:
+                    # Lazy loading of the relevant recognizers
+                    self._load_recognizer(recognizer)
+
+                    # analyze using the current recognizer and append the results
+                    with self.app_tracer.span(
+                        "recognizer", recognizer=recognizer.name
+                    ) as span:
+                        with metrics_registry.timer(
+                            "recognizer_duration_seconds",
+                            recognizer=recognizer.name,
+                            language=language,
+                        ):
+                            current_results = recognizer.analyze(
+                                text=text,
+                                entities=entities,
+                                nlp_artifacts=nlp_artifacts,
+                            )
+                        span.set_attribute(
+                            "results", len(current_results) if current_results else 0
+                        )
+                    if current_results:
+                        # add recognizer name to recognition metadata inside results
+                        # if not exists
+                        self.__add_recognizer_id_if_not_exists(
+                            current_results, recognizer
+                        )
+                        results.extend(current_results)
+
+            with self.app_tracer.span("context_enhancement") as span:
+                with metrics_registry.timer(
+                    "context_enhancement_duration_seconds", language=language
+                ):
+                    results = self._enhance_using_context(
+                        text, results, nlp_artifacts, recognizers, context
+                    )
+                span.set_attribute("results", len(results))
+
+            if log_decision_process:
+                self.app_tracer.trace(
+                    correlation_id,
+                    json.dumps([str(result.to_dict()) for result in results]),
+                )
+
+            # Remove duplicates or low score results
+            with self.app_tracer.span(
+                "deduplication", input_results=len(results)
+            ) as span:
+                with metrics_registry.timer("deduplication_duration_seconds"):
+                    results = EntityRecognizer.remove_duplicates(results)
+                span.set_attribute("results", len(results))
+
+            with self.app_tracer.span("threshold", input_results=len(results)) as span:
+                results = self.__remove_low_scores(results, score_threshold)
+                span.set_attribute("results", len(results))
+
+            if allow_list:
+                results = self._remove_allow_list(results, allow_list, text)
+
+            if not return_decision_process:
+                results = self.__remove_decision_process(results)
+
+            analyze_span.set_attribute("results", len(results))
+
+        metrics_registry.observe(
+            "analyze_duration_seconds",
+            time.perf_counter() - analyze_start_time,
+            language=language,
         )
-
-        if self.log_decision_process:
-            self.app_tracer.trace(
-                correlation_id,
-                json.dumps([str(result.to_dict()) for result in results]),
-            )
-
-        # Remove duplicates or low score results
-        results = EntityRecognizer.remove_duplicates(results)
-        results = self.__remove_low_scores(results, score_threshold)
-
-        if allow_list:
-            results = self._remove_allow_list(results, allow_list, text)
-
-        if not return_decision_process:
-            results = self.__remove_decision_process(results)
-
         return results
 
     def _enhance_using_context(
@@ -330,6 +532,81 @@ class AnalyzerEngine:
 
         return new_results
 
+    def analyze_long_text(
+        self,
+        text: str,
+        language: str,
+        chunk_size: int = 100000,
+        chunk_overlap: int = 500,
+        n_process: int = 1,
+        **kwargs,
+    ) -> List[RecognizerResult]:
+        """
+        Find PII entities in a long text, analyzing it in chunks.
+
+        The text is split into overlapping chunks on paragraph or sentence
+        boundaries, and each chunk is analyzed separately, so that memory
+        is bounded by the chunk size and texts longer than the NLP model's
+        maximum length can be analyzed. Result offsets are relative
+        to the full text. Entities found by two chunks (in their overlap)
+        are only returned once.
+
+        Context words are only looked for within an entity's chunk.
+
+        :param text: the text to analyze
+        :param language: the language of the text
+        :param chunk_size: Maximum length of a chunk in characters
+        :param chunk_overlap: Number of characters shared by consecutive chunks.
+        Entities longer than half of it might be missed at chunk boundaries.
+        :param n_process: Number of processes analyzing chunks in parallel.
+        Worker processes are forked, sharing this engine's loaded models.
+        Where fork isn't available, threads are used instead.
+        :param kwargs: Additional parameters for `analyze`
+        :return: an array of the found entities in the text
+        """
+        chunks = split_text(text, chunk_size=chunk_size, overlap=chunk_overlap)
+        chunk_texts = [text[chunk.start : chunk.end] for chunk in chunks]
+        if n_process > 1 and len(chunks) > 1:
+            chunk_results = self._analyze_chunks_in_parallel(
+                chunk_texts, language, n_process, kwargs
+            )
+        else:
+            chunk_results = (
+                self.analyze(text=chunk_text, language=language, **kwargs)
+                for chunk_text in chunk_texts
+            )
+
+        results = []
+        for chunk, results_in_chunk in zip(chunks, chunk_results):
+            for result in results_in_chunk:
+                result.start += chunk.start
+                result.end += chunk.start
+                if chunk.own_start <= result.start < chunk.own_end:
+                    results.append(result)
+        return results
+
+    def _analyze_chunks_in_parallel(
+        self, chunk_texts: List[str], language: str, n_process: int, kwargs: Dict
+    ) -> Iterable[List[RecognizerResult]]:
+        if "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit this engine, no need to pickle it
+            executor = ProcessPoolExecutor(
+                max_workers=n_process,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_set_chunk_analyzer,
+                initargs=(self,),
+            )
+            analyze = _analyze_chunk
+        else:
+            logger.warning("fork is not available, analyzing chunks using threads")
+            executor = ThreadPoolExecutor(max_workers=n_process)
+            analyze = self.analyze
+
+        with executor:
+            return list(
+                executor.map(partial(analyze, language=language, **kwargs), chunk_texts)
+            )
+
     @staticmethod
     def __add_recognizer_id_if_not_exists(
         results: List[RecognizerResult], recognizer: EntityRecognizer
@@ -368,3 +645,16 @@ class AnalyzerEngine:
             result.analysis_explanation = None
 
         return results
+
+
+# The analyzer engine of a process analyzing chunks of a long text
+_chunk_analyzer: Optional[AnalyzerEngine] = None
+
+
+def _set_chunk_analyzer(analyzer: AnalyzerEngine) -> None:
+    global _chunk_analyzer
+    _chunk_analyzer = analyzer
+
+
+def _analyze_chunk(text: str, **kwargs) -> List[RecognizerResult]:
+    return _chunk_analyzer.analyze(text=text, **kwargs)
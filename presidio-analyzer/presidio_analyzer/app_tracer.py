@@ -1,4 +1,241 @@
+import json
 import logging
+import os
+import random
+import time
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Iterator, Union
+
+AttributeValue = Union[str, int, float, bool]
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class Span:
+    """
+    A timed operation within a traced request.
+
+    :param name: Name of the operation
+    :param trace_id: Hex ID shared by all spans of the same request
+    :param parent_span_id: Hex ID of the enclosing span (None for the root span)
+    :param attributes: Initial attributes of the span
+    """
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str] = None,
+        attributes: Optional[Dict[str, AttributeValue]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.error: Optional[str] = None
+        self._trace_spans: List["Span"] = []
+
+    @property
+    def is_recording(self) -> bool:
+        """Return whether this span is recorded and exported."""
+        return True
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return the duration of the span in seconds, if ended."""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Set an attribute (e.g. a result count) on the span."""
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        """Mark the span as ended."""
+        self.end_time = time.time_ns()
+
+    def to_dict(self) -> Dict:
+        """Return a dictionary representation of the span."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the span."""
+        return f"Span(name={self.name}, duration={self.duration})"
+
+
+class _NonRecordingSpan(Span):
+    """A span of a request which is not traced. All operations are no-ops."""
+
+    def __init__(self):  # noqa
+        self.name = ""
+        self.attributes = {}
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "presidio_current_span", default=None
+)
+
+
+class SpanExporter(ABC):
+    """Export the spans of traced requests to a tracing backend."""
+
+    @abstractmethod
+    def export(self, spans: List[Span]) -> None:
+        """
+        Export the finished spans of a single request.
+
+        :param spans: The spans of the request, the root span last
+        """
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    Keep exported spans in memory, for tests and debugging.
+
+    :param max_spans: Maximum number of spans to keep, oldest are dropped first
+    """
+
+    def __init__(self, max_spans: int = 10000):
+        self.max_spans = max_spans
+        self._spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        """Store the spans in memory."""
+        self._spans.extend(spans)
+        del self._spans[: -self.max_spans]
+
+    def get_finished_spans(self) -> List[Span]:
+        """Return the exported spans."""
+        return list(self._spans)
+
+    def clear(self) -> None:
+        """Remove all exported spans."""
+        self._spans.clear()
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Send spans to an OpenTelemetry collector using OTLP over HTTP with JSON encoding.
+
+    Spans are sent synchronously when a traced request ends,
+    so a low sample rate is recommended in production.
+    Export errors are logged and do not fail the request.
+
+    :param endpoint: The OTLP traces endpoint of the collector
+    :param service_name: Value of the service.name resource attribute
+    :param headers: Additional HTTP headers (e.g. for authentication)
+    :param timeout: Request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        service_name: str = "presidio-analyzer",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def export(self, spans: List[Span]) -> None:
+        """Send the spans to the collector."""
+        import urllib.request
+
+        data = json.dumps(self.to_otlp_json(spans)).encode("utf-8")
+        request = urllib.request.Request(
+            self.endpoint,
+            data=data,
+            headers={"Content-Type": "application/json", **self.headers},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except Exception as e:
+            logger.warning(f"Failed to export {len(spans)} spans: {e}")
+
+    def to_otlp_json(self, spans: List[Span]) -> Dict:
+        """Return the OTLP/JSON representation of the spans."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": self._to_otlp_attributes(
+                            {"service.name": self.service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "presidio-analyzer"},
+                            "spans": [self._to_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    @classmethod
+    def _to_otlp_span(cls, span: Span) -> Dict:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_time),
+            "endTimeUnixNano": str(span.end_time),
+            "attributes": cls._to_otlp_attributes(span.attributes),
+        }
+        if span.parent_span_id:
+            otlp_span["parentSpanId"] = span.parent_span_id
+        if span.error:
+            otlp_span["status"] = {"code": 2, "message": span.error}
+        return otlp_span
+
+    @staticmethod
+    def _to_otlp_attributes(attributes: Dict[str, AttributeValue]) -> List[Dict]:
+        otlp_attributes = []
+        for key, value in attributes.items():
+            if isinstance(value, bool):
+                otlp_value = {"boolValue": value}
+            elif isinstance(value, int):
+                otlp_value = {"intValue": str(value)}
+            elif isinstance(value, float):
+                otlp_value = {"doubleValue": value}
+            else:
+                otlp_value = {"stringValue": str(value)}
+            otlp_attributes.append({"key": key, "value": otlp_value})
+        return otlp_attributes
 
 
 class AppTracer:
@@ -8,12 +245,32 @@ class AppTracer:
     Relevant in cases where we want to know which modules were used for detection,
     which logic was utilized, what results were given and potentially why.
     This can be useful for analyzing the detection accuracy of the system.
+
+    In addition to the decision process log, the tracer records timed spans
+    for each stage of a request when a span exporter is provided.
+    Only a sample of the requests is traced when sample_rate is lower than 1.
+    The sampling decision is derived from the request's correlation_id,
+    so the same request is consistently sampled (or not) across services.
     :param enabled: Whether tracing should be activated.
+    :param sample_rate: Fraction of requests to trace, between 0 and 1.
+    :param exporter: SpanExporter receiving the spans of each traced request.
+    Spans are not recorded if None.
     """
 
-    def __init__(self, enabled: bool = True):
+    # Defaults for subclasses which don't call this class's __init__
+    sample_rate: float = 1.0
+    exporter: Optional[SpanExporter] = None
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        exporter: Optional[SpanExporter] = None,
+    ):
         self.logger = logging.getLogger("decision_process")
         self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.exporter = exporter
 
     def trace(self, request_id: str, trace_data: str) -> None:
         """
@@ -25,3 +282,79 @@ class AppTracer:
         """
         if self.enabled:
             self.logger.info("[%s][%s]", request_id, trace_data)
+
+    def is_sampled(self, correlation_id: Optional[str] = None) -> bool:
+        """
+        Return whether a request should be traced.
+
+        :param correlation_id: The request's correlation ID. Requests without one
+        are sampled randomly.
+        """
+        if self.sample_rate >= 1:
+            return True
+        if self.sample_rate <= 0:
+            return False
+        if correlation_id:
+            bucket = zlib.crc32(correlation_id.encode("utf-8")) / 2**32
+        else:
+            bucket = random.random()
+        return bucket < self.sample_rate
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        correlation_id: Optional[str] = None,
+        **attributes: AttributeValue,
+    ) -> Iterator[Span]:
+        """
+        Record a span for the managed block.
+
+        The span is a child of the currently active span, if any.
+        Otherwise, it starts a new trace which is exported once the span ends.
+        Spans of requests which are not sampled are not recorded,
+        use `span.is_recording` to avoid computing expensive attributes for them.
+
+        :param name: Name of the span
+        :param correlation_id: The request's correlation ID, used for sampling
+        when starting a new trace
+        :param attributes: Initial attributes of the span
+        :return: The span, for setting additional attributes
+        """
+        parent = _current_span.get()
+        if parent is None:
+            if (
+                self.exporter is not None
+                and self.enabled
+                and self.is_sampled(correlation_id)
+            ):
+                span = Span(name, trace_id=os.urandom(16).hex(), attributes=attributes)
+                if correlation_id:
+                    span.set_attribute("presidio.correlation_id", correlation_id)
+            else:
+                span = NON_RECORDING_SPAN
+        elif parent.is_recording:
+            span = Span(
+                name,
+                trace_id=parent.trace_id,
+                parent_span_id=parent.span_id,
+                attributes=attributes,
+            )
+            span._trace_spans = parent._trace_spans
+        else:
+            span = NON_RECORDING_SPAN
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            if span.is_recording:
+                span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            if span.is_recording:
+                span.end()
+                span._trace_spans.append(span)
+                if parent is None:
+                    self.exporter.export(span._trace_spans)
@@ -1,7 +1,22 @@
 import logging
+import random
+from contextlib import ExitStack, contextmanager
+from itertools import islice
 from typing import List, Iterable, Dict, Union, Any, Optional, Iterator, Tuple
 
-from presidio_analyzer import DictAnalyzerResult, RecognizerResult, AnalyzerEngine
+from presidio_analyzer import (
+    DictAnalyzerResult,
+    RecognizerResult,
+    AnalyzerEngine,
+    EntityRecognizer,
+    PatternRecognizer,
+)
+from presidio_analyzer.column_profile import (
+    ColumnProfile,
+    get_sample_size,
+    get_wilson_lower_bound,
+    get_z_score,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -39,7 +54,7 @@ class BatchAnalyzerEngine:
         """
 
         # validate types
-        texts = self._validate_types(texts)
+        texts = [str(text) for text in self._validate_types(texts)]
 
         # Process the texts as batch for improved performance
         nlp_artifacts_batch: Iterator[
@@ -49,15 +64,122 @@ class BatchAnalyzerEngine:
         )
 
         list_results = []
-        for text, nlp_artifacts in nlp_artifacts_batch:
-            results = self.analyzer_engine.analyze(
-                text=str(text), nlp_artifacts=nlp_artifacts, language=language, **kwargs
-            )
+        with self._pattern_batch_scope(texts, language=language, **kwargs):
+            for text, nlp_artifacts in nlp_artifacts_batch:
+                results = self.analyzer_engine.analyze(
+                    text=str(text),
+                    nlp_artifacts=nlp_artifacts,
+                    language=language,
+                    **kwargs,
+                )
 
-            list_results.append(results)
+                list_results.append(results)
 
         return list_results
 
+    @contextmanager
+    def _pattern_batch_scope(
+        self,
+        texts: List[str],
+        language: str,
+        entities: Optional[List[str]] = None,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        **kwargs,
+    ) -> Iterator[None]:
+        """
+        Match the patterns of the pattern recognizers in all the texts at once.
+
+        Each pattern's matches in the texts are validated together
+        (see `PatternRecognizer.batch_scope`), instead of value by value.
+        """
+        with ExitStack() as stack:
+            if texts:
+                recognizers = self.analyzer_engine.registry.get_recognizers(
+                    language=language,
+                    entities=entities,
+                    all_fields=not entities,
+                    ad_hoc_recognizers=ad_hoc_recognizers,
+                )
+                for recognizer in recognizers:
+                    if isinstance(recognizer, PatternRecognizer):
+                        stack.enter_context(recognizer.batch_scope(texts))
+            yield
+
+    def analyze_column(
+        self,
+        column: Iterable[Union[str, bool, float, int, None]],
+        language: str,
+        batch_size: int = 10000,
+        max_cached_values: int = 100000,
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """
+        Analyze a column of values, analyzing each distinct value once.
+
+        The column is read in batches of rows. The distinct values of a batch
+        which weren't analyzed before are analyzed together, and their results
+        are yielded for every row holding them. Results are kept for up to
+        max_cached_values distinct values, so that values repeated across
+        batches (e.g. cities or statuses) are analyzed once.
+        For columns with more distinct values, the additional values
+        are only deduplicated within their batch.
+
+        Rows holding the same value share the same results list.
+        Missing values (None or NaN) get empty results.
+
+        :param column: The column's values, as a list, a pandas Series,
+        a NumPy array or a PyArrow Array or ChunkedArray
+        :param language: Input language
+        :param batch_size: Number of rows read at once
+        :param max_cached_values: Maximum number of distinct values
+        whose results are kept between batches
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        :return: The results of each row, in the column's order
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size should be a positive number")
+
+        cached_results: Dict[str, List[RecognizerResult]] = {}
+        analyzed_count = 0
+        row_count = 0
+        for batch in self._iterate_column_batches(column, batch_size):
+            texts = [
+                None if value is None or value != value else str(value)
+                for value in self._validate_types(batch)
+            ]
+            new_texts = list(
+                dict.fromkeys(
+                    text
+                    for text in texts
+                    if text is not None and text not in cached_results
+                )
+            )
+            batch_results = dict(
+                zip(
+                    new_texts,
+                    self.analyze_iterator(new_texts, language=language, **kwargs),
+                )
+            )
+            for text in new_texts:
+                if len(cached_results) >= max_cached_values:
+                    break
+                cached_results[text] = batch_results[text]
+
+            for text in texts:
+                if text is None:
+                    yield []
+                elif text in batch_results:
+                    yield batch_results[text]
+                else:
+                    yield cached_results[text]
+            analyzed_count += len(new_texts)
+            row_count += len(texts)
+
+        logger.debug(
+            f"Analyzed {analyzed_count} distinct values for a column of "
+            f"{row_count} rows"
+        )
+
     def analyze_dict(
         self,
         input_dict: Dict[str, Union[Any, Iterable[Any]]],
@@ -69,6 +191,9 @@ class BatchAnalyzerEngine:
         Analyze a dictionary of keys (strings) and values/iterable of values.
 
         Non-string values are returned as is.
+        All the values, including values of nested dictionaries and of lists,
+        are processed by the NLP engine as a single batch. Each value is then
+        analyzed with the path of keys leading to it as context.
 
         :param input_dict: The input dictionary for analysis
         :param language: Input language
@@ -80,17 +205,90 @@ class BatchAnalyzerEngine:
         See `AnalyzerEngine.analyze` for the full list.
         """
 
-        context = []
-        if "context" in kwargs:
-            context = kwargs["context"]
-            del kwargs["context"]
+        context = kwargs.pop("context", [])
+        leaves: List[Tuple[str, List[str]]] = []
+        tree = self._flatten_dict(input_dict, keys_to_skip or [], context, leaves)
+        leaf_results = self._analyze_leaves(leaves, language=language, **kwargs)
+        yield from self._assemble_dict(tree, leaf_results)
+
+    def analyze_records(
+        self,
+        records: Iterable[Dict[str, Any]],
+        language: str,
+        batch_size: int = 100,
+        keys_to_skip: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Iterator[List[DictAnalyzerResult]]:
+        """
+        Analyze a stream of records (dictionaries), e.g. parsed JSON lines.
+
+        Records are read in windows of batch_size records. The values of
+        a window are grouped by key path, so that values of the same field
+        are processed together, and processed by the NLP engine as one batch.
+        Results are yielded per record, in the input order.
+
+        :param records: The records to analyze
+        :param language: Input language
+        :param batch_size: Number of records analyzed together
+        :param keys_to_skip: Keys to ignore during analysis
+        :param kwargs: Additional keyword arguments
+        for the `AnalyzerEngine.analyze` method.
+        :return: For each record, the results `analyze_dict` returns for it
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size should be a positive number")
+
+        context = kwargs.pop("context", [])
+        iterator = iter(records)
+        window = list(islice(iterator, batch_size))
+        while window:
+            leaves: List[Tuple[str, List[str]]] = []
+            trees = []
+            for record in window:
+                if not isinstance(record, dict):
+                    raise ValueError(
+                        f"Records should be dictionaries, got {type(record)}"
+                    )
+                trees.append(
+                    self._flatten_dict(record, keys_to_skip or [], context, leaves)
+                )
+
+            # Order the values by key path, keeping the first appearance order
+            key_paths: Dict[Tuple[str, ...], List[int]] = {}
+            for i, (_, leaf_context) in enumerate(leaves):
+                key_paths.setdefault(tuple(leaf_context), []).append(i)
+            order = [i for indices in key_paths.values() for i in indices]
+            ordered_results = self._analyze_leaves(
+                [leaves[i] for i in order], language=language, **kwargs
+            )
+            leaf_results: List[List[RecognizerResult]] = [[]] * len(leaves)
+            for i, results in zip(order, ordered_results):
+                leaf_results[i] = results
+
+            for tree in trees:
+                yield list(self._assemble_dict(tree, leaf_results))
+            window = list(islice(iterator, batch_size))
 
-        if not keys_to_skip:
-            keys_to_skip = []
+    def _flatten_dict(
+        self,
+        input_dict: Dict[str, Any],
+        keys_to_skip: List[str],
+        context: List[str],
+        leaves: List[Tuple[str, List[str]]],
+    ) -> List[Tuple[str, Any, Any]]:
+        """
+        Collect the values of a (nested) dictionary to analyze.
 
+        :param leaves: List to which (text, context) tuples are appended,
+        for every value to analyze
+        :return: A tree of (key, value, leaf index) tuples, where the leaf index
+        is an index in leaves (or a list of indices for iterable values,
+        a nested tree for dictionaries, None for values which aren't analyzed)
+        """
+        tree = []
         for key, value in input_dict.items():
             if not value or key in keys_to_skip:
-                yield DictAnalyzerResult(key=key, value=value, recognizer_results=[])
+                tree.append((key, value, None))
                 continue  # skip this key as requested
 
             # Add the key as an additional context
@@ -98,32 +296,285 @@ class BatchAnalyzerEngine:
             specific_context.append(key)
 
             if type(value) in (str, int, bool, float):
-                results: List[RecognizerResult] = self.analyzer_engine.analyze(
-                    text=str(value), language=language, context=[key], **kwargs
-                )
+                tree.append((key, value, len(leaves)))
+                leaves.append((str(value), specific_context))
             elif isinstance(value, dict):
                 new_keys_to_skip = self._get_nested_keys_to_skip(key, keys_to_skip)
-                results = self.analyze_dict(
-                    input_dict=value,
-                    language=language,
-                    context=specific_context,
-                    keys_to_skip=new_keys_to_skip,
-                    **kwargs,
+                subtree = self._flatten_dict(
+                    value, new_keys_to_skip, specific_context, leaves
                 )
+                tree.append((key, value, subtree))
             elif isinstance(value, Iterable):
-                # Recursively iterate nested dicts
+                indices = []
+                for text in self._validate_types(value):
+                    indices.append(len(leaves))
+                    leaves.append((str(text), specific_context))
+                tree.append((key, value, indices))
+            else:
+                raise ValueError(f"type {type(value)} is unsupported.")
+        return tree
 
-                results: List[List[RecognizerResult]] = self.analyze_iterator(
-                    texts=value,
+    def _analyze_leaves(
+        self, leaves: List[Tuple[str, List[str]]], language: str, **kwargs
+    ) -> List[List[RecognizerResult]]:
+        """Analyze texts with their own context, running the NLP engine once."""
+        texts = [text for text, _ in leaves]
+        nlp_artifacts_batch = self.analyzer_engine.nlp_engine.process_batch(
+            texts=texts, language=language
+        )
+        with self._pattern_batch_scope(texts, language=language, **kwargs):
+            return [
+                self.analyzer_engine.analyze(
+                    text=text,
+                    nlp_artifacts=nlp_artifacts,
                     language=language,
-                    context=specific_context,
+                    context=context,
                     **kwargs,
                 )
-            else:
-                raise ValueError(f"type {type(value)} is unsupported.")
+                for (text, context), (_, nlp_artifacts) in zip(
+                    leaves, nlp_artifacts_batch
+                )
+            ]
 
+    @staticmethod
+    def _assemble_dict(
+        tree: List[Tuple[str, Any, Any]], leaf_results: List[List[RecognizerResult]]
+    ) -> Iterator[DictAnalyzerResult]:
+        """Rebuild the DictAnalyzerResult tree from the results of the values."""
+        for key, value, leaf in tree:
+            if leaf is None:
+                results = []
+            elif isinstance(leaf, int):
+                results = leaf_results[leaf]
+            elif isinstance(value, dict):
+                results = BatchAnalyzerEngine._assemble_dict(leaf, leaf_results)
+            else:
+                results = [leaf_results[index] for index in leaf]
             yield DictAnalyzerResult(key=key, value=value, recognizer_results=results)
 
+    def profile_dict(
+        self,
+        input_dict: Dict[str, Iterable[Any]],
+        language: str,
+        sample_size: Optional[int] = None,
+        confidence_level: float = 0.95,
+        margin_of_error: float = 0.05,
+        min_fraction: float = 0.5,
+        keys_to_skip: Optional[List[str]] = None,
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, ColumnProfile]:
+        """
+        Find which columns of a table hold PII, analyzing a random sample of rows.
+
+        The sample size is computed from the number of rows, so that the
+        fraction of values holding each entity type is estimated within
+        margin_of_error at the confidence level (385 rows for large tables
+        at the default parameters). A column's entity type is set if
+        its values consist of a single entity in at least min_fraction
+        of the rows, at the confidence level.
+
+        :param input_dict: The table, as a dictionary of columns
+        (lists, pandas Series, NumPy or PyArrow arrays), or a pandas DataFrame
+        :param language: Input language
+        :param sample_size: Number of rows to analyze per column,
+        computed from the confidence level and margin of error if None
+        :param confidence_level: Confidence level of the estimations
+        :param margin_of_error: Margin of error of the estimated fractions
+        :param min_fraction: Minimum fraction of values consisting of an entity
+        for the column to be classified as this entity type
+        :param keys_to_skip: Columns to ignore
+        :param seed: Seed of the random sampling, for reproducible profiles
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        :return: The profile of each column
+        """
+        keys_to_skip = keys_to_skip or []
+        context = kwargs.pop("context", [])
+        z = get_z_score(confidence_level)
+        rng = random.Random(seed)
+        profiles = {}
+        for key, column in input_dict.items():
+            if key in keys_to_skip:
+                continue
+            column = self._to_column(key, column)
+            row_count = len(column)
+            size = sample_size or get_sample_size(
+                row_count, confidence_level, margin_of_error
+            )
+            indices = sorted(rng.sample(range(row_count), min(size, row_count)))
+            values = self._take(column, indices)
+            column_results = self.analyze_column(
+                values, language=language, context=context + [key], **kwargs
+            )
+
+            found = {}
+            whole_values = {}
+            value_count = 0
+            for value, results in zip(values, column_results):
+                if value is None or value != value:
+                    continue
+                value_count += 1
+                text = str(value).strip()
+                for entity_type in {result.entity_type for result in results}:
+                    found[entity_type] = found.get(entity_type, 0) + 1
+                    if self._is_whole_value(text, results, entity_type):
+                        whole_values[entity_type] = (
+                            whole_values.get(entity_type, 0) + 1
+                        )
+
+            profile = ColumnProfile(
+                key=key,
+                row_count=row_count,
+                sample_size=len(indices),
+                entity_fractions={
+                    entity_type: count / value_count
+                    for entity_type, count in found.items()
+                },
+            )
+            if whole_values:
+                # Ties are broken by entity type, for deterministic profiles
+                entity_type, count = max(
+                    whole_values.items(), key=lambda item: (item[1], item[0])
+                )
+                confidence = get_wilson_lower_bound(count, value_count, z)
+                if confidence >= min_fraction:
+                    profile.entity_type = entity_type
+                    profile.confidence = confidence
+            profiles[key] = profile
+            logger.debug(f"Profiled column {key}: {profile}")
+        return profiles
+
+    def analyze_dict_with_profiles(
+        self,
+        input_dict: Dict[str, Iterable[Any]],
+        profiles: Dict[str, ColumnProfile],
+        language: str,
+        **kwargs,
+    ) -> Iterator[DictAnalyzerResult]:
+        """
+        Analyze a table according to its profile, without analyzing every value.
+
+        - Values of columns with an entity type are returned as entities
+        of this type, spanning the whole value, with the profile's confidence
+        as score.
+        - Columns where the sample held no PII are not analyzed.
+        - Other columns, holding PII within longer texts,
+        are analyzed with `analyze_column`.
+
+        The results can be anonymized with `BatchAnonymizerEngine.anonymize_dict`.
+
+        :param input_dict: The table, as a dictionary of columns
+        :param profiles: The profiles of the columns, from `profile_dict`.
+        Columns without a profile are returned without results.
+        :param language: Input language
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        """
+        context = kwargs.pop("context", [])
+        for key, value in input_dict.items():
+            values = self._take(self._to_column(key, value))
+            profile = profiles.get(key)
+            if profile is None or not profile.has_pii:
+                results = [[] for _ in values]
+            elif profile.entity_type:
+                results = [
+                    []
+                    if value is None or value != value
+                    else [
+                        RecognizerResult(
+                            entity_type=profile.entity_type,
+                            start=0,
+                            end=len(str(value)),
+                            score=profile.confidence,
+                        )
+                    ]
+                    for value in values
+                ]
+            else:
+                results = list(
+                    self.analyze_column(
+                        values, language=language, context=context + [key], **kwargs
+                    )
+                )
+            if type(value) in (str, int, bool, float):
+                yield DictAnalyzerResult(
+                    key=key, value=value, recognizer_results=results[0]
+                )
+            else:
+                yield DictAnalyzerResult(
+                    key=key, value=values, recognizer_results=results
+                )
+
+    @staticmethod
+    def _to_column(key: str, value: Any) -> Any:
+        """Return a table's value as a column, single values as one row columns."""
+        if isinstance(value, dict):
+            raise ValueError(
+                "Table profiling expects a dictionary of columns, "
+                f"key {key} holds a nested dictionary"
+            )
+        if type(value) in (str, int, bool, float):
+            return [value]
+        return value
+
+    @staticmethod
+    def _is_whole_value(
+        text: str, results: List[RecognizerResult], entity_type: str
+    ) -> bool:
+        """Return whether entities of a type cover (almost) all of a value."""
+        covered = 0
+        covered_end = 0
+        spans = sorted(
+            (result.start, result.end)
+            for result in results
+            if result.entity_type == entity_type
+        )
+        for start, end in spans:
+            covered += max(end - max(start, covered_end), 0)
+            covered_end = max(covered_end, end)
+        return covered >= 0.9 * len(text)
+
+    @staticmethod
+    def _take(column: Any, indices: Optional[List[int]] = None) -> List[Any]:
+        """Return the Python values of a column's rows, all rows if indices is None."""
+        if hasattr(column, "to_pylist") and hasattr(column, "take"):
+            # PyArrow Array or ChunkedArray
+            values = column if indices is None else column.take(indices)
+            return values.to_pylist()
+        if hasattr(column, "iloc"):
+            # pandas Series, with missing values (e.g. pd.NA) as None
+            values = column if indices is None else column.iloc[indices]
+            return values.astype(object).where(values.notna(), None).tolist()
+        if hasattr(column, "tolist"):
+            # NumPy array
+            values = column if indices is None else column[indices]
+            return values.tolist()
+        if indices is None:
+            return list(column)
+        return [column[i] for i in indices]
+
+    @staticmethod
+    def _iterate_column_batches(column: Any, batch_size: int) -> Iterator[List[Any]]:
+        """Read a column in batches of Python values."""
+        if hasattr(column, "to_pylist") and hasattr(column, "slice"):
+            # PyArrow Array or ChunkedArray
+            for start in range(0, len(column), batch_size):
+                yield column.slice(start, batch_size).to_pylist()
+        elif hasattr(column, "iloc"):
+            # pandas Series, with missing values (e.g. pd.NA) as None
+            for start in range(0, len(column), batch_size):
+                values = column.iloc[start : start + batch_size]
+                yield values.astype(object).where(values.notna(), None).tolist()
+        elif hasattr(column, "tolist"):
+            # NumPy array
+            for start in range(0, len(column), batch_size):
+                yield column[start : start + batch_size].tolist()
+        else:
+            iterator = iter(column)
+            batch = list(islice(iterator, batch_size))
+            while batch:
+                yield batch
+                batch = list(islice(iterator, batch_size))
+
     @staticmethod
     def _validate_types(value_iterator: Iterable[Any]) -> Iterator[Any]:
         for val in value_iterator:
@@ -0,0 +1,80 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ColumnProfile:
+    """
+    Data class for holding the PII profile of a table column, based on a sample.
+
+    :param key: The column's key in the table
+    :param row_count: Number of rows in the column
+    :param sample_size: Number of sampled rows which were analyzed
+    :param entity_fractions: For each entity type found in the sample,
+    the fraction of sampled values (excluding missing ones) holding it
+    :param entity_type: The entity type the column's values consist of,
+    if most values are a single entity (e.g. a column of email addresses).
+    None if the column holds no PII or holds it within longer texts.
+    :param confidence: Lower bound of the fraction of the column's values
+    consisting of entity_type, at the profiling confidence level
+    """
+
+    key: str
+    row_count: int
+    sample_size: int
+    entity_fractions: Dict[str, float] = field(default_factory=dict)
+    entity_type: Optional[str] = None
+    confidence: float = 0.0
+
+    @property
+    def has_pii(self) -> bool:
+        """Return whether PII was found in the sampled values."""
+        return bool(self.entity_fractions)
+
+
+def get_sample_size(
+    row_count: int, confidence_level: float = 0.95, margin_of_error: float = 0.05
+) -> int:
+    """
+    Return the number of rows to sample for estimating a fraction of the rows.
+
+    Uses Cochran's formula for a proportion, with the finite population
+    correction, e.g. 385 rows for large tables at the default parameters.
+
+    :param row_count: Number of rows in the table
+    :param confidence_level: Confidence level of the estimation
+    :param margin_of_error: Maximum difference between the estimated
+    and actual fractions, at the confidence level
+    """
+    if not 0 < confidence_level < 1 or not 0 < margin_of_error < 1:
+        raise ValueError("confidence_level and margin_of_error should be in (0, 1)")
+    z = get_z_score(confidence_level)
+    sample_size = z * z * 0.25 / (margin_of_error * margin_of_error)
+    sample_size = sample_size / (1 + (sample_size - 1) / max(row_count, 1))
+    return min(math.ceil(sample_size), row_count)
+
+
+def get_z_score(confidence_level: float) -> float:
+    """Return the two-sided critical value of the standard normal distribution."""
+    low, high = 0.0, 10.0
+    for _ in range(60):
+        middle = (low + high) / 2
+        if math.erf(middle / math.sqrt(2)) < confidence_level:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def get_wilson_lower_bound(successes: int, trials: int, z: float) -> float:
+    """Return the lower bound of the Wilson score interval of a fraction."""
+    if trials == 0:
+        return 0.0
+    fraction = successes / trials
+    denominator = 1 + z * z / trials
+    center = fraction + z * z / (2 * trials)
+    spread = z * math.sqrt(
+        fraction * (1 - fraction) / trials + z * z / (4 * trials * trials)
+    )
+    return max((center - spread) / denominator, 0.0)
@@ -0,0 +1,184 @@
+"""Declarative, JSON serializable descriptions of engines and their parts."""
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, TypeVar
+
+from presidio_analyzer import EntityRecognizer, Pattern
+from presidio_analyzer.nlp_engine import NlpEngine
+
+logger = logging.getLogger("presidio-analyzer")
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+# Engines created from specs in this process, by spec hash
+_engines_by_hash: Dict[str, Any] = {}
+_engines_lock = threading.Lock()
+
+
+def get_spec_hash(spec: Dict) -> str:
+    """Return a hash identifying a spec, equal for equal specs."""
+    serialized = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_cached_engine(spec: Dict, create: Callable[[Dict], T]) -> T:
+    """
+    Return this process's engine of a spec, creating it on first use.
+
+    :param spec: The engine's spec
+    :param create: Function creating an engine from the spec
+    """
+    spec_hash = get_spec_hash(spec)
+    engine = _engines_by_hash.get(spec_hash)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines_by_hash.get(spec_hash)
+            if engine is None:
+                logger.info(f"Creating engine of spec {spec_hash[:12]}")
+                engine = create(spec)
+                _engines_by_hash[spec_hash] = engine
+    return engine
+
+
+def nlp_engine_to_configuration(nlp_engine: NlpEngine) -> Dict:
+    """
+    Return the `NlpEngineProvider` configuration creating an equivalent NLP engine.
+
+    :param nlp_engine: A spaCy, stanza or transformers NLP engine
+    """
+    model_names = getattr(getattr(nlp_engine, "nlp", None), "model_names", None)
+    engine_name = getattr(nlp_engine, "engine_name", None)
+    if model_names is None or engine_name is None:
+        raise ValueError(
+            f"NLP engine {type(nlp_engine).__name__} can't be described by a spec"
+        )
+    return {
+        "nlp_engine_name": engine_name,
+        "models": [
+            {"lang_code": language, "model_name": model_name}
+            for language, model_name in model_names.items()
+        ],
+        "lazy_load": nlp_engine.lazy_load,
+        "max_loaded_models": nlp_engine.nlp.max_loaded_models,
+    }
+
+
+def recognizer_to_spec(recognizer: EntityRecognizer) -> Dict:
+    """
+    Describe a recognizer by its class and constructor arguments.
+
+    Arguments are taken from the recognizer's attributes named
+    as the constructor's parameters. Attributes which aren't JSON serializable
+    are left out if they are equal to those of a recognizer created from the spec,
+    i.e. they have their default value.
+
+    :param recognizer: The recognizer to describe
+    :return: A dictionary with the recognizer's "class" and "arguments"
+    :raises ValueError: if the recognizer can't be created again from the spec
+    """
+    recognizer_class = type(recognizer)
+    if "<locals>" in recognizer_class.__qualname__:
+        raise ValueError(
+            f"Recognizer {recognizer.name} should be of a class defined "
+            "at the top level of a module to be described by a spec"
+        )
+
+    arguments = {}
+    left_out = []
+    for name in _get_constructor_parameters(recognizer_class):
+        value = _get_constructor_argument(recognizer, name)
+        if value is _MISSING:
+            continue
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            left_out.append(name)
+            continue
+        arguments[name] = value
+
+    spec = {
+        "class": f"{recognizer_class.__module__}.{recognizer_class.__qualname__}",
+        "arguments": arguments,
+    }
+    if left_out:
+        _check_left_out_arguments(recognizer, spec, left_out)
+    return spec
+
+
+def recognizer_from_spec(spec: Dict) -> EntityRecognizer:
+    """
+    Create a recognizer from its description by `recognizer_to_spec`.
+
+    :param spec: The recognizer's spec
+    """
+    module_name, _, class_name = spec["class"].rpartition(".")
+    recognizer_class = getattr(importlib.import_module(module_name), class_name)
+    if not issubclass(recognizer_class, EntityRecognizer):
+        raise ValueError(f"{spec['class']} is not an EntityRecognizer")
+
+    arguments = dict(spec.get("arguments", {}))
+    if "patterns" in arguments:
+        # A new list, as recognizers add their deny list's pattern to it
+        arguments["patterns"] = [
+            Pattern.from_dict(pattern) for pattern in arguments["patterns"]
+        ]
+    return recognizer_class(**arguments)
+
+
+def _check_left_out_arguments(
+    recognizer: EntityRecognizer, spec: Dict, names: List[str]
+) -> None:
+    """Raise if the arguments left out of a spec differ from their defaults."""
+    try:
+        created = recognizer_from_spec(spec)
+    except Exception as e:
+        raise ValueError(
+            f"Recognizer {recognizer.name} can't be created from its spec "
+            f"without arguments {names}: {e}"
+        ) from e
+    for name in names:
+        if _get_constructor_argument(created, name) != _get_constructor_argument(
+            recognizer, name
+        ):
+            raise ValueError(
+                f"Argument {name} of recognizer {recognizer.name} "
+                "isn't JSON serializable, and differs from its default"
+            )
+
+
+def _get_constructor_parameters(recognizer_class: type) -> List[str]:
+    """Return the constructor's parameters, including those passed as **kwargs."""
+    names = []
+    for cls in recognizer_class.__mro__:
+        if "__init__" not in cls.__dict__:
+            continue
+        has_kwargs = False
+        for name, parameter in inspect.signature(cls.__init__).parameters.items():
+            if parameter.kind == parameter.VAR_KEYWORD:
+                has_kwargs = True
+            elif name != "self" and parameter.kind != parameter.VAR_POSITIONAL:
+                if name not in names:
+                    names.append(name)
+        if not has_kwargs:
+            break
+    return names
+
+
+def _get_constructor_argument(recognizer: EntityRecognizer, name: str) -> Any:
+    if name == "supported_entity":
+        return recognizer.supported_entities[0]
+    if name == "patterns":
+        # The deny list's pattern is created by the constructor
+        deny_list = getattr(recognizer, "deny_list", None)
+        return [
+            pattern.to_dict()
+            for pattern in getattr(recognizer, "patterns", [])
+            if not (deny_list and pattern.name == "deny_list")
+        ]
+    return getattr(recognizer, name, _MISSING)
@@ -0,0 +1,315 @@
+import bisect
+import copy
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+
+from presidio_analyzer import AnalyzerEngine, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.text_chunking import SENTENCE_BOUNDARY
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class AnalysisSnapshot(NamedTuple):
+    """
+    A previous analysis of a document, used for re-analyzing it after edits.
+
+    :param text: The analyzed text
+    :param results: The results of the analysis
+    :param nlp_artifacts: The NLP artifacts of the text. Without them,
+    the next analysis analyzes the whole text.
+    """
+
+    text: str
+    results: List[RecognizerResult]
+    nlp_artifacts: Optional[NlpArtifacts] = None
+
+
+class IncrementalAnalyzer:
+    """
+    Re-analyze documents after edits, only analyzing the edited region.
+
+    The edited region is found by comparing the new text with the previous one
+    (or given explicitly by `apply_edit`). The NLP engine and recognizers run on
+    the edited region with margins of max_entity_length + context_length
+    characters on each side, extended to whole sentences, and results away from
+    the edit are taken from the previous analysis, shifted by the edit's change
+    in length. The NLP artifacts of the other sentences are reused as well.
+
+    The results match a full re-analysis as long as entities are shorter than
+    max_entity_length, recognizers only look at context_length characters
+    around an entity and NER predictions only depend on their sentence.
+
+    :param analyzer_engine: AnalyzerEngine instance to use, a default one if None
+    :param language: Language of the documents
+    :param max_entity_length: Length in characters of the longest expected entity
+    :param context_length: Number of characters around an entity
+    in which context words are looked for
+    :param kwargs: Additional parameters for `AnalyzerEngine.analyze`
+    """
+
+    def __init__(
+        self,
+        analyzer_engine: Optional[AnalyzerEngine] = None,
+        language: str = "en",
+        max_entity_length: int = 256,
+        context_length: int = 100,
+        **kwargs,
+    ):
+        if max_entity_length < 1:
+            raise ValueError("max_entity_length should be a positive number")
+        if context_length < 0:
+            raise ValueError("context_length should not be negative")
+        self.analyzer_engine = analyzer_engine or AnalyzerEngine()
+        self.language = language
+        self.max_entity_length = max_entity_length
+        self.context_length = context_length
+        self.analyze_kwargs = kwargs
+
+    def analyze(
+        self, text: str, previous: Optional[AnalysisSnapshot] = None
+    ) -> AnalysisSnapshot:
+        """
+        Analyze a text, reusing the analysis of its previous version.
+
+        :param text: The text to analyze
+        :param previous: The analysis of the previous version of the text.
+        The whole text is analyzed if None.
+        :return: The analysis of the text, to pass to the next call
+        """
+        if previous is None:
+            nlp_artifacts = self.analyzer_engine.nlp_engine.process_text(
+                text, self.language
+            )
+            results = self.analyzer_engine.analyze(
+                text=text,
+                language=self.language,
+                nlp_artifacts=nlp_artifacts,
+                **self.analyze_kwargs,
+            )
+            return AnalysisSnapshot(text, results, nlp_artifacts)
+
+        edit_start, old_edit_end, new_edit_end = _find_edited_region(
+            previous.text, text
+        )
+        return self._reanalyze(previous, text, edit_start, old_edit_end, new_edit_end)
+
+    def apply_edit(
+        self, previous: AnalysisSnapshot, start: int, end: int, replacement: str
+    ) -> AnalysisSnapshot:
+        """
+        Replace a part of a previously analyzed text and re-analyze it.
+
+        :param previous: The analysis of the text before the edit
+        :param start: Start offset of the replaced part
+        :param end: End offset of the replaced part
+        :param replacement: The new text of the replaced part
+        :return: The analysis of the edited text
+        """
+        if not 0 <= start <= end <= len(previous.text):
+            raise ValueError("start and end should be offsets in the previous text")
+        text = previous.text[:start] + replacement + previous.text[end:]
+        return self._reanalyze(previous, text, start, end, start + len(replacement))
+
+    def _reanalyze(
+        self,
+        previous: AnalysisSnapshot,
+        text: str,
+        edit_start: int,
+        old_edit_end: int,
+        new_edit_end: int,
+    ) -> AnalysisSnapshot:
+        if text == previous.text:
+            return AnalysisSnapshot(
+                text, copy.deepcopy(previous.results), previous.nlp_artifacts
+            )
+        if previous.nlp_artifacts is None:
+            return self.analyze(text)
+
+        # Results within margin characters of the edit, or in the sentences
+        # around it (as NER predictions depend on the whole sentence) could
+        # change. They are taken from an analysis of a window wide enough
+        # to contain them along with their context, the others from the
+        # previous analysis.
+        margin = self.max_entity_length + self.context_length
+        shift = new_edit_end - old_edit_end
+        changed_start, old_changed_end = _find_sentences(
+            previous,
+            max(edit_start - margin, 0),
+            min(old_edit_end + margin, len(previous.text)),
+        )
+        changed_end = old_changed_end + shift
+        window_start, old_window_end = _get_window(
+            previous,
+            max(changed_start - margin, 0),
+            min(old_changed_end + margin, len(previous.text)),
+        )
+        window_end = old_window_end + shift
+        if window_end - window_start >= len(text):
+            return self.analyze(text)
+
+        results = []
+        for result in previous.results:
+            if result.end <= changed_start:
+                results.append(copy.deepcopy(result))
+            elif result.start >= old_changed_end:
+                result = copy.deepcopy(result)
+                result.start += shift
+                result.end += shift
+                results.append(result)
+
+        window_text = text[window_start:window_end]
+        window_artifacts = self.analyzer_engine.nlp_engine.process_text(
+            window_text, self.language
+        )
+        window_results = self.analyzer_engine.analyze(
+            text=window_text,
+            language=self.language,
+            nlp_artifacts=window_artifacts,
+            **self.analyze_kwargs,
+        )
+        for result in window_results:
+            result.start += window_start
+            result.end += window_start
+            if result.end > changed_start and result.start < changed_end:
+                results.append(result)
+
+        logger.debug(
+            f"Re-analyzed {window_end - window_start} of {len(text)} characters"
+        )
+        results.sort(key=lambda result: (result.start, result.end))
+        nlp_artifacts = _splice_nlp_artifacts(
+            previous.nlp_artifacts,
+            window_artifacts,
+            window_start,
+            old_window_end,
+            self.language,
+        )
+        return AnalysisSnapshot(text, results, nlp_artifacts)
+
+
+def _get_window(previous: AnalysisSnapshot, start: int, end: int) -> Tuple[int, int]:
+    """
+    Extend a region of the previous text to whole sentences, tokens and entities.
+
+    The region is aligned with the previous text's tokens, without splitting any
+    entity, for the NLP artifacts outside of it to be reused.
+
+    :return: Start and end of the window in the previous text
+    """
+    start, end = _find_sentences(previous, start, end)
+    doc = previous.nlp_artifacts.tokens
+    tokens_indices = previous.nlp_artifacts.tokens_indices
+    start_token = max(bisect.bisect_right(tokens_indices, start) - 1, 0)
+    end_token = bisect.bisect_left(tokens_indices, end)
+    for entity in doc.ents:
+        if entity.start < start_token < entity.end:
+            start_token = entity.start
+        if entity.start < end_token < entity.end:
+            end_token = entity.end
+    start = tokens_indices[start_token] if start_token < len(doc) else len(doc.text)
+    end = tokens_indices[end_token] if end_token < len(doc) else len(doc.text)
+    return start, end
+
+
+def _find_sentences(
+    previous: AnalysisSnapshot, start: int, end: int
+) -> Tuple[int, int]:
+    """
+    Extend a region of the previous text to the sentences it overlaps.
+
+    Sentences are taken from the NLP artifacts if the NLP pipeline sets them,
+    and found by punctuation and line breaks otherwise.
+
+    :return: Start and end of the sentences in the previous text
+    """
+    doc = previous.nlp_artifacts.tokens
+    if len(doc) and doc.has_annotation("SENT_START"):
+        tokens_indices = previous.nlp_artifacts.tokens_indices
+        start_token = max(bisect.bisect_right(tokens_indices, start) - 1, 0)
+        end_token = max(bisect.bisect_left(tokens_indices, end) - 1, start_token)
+        return doc[start_token].sent.start_char, doc[end_token].sent.end_char
+    return (
+        _find_sentence_start(previous.text, start),
+        _find_sentence_end(previous.text, end),
+    )
+
+
+def _find_sentence_start(text: str, offset: int) -> int:
+    """Return the start of the sentence containing an offset of the text."""
+    lookback = 256
+    while True:
+        search_start = max(offset - lookback, 0)
+        match = None
+        for match in SENTENCE_BOUNDARY.finditer(  # noqa B007
+            text, search_start, offset
+        ):
+            pass
+        if match:
+            return match.end()
+        if search_start == 0:
+            return 0
+        lookback *= 2
+
+
+def _find_sentence_end(text: str, offset: int) -> int:
+    """Return the end of the sentence containing an offset of the text."""
+    match = SENTENCE_BOUNDARY.search(text, offset)
+    return match.end() if match else len(text)
+
+
+def _splice_nlp_artifacts(
+    previous: NlpArtifacts,
+    window: NlpArtifacts,
+    window_start: int,
+    old_window_end: int,
+    language: str,
+) -> NlpArtifacts:
+    """
+    Replace the NLP artifacts of a window of the previous text.
+
+    The window should start and end on token boundaries of the previous text.
+    """
+    from spacy.tokens import Doc
+
+    doc = previous.tokens
+    start_token = bisect.bisect_left(previous.tokens_indices, window_start)
+    end_token = bisect.bisect_left(previous.tokens_indices, old_window_end)
+    docs = [doc[:start_token].as_doc(), window.tokens, doc[end_token:].as_doc()]
+    doc = Doc.from_docs([d for d in docs if len(d)], ensure_whitespace=False)
+    return NlpArtifacts(
+        entities=doc.ents,
+        tokens=doc,
+        tokens_indices=[token.idx for token in doc],
+        lemmas=[token.lemma_ for token in doc],
+        nlp_engine=window.nlp_engine,
+        language=language,
+    )
+
+
+def _find_edited_region(old_text: str, new_text: str) -> Tuple[int, int, int]:
+    """
+    Find the region of a text which differs from its previous version.
+
+    :return: Start of the region, and its end in the old and new texts
+    """
+    max_length = min(len(old_text), len(new_text))
+    prefix = _common_length(old_text, new_text, max_length, from_end=False)
+    suffix = _common_length(old_text, new_text, max_length - prefix, from_end=True)
+    return prefix, len(old_text) - suffix, len(new_text) - suffix
+
+
+def _common_length(a: str, b: str, max_length: int, from_end: bool) -> int:
+    """Return the length of the common prefix (or suffix) by binary search."""
+    low, high = 0, max_length
+    while low < high:
+        middle = (low + high + 1) // 2
+        if from_end:
+            equal = a[len(a) - middle :] == b[len(b) - middle :]
+        else:
+            equal = a[:middle] == b[:middle]
+        if equal:
+            low = middle
+        else:
+            high = middle - 1
+    return low
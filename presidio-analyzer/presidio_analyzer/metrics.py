@@ -0,0 +1,48 @@
+"""Latency metrics of the analyzer."""
+from presidio_anonymizer.services.metrics import (
+    Histogram,
+    MetricsRegistry,
+    MultiprocessMetrics,
+)
+
+__all__ = ["Histogram", "MetricsRegistry", "MultiprocessMetrics", "metrics_registry"]
+
+metrics_registry = MetricsRegistry(namespace="presidio_analyzer")
+metrics_registry.describe(
+    "analyze_duration_seconds", "Time spent in AnalyzerEngine.analyze"
+)
+metrics_registry.describe(
+    "nlp_duration_seconds", "Time spent in each stage of the NLP engine"
+)
+metrics_registry.describe(
+    "recognizer_duration_seconds", "Time spent in each recognizer's analyze"
+)
+metrics_registry.describe(
+    "pattern_duration_seconds",
+    "Time spent matching and validating each pattern of a pattern recognizer",
+)
+metrics_registry.describe(
+    "context_enhancement_duration_seconds",
+    "Time spent enhancing scores using context words",
+)
+metrics_registry.describe(
+    "deduplication_duration_seconds", "Time spent removing duplicate results"
+)
+metrics_registry.describe(
+    "nlp_model_load_duration_seconds", "Time spent loading each language's NLP model"
+)
+metrics_registry.describe(
+    "nlp_model_loaded", "Whether a language's NLP model is loaded (1) or not (0)"
+)
+metrics_registry.describe(
+    "nlp_model_evictions_total",
+    "Number of times a language's NLP model was unloaded to make room for another",
+)
+metrics_registry.describe(
+    "warm_up_duration_seconds", "Time spent in AnalyzerEngine.warm_up per language"
+)
+metrics_registry.describe(
+    "pattern_prefilter_checks_total",
+    "Number of pattern prefilter checks, by result (match, or skip when "
+    "the pattern couldn't match the text and its regex wasn't run)",
+)
@@ -1,12 +1,31 @@
 """NLP engine package. Performs text pre-processing."""
+import importlib
+from typing import List
 
 from .nlp_artifacts import NlpArtifacts
 from .nlp_engine import NlpEngine
-from .spacy_nlp_engine import SpacyNlpEngine
-from .stanza_nlp_engine import StanzaNlpEngine
-from .transformers_nlp_engine import TransformersNlpEngine
 from .nlp_engine_provider import NlpEngineProvider
 
+# The NLP engines import their NLP frameworks (spaCy, stanza, transformers),
+# so they are only imported on first access
+_LAZY_IMPORTS = {
+    "SpacyNlpEngine": ".spacy_nlp_engine",
+    "StanzaNlpEngine": ".stanza_nlp_engine",
+    "TransformersNlpEngine": ".transformers_nlp_engine",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
 __all__ = [
     "NlpArtifacts",
     "NlpEngine",
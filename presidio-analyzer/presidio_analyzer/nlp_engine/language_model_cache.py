@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, MutableMapping, Optional, TypeVar
+
+from presidio_analyzer.metrics import metrics_registry
+
+logger = logging.getLogger("presidio-analyzer")
+
+Model = TypeVar("Model")
+
+
+class LanguageModelCache(MutableMapping[str, Model]):
+    """
+    Mapping from language code to NLP model, loading models on first access.
+
+    Keys are all the configured languages, whether their model is loaded or not.
+    When max_loaded_models is set, the least recently used model is evicted
+    once a new model is loaded beyond that capacity.
+    Requests holding an evicted model keep using it until they are done.
+
+    :param model_names: Name of the model per language
+    :param load_model: Function loading a model by language code and model name
+    :param max_loaded_models: Maximum number of models kept in memory,
+    unlimited if None
+    """
+
+    def __init__(
+        self,
+        model_names: Dict[str, object],
+        load_model: Callable[[str, object], Model],
+        max_loaded_models: Optional[int] = None,
+    ):
+        if max_loaded_models is not None and max_loaded_models < 1:
+            raise ValueError("max_loaded_models should be a positive number")
+        self.model_names = dict(model_names)
+        self.load_model = load_model
+        self.max_loaded_models = max_loaded_models
+        self._models: "OrderedDict[str, Model]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._language_locks: Dict[str, threading.Lock] = {}
+        self.load_times: Dict[str, float] = {}
+
+    @property
+    def loaded_languages(self) -> List[str]:
+        """Return the languages with a model in memory, least recently used first."""
+        return list(self._models)
+
+    def __getitem__(self, language: str) -> Model:
+        """Return the model of a language, loading it if not in memory."""
+        model = self._models.get(language)
+        if model is not None:
+            if self.max_loaded_models is not None:
+                try:
+                    self._models.move_to_end(language)
+                except KeyError:
+                    pass  # evicted concurrently, the model is still usable
+            return model
+
+        if language not in self.model_names:
+            raise KeyError(language)
+        return self._load(language)
+
+    def __setitem__(self, language: str, model: Model) -> None:
+        """Add an already loaded model for a language."""
+        with self._lock:
+            self.model_names.setdefault(language, None)
+            self._models[language] = model
+            self._models.move_to_end(language)
+            self._evict()
+            self._update_gauges()
+
+    def __delitem__(self, language: str) -> None:
+        """Unload a language's model and remove the language."""
+        with self._lock:
+            del self.model_names[language]
+            self._models.pop(language, None)
+            self._update_gauges()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all the configured languages."""
+        return iter(list(self.model_names))
+
+    def __len__(self) -> int:
+        """Return the number of configured languages."""
+        return len(self.model_names)
+
+    def __contains__(self, language: object) -> bool:
+        """Return whether a language is configured, without loading its model."""
+        return language in self.model_names
+
+    def load_all(self) -> None:
+        """Load the models of all languages, up to max_loaded_models."""
+        for language in self:
+            self[language]
+
+    def unload(self, language: str) -> None:
+        """Remove a language's model from memory, it is reloaded on next access."""
+        with self._lock:
+            self._models.pop(language, None)
+            self._update_gauges()
+
+    def _load(self, language: str) -> Model:
+        with self._lock:
+            language_lock = self._language_locks.setdefault(
+                language, threading.Lock()
+            )
+        # Only loads of the same language wait for each other
+        with language_lock:
+            model = self._models.get(language)
+            if model is not None:
+                return model
+
+            model_name = self.model_names[language]
+            logger.info(f"Loading model {model_name} for language {language}")
+            start = time.perf_counter()
+            model = self.load_model(language, model_name)
+            load_time = time.perf_counter() - start
+            logger.info(f"Loaded model {model_name} in {load_time:.2f} seconds")
+
+            metrics_registry.observe(
+                "nlp_model_load_duration_seconds",
+                load_time,
+                language=language,
+            )
+            with self._lock:
+                self.load_times[language] = load_time
+                self._models[language] = model
+                self._evict()
+                self._update_gauges()
+            return model
+
+    def _evict(self) -> None:
+        if self.max_loaded_models is None:
+            return
+        while len(self._models) > self.max_loaded_models:
+            language, _ = self._models.popitem(last=False)
+            logger.info(f"Evicted the model of language {language}")
+            metrics_registry.increment("nlp_model_evictions_total", language=language)
+
+    def _update_gauges(self) -> None:
+        for language in self.model_names:
+            metrics_registry.set_gauge(
+                "nlp_model_loaded",
+                1 if language in self._models else 0,
+                language=language,
+            )
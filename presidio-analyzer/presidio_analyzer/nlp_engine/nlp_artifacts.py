@@ -1,7 +1,8 @@
 import json
-from typing import List
+from typing import List, TYPE_CHECKING
 
-from spacy.tokens import Doc, Span
+if TYPE_CHECKING:
+    from spacy.tokens import Doc, Span
 
 
 class NlpArtifacts:
@@ -14,8 +15,8 @@ class NlpArtifacts:
 
     def __init__(
         self,
-        entities: List[Span],
-        tokens: Doc,
+        entities: List["Span"],
+        tokens: "Doc",
         tokens_indices: List[int],
         lemmas: List[str],
         nlp_engine,  # noqa ANN001
@@ -4,12 +4,7 @@ from typing import Optional, Dict, Union, Tuple
 
 import yaml
 
-from presidio_analyzer.nlp_engine import (
-    StanzaNlpEngine,
-    SpacyNlpEngine,
-    NlpEngine,
-    TransformersNlpEngine,
-)
+from presidio_analyzer.nlp_engine.nlp_engine import NlpEngine
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -25,8 +20,12 @@ class NlpEngineProvider:
                 "nlp_engine_name": "spacy",
                 "models": [{"lang_code": "en",
                             "model_name": "en_core_web_lg"
-                          }]
+                          }],
+                "lazy_load": False,
+                "max_loaded_models": None
             }
+    lazy_load and max_loaded_models are optional,
+    see SpacyNlpEngine for details.
     Nlp engine names available by default: spacy, stanza.
     :param conf_file: Path to yaml file containing nlp engine configuration.
     """
@@ -39,6 +38,12 @@ class NlpEngineProvider:
     ):
 
         if not nlp_engines:
+            from presidio_analyzer.nlp_engine import (
+                SpacyNlpEngine,
+                StanzaNlpEngine,
+                TransformersNlpEngine,
+            )
+
             nlp_engines = (SpacyNlpEngine, StanzaNlpEngine, TransformersNlpEngine)
 
         self.nlp_engines = {
@@ -88,10 +93,17 @@ class NlpEngineProvider:
                 m["lang_code"]: m["model_name"]
                 for m in self.nlp_configuration["models"]
             }
-            engine = nlp_engine_class(nlp_engine_opts)
+            # Model loading options are only passed when configured,
+            # to support engines which don't accept them
+            engine_kwargs = {
+                key: self.nlp_configuration[key]
+                for key in ("lazy_load", "max_loaded_models")
+                if key in self.nlp_configuration
+            }
+            engine = nlp_engine_class(nlp_engine_opts, **engine_kwargs)
             logger.info(
                 f"Created NLP engine: {engine.engine_name}. "
-                f"Loaded models: {list(engine.nlp.keys())}"
+                f"Configured models: {list(engine.nlp.keys())}"
             )
             return engine
         except KeyError:
@@ -0,0 +1,193 @@
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger("presidio-analyzer")
+
+ONNX_MODEL_FILE = "model.onnx"
+QUANTIZED_ONNX_MODEL_FILE = "model_quantized.onnx"
+DEFAULT_ONNX_MODELS_DIR = Path.home() / ".cache" / "presidio" / "onnx"
+
+
+class OnnxTokenClassifier:
+    """
+    Token classification (NER) model running on ONNX Runtime's CPU provider.
+
+    The model is exported from a Hugging Face token classification model
+    on first use, and optionally quantized to int8 weights (dynamic quantization).
+    Exported models are kept in onnx_model_dir and reused by later runs.
+
+    Unlike the transformers pipeline, the model receives token ids
+    which were already computed, so each text is only tokenized once.
+
+    Exporting requires `optimum[exporters]`, running requires `onnxruntime`.
+
+    :param pretrained_model_name_or_path: HaggingFace pretrained_model_name_or_path
+    :param tokenizer: The model's (fast) tokenizer
+    :param quantize: Whether to run an int8 dynamically quantized model
+    :param onnx_model_dir: Directory of the exported model, defaults to a directory
+    per model under ~/.cache/presidio/onnx
+    """
+
+    def __init__(
+        self,
+        pretrained_model_name_or_path: str,
+        tokenizer: "PreTrainedTokenizerBase",  # noqa F821
+        quantize: bool = False,
+        onnx_model_dir: Optional[Union[str, Path]] = None,
+    ):
+        import onnxruntime
+        from transformers import AutoConfig
+
+        if not onnx_model_dir:
+            onnx_model_dir = DEFAULT_ONNX_MODELS_DIR / pretrained_model_name_or_path
+        onnx_model_dir = Path(onnx_model_dir)
+        model_path = self._get_model_path(
+            pretrained_model_name_or_path, onnx_model_dir, quantize
+        )
+
+        self.tokenizer = tokenizer
+        self.id2label = AutoConfig.from_pretrained(
+            pretrained_model_name_or_path
+        ).id2label
+        self.session = onnxruntime.InferenceSession(
+            str(model_path), providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {inp.name for inp in self.session.get_inputs()}
+
+    def predict(
+        self,
+        windows: Sequence[Tuple[List[int], List[Tuple[int, int]]]],
+        batch_size: int = 8,
+    ) -> List[List[Dict]]:
+        """
+        Predict the entities of tokenized texts.
+
+        :param windows: Token ids and (start, end) character offsets
+        of each text's tokens, without special tokens
+        :param batch_size: Number of texts passed to the model at once
+        :return: Entities per text, in the format of the transformers
+        ner pipeline with the "simple" aggregation strategy
+        """
+        import numpy as np
+
+        results = []
+        for i in range(0, len(windows), batch_size):
+            batch = windows[i : i + batch_size]
+            input_ids, special_tokens_masks = [], []
+            for token_ids, _ in batch:
+                input_ids.append(
+                    self.tokenizer.build_inputs_with_special_tokens(token_ids)
+                )
+                special_tokens_masks.append(
+                    self.tokenizer.get_special_tokens_mask(token_ids)
+                )
+
+            length = max(len(ids) for ids in input_ids)
+            pad_token_id = self.tokenizer.pad_token_id or 0
+            inputs = {
+                "input_ids": np.array(
+                    [ids + [pad_token_id] * (length - len(ids)) for ids in input_ids],
+                    dtype=np.int64,
+                ),
+                "attention_mask": np.array(
+                    [[1] * len(ids) + [0] * (length - len(ids)) for ids in input_ids],
+                    dtype=np.int64,
+                ),
+            }
+            inputs["token_type_ids"] = np.zeros_like(inputs["input_ids"])
+            inputs = {
+                name: inputs[name] for name in inputs if name in self.input_names
+            }
+            logits = self.session.run(None, inputs)[0]
+
+            probabilities = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probabilities /= probabilities.sum(axis=-1, keepdims=True)
+            for (_, offsets), mask, window_probabilities in zip(
+                batch, special_tokens_masks, probabilities
+            ):
+                # Drop the special tokens' (and padding) predictions
+                token_positions = [
+                    position for position, special in enumerate(mask) if not special
+                ]
+                token_probabilities = window_probabilities[token_positions]
+                labels = [
+                    self.id2label[label_id]
+                    for label_id in token_probabilities.argmax(axis=-1)
+                ]
+                scores = token_probabilities.max(axis=-1).tolist()
+                results.append(aggregate_token_predictions(labels, scores, offsets))
+        return results
+
+    @staticmethod
+    def _get_model_path(
+        pretrained_model_name_or_path: str, onnx_model_dir: Path, quantize: bool
+    ) -> Path:
+        """Return the path of the ONNX model, exporting it if needed."""
+        model_path = onnx_model_dir / ONNX_MODEL_FILE
+        if not model_path.exists():
+            from optimum.exporters.onnx import main_export
+
+            logger.info(
+                f"Exporting {pretrained_model_name_or_path} to ONNX in {onnx_model_dir}"
+            )
+            main_export(
+                pretrained_model_name_or_path,
+                output=onnx_model_dir,
+                task="token-classification",
+            )
+
+        if not quantize:
+            return model_path
+
+        quantized_model_path = onnx_model_dir / QUANTIZED_ONNX_MODEL_FILE
+        if not quantized_model_path.exists():
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            logger.info(f"Quantizing {model_path} to int8")
+            quantize_dynamic(
+                model_path, quantized_model_path, weight_type=QuantType.QInt8
+            )
+        return quantized_model_path
+
+
+def aggregate_token_predictions(
+    labels: List[str], scores: List[float], offsets: List[Tuple[int, int]]
+) -> List[Dict]:
+    """
+    Group token predictions (IOB labels) into entities.
+
+    Consecutive tokens of the same entity type form an entity, unless a token
+    is labeled as the beginning of an entity (B-). Entity scores are the mean
+    of their tokens' scores. This is the transformers ner pipeline's
+    "simple" aggregation strategy.
+
+    :param labels: Predicted label per token, e.g. B-PER, I-PER or O
+    :param scores: Probability of the predicted label per token
+    :param offsets: (start, end) character offsets of the tokens
+    """
+    entities = []
+    group = []
+    group_type = None
+    for label, score, (start, end) in zip(labels, scores, offsets):
+        if label.startswith(("B-", "I-")):
+            prefix, entity_type = label[0], label[2:]
+        else:
+            prefix, entity_type = "I", label
+        if group and (entity_type != group_type or prefix == "B"):
+            entities.append(_group_to_entity(group_type, group))
+            group = []
+        group.append((score, start, end))
+        group_type = entity_type
+    if group:
+        entities.append(_group_to_entity(group_type, group))
+    return [entity for entity in entities if entity["entity_group"] != "O"]
+
+
+def _group_to_entity(entity_type: str, group: List[Tuple[float, int, int]]) -> Dict:
+    return {
+        "entity_group": entity_type,
+        "score": sum(score for score, _, _ in group) / len(group),
+        "start": group[0][1],
+        "end": group[-1][2],
+    }
@@ -5,7 +5,10 @@ import spacy
 from spacy.language import Language
 from spacy.tokens import Doc
 
-from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine
+from presidio_analyzer.metrics import metrics_registry
+from presidio_analyzer.nlp_engine.language_model_cache import LanguageModelCache
+from presidio_analyzer.nlp_engine.nlp_artifacts import NlpArtifacts
+from presidio_analyzer.nlp_engine.nlp_engine import NlpEngine
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -22,26 +25,44 @@ class SpacyNlpEngine(NlpEngine):
     engine_name = "spacy"
     is_available = bool(spacy)
 
-    def __init__(self, models: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        models: Optional[Dict[str, str]] = None,
+        lazy_load: bool = False,
+        max_loaded_models: Optional[int] = None,
+    ):
         """
         Initialize a wrapper on spaCy functionality.
 
         :param models: Dictionary with the name of the spaCy model per language.
         For example: models = {"en": "en_core_web_lg"}
+        :param lazy_load: Whether to load each language's model
+        on the first request for that language, instead of on initialization.
+        :param max_loaded_models: Maximum number of models kept in memory.
+        The least recently used model is unloaded when this number is exceeded.
+        Unlimited if None.
         """
         if not models:
             models = {"en": "en_core_web_lg"}
-        logger.debug(f"Loading SpaCy models: {models.values()}")
+        self.lazy_load = lazy_load
+        self.nlp = LanguageModelCache(
+            models, self._load_model, max_loaded_models=max_loaded_models
+        )
+        if not lazy_load:
+            logger.debug(f"Loading SpaCy models: {models.values()}")
+            self.nlp.load_all()
 
-        self.nlp = {
-            lang_code: spacy.load(model_name, disable=["parser"])
-            for lang_code, model_name in models.items()
-        }
+    def _load_model(self, language: str, model_name: str) -> Language:
+        """Load the model of a single language."""
+        return spacy.load(model_name, disable=["parser"])
 
     def process_text(self, text: str, language: str) -> NlpArtifacts:
         """Execute the SpaCy NLP pipeline on the given text and language."""
 
-        doc = self.nlp[language](text)
+        with metrics_registry.timer(
+            "nlp_duration_seconds", stage="pipeline", language=language
+        ):
+            doc = self.nlp[language](text)
         return self._doc_to_nlp_artifact(doc, language)
 
     def process_batch(
@@ -82,14 +103,17 @@ class SpacyNlpEngine(NlpEngine):
         return self.nlp[language]
 
     def _doc_to_nlp_artifact(self, doc: Doc, language: str) -> NlpArtifacts:
-        lemmas = [token.lemma_ for token in doc]
-        tokens_indices = [token.idx for token in doc]
-        entities = doc.ents
-        return NlpArtifacts(
-            entities=entities,
-            tokens=doc,
-            tokens_indices=tokens_indices,
-            lemmas=lemmas,
-            nlp_engine=self,
-            language=language,
-        )
+        with metrics_registry.timer(
+            "nlp_duration_seconds", stage="nlp_artifacts", language=language
+        ):
+            lemmas = [token.lemma_ for token in doc]
+            tokens_indices = [token.idx for token in doc]
+            entities = doc.ents
+            return NlpArtifacts(
+                entities=entities,
+                tokens=doc,
+                tokens_indices=tokens_indices,
+                lemmas=lemmas,
+                nlp_engine=self,
+                language=language,
+            )
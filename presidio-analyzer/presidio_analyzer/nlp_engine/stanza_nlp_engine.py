@@ -1,12 +1,9 @@
+import importlib.util
 import logging
 
-try:
-    import stanza
-    import spacy_stanza
-except ImportError:
-    stanza = None
+from spacy.language import Language
 
-from presidio_analyzer.nlp_engine import SpacyNlpEngine
+from presidio_analyzer.nlp_engine.spacy_nlp_engine import SpacyNlpEngine
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -21,20 +18,30 @@ class StanzaNlpEngine(SpacyNlpEngine):
 
     :param models: Dictionary with the name of the stanza model per language.
     For example: models = {"en": "en"}
+    :param lazy_load: Whether to load each language's model on first use
+    :param max_loaded_models: Maximum number of models kept in memory
     """
 
     engine_name = "stanza"
-    is_available = bool(stanza)
+    is_available = all(
+        importlib.util.find_spec(module) for module in ("stanza", "spacy_stanza")
+    )
 
-    def __init__(self, models=None):  # noqa ANN201
+    def __init__(  # noqa ANN201
+        self, models=None, lazy_load=False, max_loaded_models=None  # noqa ANN001
+    ):
         if not models:
             models = {"en": "en"}
-        logger.debug(f"Loading Stanza models: {models.values()}")
-
-        self.nlp = {
-            lang_code: spacy_stanza.load_pipeline(
-                model_name,
-                processors="tokenize,pos,lemma,ner",
-            )
-            for lang_code, model_name in models.items()
-        }
+        super().__init__(
+            models, lazy_load=lazy_load, max_loaded_models=max_loaded_models
+        )
+
+    def _load_model(self, language: str, model_name: str) -> Language:
+        """Load the stanza pipeline of a single language."""
+        import spacy_stanza
+
+        logger.debug(f"Loading Stanza model: {model_name}")
+        return spacy_stanza.load_pipeline(
+            model_name,
+            processors="tokenize,pos,lemma,ner",
+        )
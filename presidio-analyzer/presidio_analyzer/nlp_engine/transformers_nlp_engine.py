@@ -1,36 +1,49 @@
+import importlib.util
 import logging
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, List, NamedTuple, Tuple
 
 import spacy
 from spacy.language import Language
 from spacy.tokens import Doc, Span
+from spacy.util import filter_spans, minibatch
 
-from presidio_analyzer.nlp_engine import SpacyNlpEngine
-
-
-try:
-    import torch
-    import transformers
-    from transformers import (
-        AutoTokenizer,
-        AutoModelForTokenClassification,
-        pipeline,
-    )
-except ImportError:
-    torch = None
-    transformers = None
+from presidio_analyzer.nlp_engine.spacy_nlp_engine import SpacyNlpEngine
 
 logger = logging.getLogger("presidio-analyzer")
 
 
 @Language.factory(
     "transformers",
-    default_config={"pretrained_model_name_or_path": "dslim/bert-base-NER"},
+    default_config={
+        "pretrained_model_name_or_path": "dslim/bert-base-NER",
+        "batch_size": 8,
+        "max_length": None,
+        "stride": 64,
+        "backend": "pytorch",
+        "quantize": False,
+        "onnx_model_dir": None,
+    },
 )
-def create_transformer_component(nlp, name, pretrained_model_name_or_path: str):
+def create_transformer_component(
+    nlp,  # noqa ANN001
+    name: str,
+    pretrained_model_name_or_path: str,
+    batch_size: int,
+    max_length: Optional[int],
+    stride: int,
+    backend: str,
+    quantize: bool,
+    onnx_model_dir: Optional[str],
+):
     """Spacy Language factory for creating custom component."""
     return TransformersComponent(
-        pretrained_model_name_or_path=pretrained_model_name_or_path
+        pretrained_model_name_or_path=pretrained_model_name_or_path,
+        batch_size=batch_size,
+        max_length=max_length,
+        stride=stride,
+        backend=backend,
+        quantize=quantize,
+        onnx_model_dir=onnx_model_dir,
     )
 
 
@@ -39,25 +52,153 @@ class TransformersComponent:
     Custom component to use in spacy pipeline.
 
     Using HaggingFace transformers pretrained models for entity recognition.
+    Texts longer than the model's maximum sequence length are split into
+    overlapping windows, and the windows of a batch of docs are passed
+    to the model together.
     :param pretrained_model_name_or_path: HaggingFace pretrained_model_name_or_path
+    :param batch_size: Number of windows passed to the model at once
+    :param max_length: Maximum number of tokens per window, including special tokens.
+    Defaults to the model's maximum sequence length (up to 512)
+    :param stride: Number of tokens shared by consecutive windows
+    :param backend: "pytorch" for running the model using the transformers pipeline,
+    or "onnx" for running an ONNX export of the model using ONNX Runtime on CPU
+    :param quantize: Whether to run an int8 quantized model (onnx backend only)
+    :param onnx_model_dir: Directory for the exported ONNX model (onnx backend only)
     """
 
-    def __init__(self, pretrained_model_name_or_path: str) -> None:
+    DEFAULT_MAX_LENGTH = 512
+    BACKENDS = ("pytorch", "onnx")
+
+    def __init__(
+        self,
+        pretrained_model_name_or_path: str,
+        batch_size: int = 8,
+        max_length: Optional[int] = None,
+        stride: int = 64,
+        backend: str = "pytorch",
+        quantize: bool = False,
+        onnx_model_dir: Optional[str] = None,
+    ) -> None:
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"backend should be one of {self.BACKENDS}, got '{backend}'"
+            )
+        # Imported here as importing transformers (and torch) takes seconds
+        from transformers import AutoTokenizer
+
         Span.set_extension("confidence_score", default=1.0, force=True)
         tokenizer = AutoTokenizer.from_pretrained(pretrained_model_name_or_path)
-        model = AutoModelForTokenClassification.from_pretrained(
-            pretrained_model_name_or_path
-        )
-        self.nlp = pipeline(
-            "ner", model=model, tokenizer=tokenizer, aggregation_strategy="simple"
-        )
+        self.nlp = None
+        self.onnx_model = None
+        if backend == "onnx":
+            from presidio_analyzer.nlp_engine.onnx_token_classifier import (
+                OnnxTokenClassifier,
+            )
+
+            self.onnx_model = OnnxTokenClassifier(
+                pretrained_model_name_or_path,
+                tokenizer=tokenizer,
+                quantize=quantize,
+                onnx_model_dir=onnx_model_dir,
+            )
+        else:
+            from transformers import AutoModelForTokenClassification, pipeline
+
+            model = AutoModelForTokenClassification.from_pretrained(
+                pretrained_model_name_or_path
+            )
+            self.nlp = pipeline(
+                "ner", model=model, tokenizer=tokenizer, aggregation_strategy="simple"
+            )
+        self.tokenizer = tokenizer
+        self.batch_size = batch_size
+        if not max_length:
+            max_length = min(tokenizer.model_max_length, self.DEFAULT_MAX_LENGTH)
+        # Windows leave room for the special tokens the pipeline adds
+        self.max_tokens = max_length - tokenizer.num_special_tokens_to_add()
+        if not 0 <= stride < self.max_tokens:
+            raise ValueError(
+                f"stride should be between 0 and {self.max_tokens - 1}, got {stride}"
+            )
+        self.stride = stride
 
     def __call__(self, doc: Doc) -> Doc:
         """Write transformers results to doc entities."""
+        return next(self.pipe([doc]))
+
+    def pipe(self, stream: Iterable[Doc], batch_size: Optional[int] = None):
+        """
+        Write transformers results to the entities of a stream of docs.
+
+        Called by spaCy's `nlp.pipe`, running the model on batches of windows.
+        :param stream: The docs to process
+        :param batch_size: Number of docs processed together
+        """
+        for docs in minibatch(stream, size=batch_size or self.batch_size):
+            windows_per_doc = []
+            window_inputs = []
+            for doc in docs:
+                windows, doc_window_inputs = self._get_windows(doc.text)
+                windows_per_doc.append(windows)
+                window_inputs.extend(doc_window_inputs)
+            predictions = iter(self._predict(window_inputs) if window_inputs else [])
+            for doc, windows in zip(docs, windows_per_doc):
+                window_predictions = [next(predictions) for _ in windows]
+                entities = merge_window_entities(windows, window_predictions)
+                yield self._set_entities(doc, entities)
+
+    def _get_windows(
+        self, text: str
+    ) -> Tuple[List["TextWindow"], List[Tuple[str, List[int], List[Tuple[int, int]]]]]:
+        """
+        Split a text to windows.
+
+        :return: The windows, and each window's text, token ids and token offsets
+        (relative to the window start), so the onnx backend can reuse them.
+        """
+        if not text.strip():
+            return [], []
+        encoding = self.tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )
+        token_ids, token_offsets = encoding["input_ids"], encoding["offset_mapping"]
+        windows = split_to_windows(
+            text_length=len(text),
+            token_offsets=token_offsets,
+            max_tokens=self.max_tokens,
+            stride=self.stride,
+        )
+        window_inputs = [
+            (
+                text[window.start : window.end],
+                token_ids[window.token_start : window.token_end],
+                [
+                    (start - window.start, end - window.start)
+                    for start, end in token_offsets[
+                        window.token_start : window.token_end
+                    ]
+                ],
+            )
+            for window in windows
+        ]
+        return windows, window_inputs
 
-        res = self.nlp(doc.text)
+    def _predict(
+        self, window_inputs: List[Tuple[str, List[int], List[Tuple[int, int]]]]
+    ) -> List[List[Dict]]:
+        """Return the entities predicted by the model for each window."""
+        if self.onnx_model:
+            return self.onnx_model.predict(
+                [(token_ids, offsets) for _, token_ids, offsets in window_inputs],
+                batch_size=self.batch_size,
+            )
+        texts = [text for text, _, _ in window_inputs]
+        return self.nlp(texts, batch_size=self.batch_size)
+
+    @staticmethod
+    def _set_entities(doc: Doc, entities: List[Dict]) -> Doc:
         ents = []
-        for d in res:
+        for d in entities:
             span = doc.char_span(
                 d["start"], d["end"], label=d["entity_group"], alignment_mode="expand"
             )
@@ -68,10 +209,108 @@ class TransformersComponent:
                 logger.warning(
                     f"Transformers model returned {d} but no valid span was found."
                 )
-        doc.ents = ents
+        doc.ents = filter_spans(ents)
         return doc
 
 
+class TextWindow(NamedTuple):
+    """
+    A part of a text passed to the model separately.
+
+    :param start: Start offset of the window in the text
+    :param end: End offset of the window in the text
+    :param own_start: Start offset of the part of the text this window is
+    responsible for, where entities are taken from this window's predictions
+    :param own_end: End offset of the part of the text this window is responsible for
+    :param token_start: Index of the window's first token in the text's tokens
+    :param token_end: Index after the window's last token in the text's tokens
+    """
+
+    start: int
+    end: int
+    own_start: int
+    own_end: int
+    token_start: int = 0
+    token_end: int = 0
+
+
+def split_to_windows(
+    text_length: int,
+    token_offsets: List[Tuple[int, int]],
+    max_tokens: int,
+    stride: int,
+) -> List[TextWindow]:
+    """
+    Split a text into windows of up to max_tokens tokens.
+
+    Consecutive windows share stride tokens. Each window is responsible for
+    its part of the text up to the middle of the overlap with its neighbours,
+    so entities near a window's edge are taken from the neighbouring window,
+    which has more context around them.
+
+    :param text_length: Length of the text in characters
+    :param token_offsets: (start, end) character offsets of the text's tokens
+    :param max_tokens: Maximum number of tokens in a window
+    :param stride: Number of tokens shared by consecutive windows
+    """
+    if len(token_offsets) <= max_tokens:
+        return [TextWindow(0, text_length, 0, text_length, 0, len(token_offsets))]
+
+    token_ranges = []
+    step = max_tokens - stride
+    first_token = 0
+    while True:
+        last_token = min(first_token + max_tokens, len(token_offsets)) - 1
+        token_ranges.append((first_token, last_token + 1))
+        if last_token == len(token_offsets) - 1:
+            break
+        first_token += step
+
+    windows = []
+    own_start = 0
+    for i, (token_start, token_end) in enumerate(token_ranges):
+        start = token_offsets[token_start][0]
+        end = token_offsets[token_end - 1][1]
+        if i == len(token_ranges) - 1:
+            own_end = text_length
+        else:
+            next_start = token_offsets[token_ranges[i + 1][0]][0]
+            own_end = (next_start + end) // 2 if next_start < end else next_start
+        windows.append(
+            TextWindow(start, end, own_start, own_end, token_start, token_end)
+        )
+        own_start = own_end
+    return windows
+
+
+def merge_window_entities(
+    windows: List[TextWindow], window_predictions: List[List[Dict]]
+) -> List[Dict]:
+    """
+    Merge the entities predicted on each window into entities of the full text.
+
+    Entity offsets are shifted from window to text offsets. An entity is kept
+    if it starts in the part of the text its window is responsible for.
+
+    :param windows: The windows of the text
+    :param window_predictions: The transformers pipeline predictions per window
+    :return: The entities, sorted by start offset
+    """
+    entities = []
+    for window, predictions in zip(windows, window_predictions):
+        for prediction in predictions:
+            start = prediction["start"] + window.start
+            if window.own_start <= start < window.own_end:
+                entities.append(
+                    {
+                        **prediction,
+                        "start": start,
+                        "end": prediction["end"] + window.start,
+                    }
+                )
+    return sorted(entities, key=lambda entity: entity["start"])
+
+
 class TransformersNlpEngine(SpacyNlpEngine):
     """
 
@@ -91,6 +330,9 @@ class TransformersNlpEngine(SpacyNlpEngine):
             "transformers": "dslim/bert-base-NER"
         }
     }
+    The optional keys batch_size, max_length, stride, backend, quantize and
+    onnx_model_dir configure the inference of the transformers model,
+    see TransformersComponent.
 
     Note that since the spaCy model is not used for NER,
     we recommend using a simple model, such as en_core_web_sm for English.
@@ -98,12 +340,21 @@ class TransformersNlpEngine(SpacyNlpEngine):
     https://huggingface.co/models?pipeline_tag=token-classification
     It is further recommended to fine-tune these models
     to the specific scenario in hand.
+    :param lazy_load: Whether to load each language's models on first use
+    :param max_loaded_models: Maximum number of languages kept in memory
     """
 
     engine_name = "transformers"
-    is_available = bool(spacy) and bool(transformers)
+    is_available = all(
+        importlib.util.find_spec(module) for module in ("torch", "transformers")
+    )
 
-    def __init__(self, models: Optional[Dict[str, Dict[str, str]]] = None):
+    def __init__(
+        self,
+        models: Optional[Dict[str, Dict[str, str]]] = None,
+        lazy_load: bool = False,
+        max_loaded_models: Optional[int] = None,
+    ):
         # default models if not specified
         if not models:
             models = {
@@ -141,14 +392,26 @@ class TransformersNlpEngine(SpacyNlpEngine):
                 "models.model_name dict"
             )
 
-        logger.debug(f"Loading SpaCy and transformers models: {models.values()}")
+        super().__init__(
+            models, lazy_load=lazy_load, max_loaded_models=max_loaded_models
+        )
 
-        self.nlp = {}
-        for lang_code, model_name in models.items():
-            nlp = spacy.load(model_name["spacy"], disable=["parser", "ner"])
-            nlp.add_pipe(
-                "transformers",
-                config={"pretrained_model_name_or_path": model_name["transformers"]},
-                last=True,
+    def _load_model(self, language: str, model_name: Dict[str, str]) -> Language:
+        """Load the spaCy model of a language, with a transformers NER component."""
+        logger.debug(f"Loading SpaCy and transformers models: {model_name}")
+        nlp = spacy.load(model_name["spacy"], disable=["parser", "ner"])
+        config = {"pretrained_model_name_or_path": model_name["transformers"]}
+        config.update(
+            (key, model_name[key])
+            for key in (
+                "batch_size",
+                "max_length",
+                "stride",
+                "backend",
+                "quantize",
+                "onnx_model_dir",
             )
-            self.nlp[lang_code] = nlp
+            if key in model_name
+        )
+        nlp.add_pipe("transformers", config=config, last=True)
+        return nlp
@@ -1,5 +1,9 @@
 import json
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+import regex as re
+
+from presidio_analyzer.text_prefilter import derive_prefilter
 
 
 class Pattern:
@@ -9,13 +13,49 @@ class Pattern:
     :param name: the name of the pattern
     :param regex: the regex pattern to detect
     :param score: the pattern's strength (values varies 0-1)
+    :param prefilter: a regex which has to be found in a text for the pattern
+    to match it, e.g. "@" for emails. Texts without it aren't matched against
+    the (more expensive) pattern regex. If None, a required character is
+    derived from the regex when possible. An empty string disables prefiltering.
     """
 
-    def __init__(self, name: str, regex: str, score: float):
+    def __init__(
+        self, name: str, regex: str, score: float, prefilter: Optional[str] = None
+    ):
 
         self.name = name
         self.regex = regex
         self.score = score
+        self._prefilter = prefilter
+        self._compiled: Dict[Tuple[str, int], re.Pattern] = {}
+
+    @property
+    def prefilter(self) -> Optional[str]:
+        """Return the regex required in a text for this pattern to match, if any."""
+        return self.get_prefilter()
+
+    def get_prefilter(self, flags: int = 0) -> Optional[str]:
+        """
+        Return the regex required in a text for this pattern to match, if any.
+
+        :param flags: Regex flags the pattern is matched with
+        """
+        if self._prefilter is not None:
+            return self._prefilter or None
+        return derive_prefilter(self.regex, flags)
+
+    def compile(self, flags: int = re.DOTALL | re.MULTILINE) -> re.Pattern:
+        """
+        Return the compiled regex, compiling it on first use.
+
+        Compiled regexes are cached per flags.
+        :param flags: regex flags
+        """
+        key = (self.regex, flags)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = re.compile(self.regex, flags=flags)
+        return compiled
 
     def to_dict(self) -> Dict:
         """
@@ -24,6 +64,8 @@ class Pattern:
         :return: a dictionary
         """
         return_dict = {"name": self.name, "score": self.score, "regex": self.regex}
+        if self._prefilter is not None:
+            return_dict["prefilter"] = self._prefilter
         return return_dict
 
     @classmethod
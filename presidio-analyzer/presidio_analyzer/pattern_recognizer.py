@@ -1,6 +1,8 @@
-import datetime
 import logging
-from typing import List, Optional, Dict
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Dict, Sequence, Iterator, NamedTuple, Tuple
 
 import regex as re
 
@@ -11,11 +13,29 @@ from presidio_analyzer import (
     EntityRecognizer,
     AnalysisExplanation,
 )
+from presidio_analyzer.metrics import metrics_registry
 from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.text_prefilter import TextPrefilter
 
 logger = logging.getLogger("presidio-analyzer")
 
 
+class _PatternMatches(NamedTuple):
+    """The matches of a pattern in a text, with their validation results."""
+
+    pattern: Pattern
+    spans: List[Tuple[int, int]]
+    validation_results: List[Optional[bool]]
+    duration: float
+
+
+# Matches of patterns in a batch of texts, by recognizer (see
+# PatternRecognizer.batch_scope): the regex flags and each text's matches
+_current_batch_matches: ContextVar[
+    Optional[Dict[int, Tuple[int, Dict[str, List[_PatternMatches]]]]]
+] = ContextVar("presidio_batch_matches", default=None)
+
+
 class PatternRecognizer(LocalRecognizer):
     """
     PII entity recognizer using regular expressions or deny-lists.
@@ -96,6 +116,39 @@ class PatternRecognizer(LocalRecognizer):
 
         return results
 
+    def compile_patterns(self, flags: Optional[int] = None) -> None:
+        """
+        Compile the regexes of all patterns ahead of the first analysis.
+
+        :param flags: regex flags the patterns will be matched with
+        """
+        flags = flags if flags else re.DOTALL | re.MULTILINE
+        for pattern in self.patterns:
+            pattern.compile(flags)
+
+    def _prefilter_matches(
+        self, text_prefilter: TextPrefilter, pattern: Pattern, flags: int
+    ) -> bool:
+        """
+        Check whether the pattern's prefilter is found in the text.
+
+        :param text_prefilter: The prefilter of the analyzed text
+        :param pattern: The pattern to check
+        :param flags: regex flags the pattern is matched with
+        :return: False if the pattern can't match the text and should be skipped
+        """
+        prefilter = pattern.get_prefilter(flags)
+        if not prefilter:
+            return True
+        matched = text_prefilter.matches(prefilter, flags)
+        metrics_registry.increment(
+            "pattern_prefilter_checks_total",
+            recognizer=self.name,
+            pattern=pattern.name,
+            result="match" if matched else "skip",
+        )
+        return matched
+
     def _deny_list_to_regex(self, deny_list: List[str]) -> Pattern:
         """
         Convert a list of words to a matching regex.
@@ -121,6 +174,19 @@ class PatternRecognizer(LocalRecognizer):
         """
         return None
 
+    def validate_results(self, pattern_texts: Sequence[str]) -> List[Optional[bool]]:
+        """
+        Validate a batch of detected texts, e.g. all the matches of a pattern.
+
+        Recognizers with checksums override this method to validate
+        the whole batch at once. By default, each text is validated
+        using `validate_result`.
+
+        :param pattern_texts: the texts to validate
+        :return: The result of `validate_result` for each text
+        """
+        return [self.validate_result(pattern_text) for pattern_text in pattern_texts]
+
     def invalidate_result(self, pattern_text: str) -> Optional[bool]:
         """
         Logic to check for result invalidation by running pruning logic.
@@ -160,6 +226,91 @@ class PatternRecognizer(LocalRecognizer):
         )
         return explanation
 
+    @contextmanager
+    def batch_scope(
+        self, texts: Sequence[str], regex_flags: int = None
+    ) -> Iterator[None]:
+        """
+        Match the patterns in a batch of texts ahead of their analysis.
+
+        The matches of each pattern in all the texts are validated with a single
+        `validate_results` call, so that checksums computed over batches also
+        apply to short texts, e.g. the values of a column. Analyzing one of the
+        texts in the managed block reuses its matches. Recognizers without
+        validation, or overriding `analyze`, are left to match each text.
+
+        :param texts: The texts analyzed in the managed block
+        :param regex_flags: regex flags the texts are analyzed with
+        """
+        if type(self).analyze is not PatternRecognizer.analyze or (
+            type(self).validate_result is PatternRecognizer.validate_result
+            and type(self).validate_results is PatternRecognizer.validate_results
+        ):
+            yield
+            return
+
+        flags = regex_flags if regex_flags else re.DOTALL | re.MULTILINE
+        texts = list(dict.fromkeys(texts))
+        batch_matches = dict(_current_batch_matches.get() or {})
+        batch_matches[id(self)] = (
+            flags,
+            dict(zip(texts, self._match_patterns(texts, flags))),
+        )
+        token = _current_batch_matches.set(batch_matches)
+        try:
+            yield
+        finally:
+            _current_batch_matches.reset(token)
+
+    def _match_patterns(
+        self, texts: Sequence[str], flags: int
+    ) -> List[List[_PatternMatches]]:
+        """
+        Match the patterns in texts, validating each pattern's matches at once.
+
+        :param texts: The texts to match
+        :param flags: regex flags
+        :return: The matches of each pattern (passing its prefilter) in each text
+        """
+        text_prefilters = [TextPrefilter.for_text(text) for text in texts]
+        text_matches: List[List[_PatternMatches]] = [[] for _ in texts]
+        for pattern in self.patterns:
+            compiled = pattern.compile(flags)
+            matched = []
+            pattern_texts = []
+            for i, text in enumerate(texts):
+                if not self._prefilter_matches(text_prefilters[i], pattern, flags):
+                    continue
+                match_start_time = time.perf_counter()
+                # Skip empty results
+                spans = [
+                    match.span()
+                    for match in compiled.finditer(text)
+                    if match.start() != match.end()
+                ]
+                pattern_texts.extend(text[start:end] for start, end in spans)
+                matched.append((i, spans, time.perf_counter() - match_start_time))
+
+            validation_start_time = time.perf_counter()
+            validation_results = self.validate_results(pattern_texts)
+            validation_time = time.perf_counter() - validation_start_time
+
+            # The validation time is split between the texts by number of matches
+            offset = 0
+            for i, spans, match_time in matched:
+                count = len(spans)
+                share = count / len(pattern_texts) if pattern_texts else 0
+                text_matches[i].append(
+                    _PatternMatches(
+                        pattern=pattern,
+                        spans=spans,
+                        validation_results=validation_results[offset : offset + count],
+                        duration=match_time + validation_time * share,
+                    )
+                )
+                offset += count
+        return text_matches
+
     def __analyze_patterns(
         self, text: str, flags: int = None
     ) -> List[RecognizerResult]:
@@ -173,29 +324,22 @@ class PatternRecognizer(LocalRecognizer):
         :return: A list of RecognizerResult
         """
         flags = flags if flags else re.DOTALL | re.MULTILINE
-        results = []
-        for pattern in self.patterns:
-            match_start_time = datetime.datetime.now()
-            matches = re.finditer(pattern.regex, text, flags=flags)
-            match_time = datetime.datetime.now() - match_start_time
-            logger.debug(
-                "--- match_time[%s]: %s.%s seconds",
-                pattern.name,
-                match_time.seconds,
-                match_time.microseconds,
-            )
+        text_matches = None
+        batch_flags, batch_matches = (_current_batch_matches.get() or {}).get(
+            id(self), (None, {})
+        )
+        if batch_flags == flags:
+            text_matches = batch_matches.get(text)
+        if text_matches is None:
+            text_matches = self._match_patterns([text], flags)[0]
 
-            for match in matches:
-                start, end = match.span()
+        results = []
+        for pattern, spans, validation_results, duration in text_matches:
+            results_start_time = time.perf_counter()
+            for (start, end), validation_result in zip(spans, validation_results):
                 current_match = text[start:end]
-
-                # Skip empty results
-                if current_match == "":
-                    continue
-
                 score = pattern.score
 
-                validation_result = self.validate_result(current_match)
                 description = self.build_regex_explanation(
                     self.name, pattern.name, pattern.regex, score, validation_result
                 )
@@ -227,6 +371,15 @@ class PatternRecognizer(LocalRecognizer):
                 # Update analysis explanation score following validation or invalidation
                 description.score = pattern_result.score
 
+            match_time = duration + time.perf_counter() - results_start_time
+            metrics_registry.observe(
+                "pattern_duration_seconds",
+                match_time,
+                recognizer=self.name,
+                pattern=pattern.name,
+            )
+            logger.debug("--- match_time[%s]: %.6f seconds", pattern.name, match_time)
+
         results = EntityRecognizer.remove_duplicates(results)
         return results
 
@@ -1,45 +1,71 @@
 """Predefined recognizers package. Holds all the default recognizers."""
+import importlib
+from typing import List
 
-from presidio_analyzer.predefined_recognizers.transformers_recognizer import (
-    TransformersRecognizer,
-)
-from .aba_routing_recognizer import AbaRoutingRecognizer
-from .credit_card_recognizer import CreditCardRecognizer
-from .crypto_recognizer import CryptoRecognizer
-from .date_recognizer import DateRecognizer
-from .email_recognizer import EmailRecognizer
-from .iban_recognizer import IbanRecognizer
-from .ip_recognizer import IpRecognizer
-from .medical_license_recognizer import MedicalLicenseRecognizer
-from .phone_recognizer import PhoneRecognizer
-from .sg_fin_recognizer import SgFinRecognizer
-from .spacy_recognizer import SpacyRecognizer
-from .stanza_recognizer import StanzaRecognizer
-from .uk_nhs_recognizer import NhsRecognizer
-from .url_recognizer import UrlRecognizer
-from .us_bank_recognizer import UsBankRecognizer
-from .us_driver_license_recognizer import UsLicenseRecognizer
-from .us_itin_recognizer import UsItinRecognizer
-from .us_passport_recognizer import UsPassportRecognizer
-from .us_ssn_recognizer import UsSsnRecognizer
-from .es_nif_recognizer import EsNifRecognizer
-from .au_abn_recognizer import AuAbnRecognizer
-from .au_acn_recognizer import AuAcnRecognizer
-from .au_tfn_recognizer import AuTfnRecognizer
-from .au_medicare_recognizer import AuMedicareRecognizer
-from .it_driver_license_recognizer import ItDriverLicenseRecognizer
-from .it_fiscal_code_recognizer import ItFiscalCodeRecognizer
-from .it_vat_code import ItVatCodeRecognizer
-from .it_identity_card_recognizer import ItIdentityCardRecognizer
-from .it_passport_recognizer import ItPassportRecognizer
-from .in_pan_recognizer import InPanRecognizer
+# Recognizers are imported on first access, as some of them import
+# heavy dependencies (e.g. phonenumbers, tldextract)
+_LAZY_IMPORTS = {
+    "TransformersRecognizer": ".transformers_recognizer",
+    "AbaRoutingRecognizer": ".aba_routing_recognizer",
+    "CreditCardRecognizer": ".credit_card_recognizer",
+    "CryptoRecognizer": ".crypto_recognizer",
+    "DateRecognizer": ".date_recognizer",
+    "EmailRecognizer": ".email_recognizer",
+    "IbanRecognizer": ".iban_recognizer",
+    "IpRecognizer": ".ip_recognizer",
+    "MedicalLicenseRecognizer": ".medical_license_recognizer",
+    "PhoneRecognizer": ".phone_recognizer",
+    "SgFinRecognizer": ".sg_fin_recognizer",
+    "SpacyRecognizer": ".spacy_recognizer",
+    "StanzaRecognizer": ".stanza_recognizer",
+    "NhsRecognizer": ".uk_nhs_recognizer",
+    "UrlRecognizer": ".url_recognizer",
+    "UsBankRecognizer": ".us_bank_recognizer",
+    "UsLicenseRecognizer": ".us_driver_license_recognizer",
+    "UsItinRecognizer": ".us_itin_recognizer",
+    "UsPassportRecognizer": ".us_passport_recognizer",
+    "UsSsnRecognizer": ".us_ssn_recognizer",
+    "EsNifRecognizer": ".es_nif_recognizer",
+    "AuAbnRecognizer": ".au_abn_recognizer",
+    "AuAcnRecognizer": ".au_acn_recognizer",
+    "AuTfnRecognizer": ".au_tfn_recognizer",
+    "AuMedicareRecognizer": ".au_medicare_recognizer",
+    "ItDriverLicenseRecognizer": ".it_driver_license_recognizer",
+    "ItFiscalCodeRecognizer": ".it_fiscal_code_recognizer",
+    "ItVatCodeRecognizer": ".it_vat_code",
+    "ItIdentityCardRecognizer": ".it_identity_card_recognizer",
+    "ItPassportRecognizer": ".it_passport_recognizer",
+    "InPanRecognizer": ".in_pan_recognizer",
+}
 
-NLP_RECOGNIZERS = {
-    "spacy": SpacyRecognizer,
-    "stanza": StanzaRecognizer,
-    "transformers": TransformersRecognizer,
+_NLP_RECOGNIZER_NAMES = {
+    "spacy": "SpacyRecognizer",
+    "stanza": "StanzaRecognizer",
+    "transformers": "TransformersRecognizer",
 }
 
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    elif name == "NLP_RECOGNIZERS":
+        value = {
+            engine_name: __getattr__(recognizer_name)
+            for engine_name, recognizer_name in _NLP_RECOGNIZER_NAMES.items()
+        }
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Kept in the module's globals, so later accesses get the same object
+    # (e.g. changes made to NLP_RECOGNIZERS are kept)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | {"NLP_RECOGNIZERS"})
+
+
 __all__ = [
     "AbaRoutingRecognizer",
     "CreditCardRecognizer",
@@ -1,6 +1,11 @@
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Sequence
 
 from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.predefined_recognizers.vectorized_checksums import (
+    should_vectorize,
+    validate_digits,
+    weighted_sum,
+)
 
 
 class AuAbnRecognizer(PatternRecognizer):
@@ -86,6 +91,36 @@ class AuAbnRecognizer(PatternRecognizer):
         remainder = sum_product % 89
         return remainder == 0
 
+    def validate_results(self, pattern_texts: Sequence[str]) -> List[Optional[bool]]:
+        """
+        Validate a batch of detected texts, computing the weighted checksums with NumPy.
+
+        :param pattern_texts: the texts to validate
+        :return: A bool for each text, indicating whether the validation was successful.
+        """
+        if not should_vectorize(self, AuAbnRecognizer, pattern_texts):
+            return super().validate_results(pattern_texts)
+        sanitized = [
+            self.__sanitize_value(pattern_text, self.replacement_pairs)
+            for pattern_text in pattern_texts
+        ]
+        return validate_digits(
+            pattern_texts,
+            sanitized,
+            self.__is_valid_checksum,
+            self.validate_result,
+            length=11,
+        )
+
+    @staticmethod
+    def __is_valid_checksum(digits: "np.ndarray") -> "np.ndarray":  # noqa F821
+        # The first digit is decremented, 0 becoming 9
+        first_digit = digits[:, 0] - 1
+        first_digit[first_digit < 0] = 9
+        weights = [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+        sum_product = first_digit * 10 + weighted_sum(digits[:, 1:], weights)
+        return sum_product % 89 == 0
+
     @staticmethod
     def __sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
         for search_string, replacement_string in replacement_pairs:
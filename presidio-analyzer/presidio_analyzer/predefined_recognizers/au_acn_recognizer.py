@@ -1,6 +1,11 @@
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Sequence
 
 from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.predefined_recognizers.vectorized_checksums import (
+    should_vectorize,
+    validate_digits,
+    weighted_sum,
+)
 
 
 class AuAcnRecognizer(PatternRecognizer):
@@ -83,6 +88,32 @@ class AuAcnRecognizer(PatternRecognizer):
         complement = 10 - remainder
         return complement == acn_list[-1]
 
+    def validate_results(self, pattern_texts: Sequence[str]) -> List[Optional[bool]]:
+        """
+        Validate a batch of detected texts, computing the weighted checksums with NumPy.
+
+        :param pattern_texts: the texts to validate
+        :return: A bool for each text, indicating whether the validation was successful.
+        """
+        if not should_vectorize(self, AuAcnRecognizer, pattern_texts):
+            return super().validate_results(pattern_texts)
+        sanitized = [
+            self.__sanitize_value(pattern_text, self.replacement_pairs)
+            for pattern_text in pattern_texts
+        ]
+        return validate_digits(
+            pattern_texts,
+            sanitized,
+            self.__is_valid_checksum,
+            self.validate_result,
+            length=9,
+        )
+
+    @staticmethod
+    def __is_valid_checksum(digits: "np.ndarray") -> "np.ndarray":  # noqa F821
+        remainder = weighted_sum(digits, [8, 7, 6, 5, 4, 3, 2, 1]) % 10
+        return 10 - remainder == digits[:, -1]
+
     @staticmethod
     def __sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
         for search_string, replacement_string in replacement_pairs:
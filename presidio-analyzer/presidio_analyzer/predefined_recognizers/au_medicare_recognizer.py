@@ -1,6 +1,11 @@
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Sequence
 
 from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.predefined_recognizers.vectorized_checksums import (
+    should_vectorize,
+    validate_digits,
+    weighted_sum,
+)
 
 
 class AuMedicareRecognizer(PatternRecognizer):
@@ -82,6 +87,32 @@ class AuMedicareRecognizer(PatternRecognizer):
         remainder = sum_product % 10
         return remainder == medicare_list[8]
 
+    def validate_results(self, pattern_texts: Sequence[str]) -> List[Optional[bool]]:
+        """
+        Validate a batch of detected texts, computing the weighted checksums with NumPy.
+
+        :param pattern_texts: the texts to validate
+        :return: A bool for each text, indicating whether the validation was successful.
+        """
+        if not should_vectorize(self, AuMedicareRecognizer, pattern_texts):
+            return super().validate_results(pattern_texts)
+        sanitized = [
+            self.__sanitize_value(pattern_text, self.replacement_pairs)
+            for pattern_text in pattern_texts
+        ]
+        return validate_digits(
+            pattern_texts,
+            sanitized,
+            self.__is_valid_checksum,
+            self.validate_result,
+            length=10,
+        )
+
+    @staticmethod
+    def __is_valid_checksum(digits: "np.ndarray") -> "np.ndarray":  # noqa F821
+        remainder = weighted_sum(digits, [1, 3, 7, 9, 1, 3, 7, 9]) % 10
+        return remainder == digits[:, 8]
+
     @staticmethod
     def __sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
         for search_string, replacement_string in replacement_pairs:
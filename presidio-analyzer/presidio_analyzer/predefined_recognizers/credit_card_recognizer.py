@@ -1,6 +1,11 @@
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Sequence
 
 from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.predefined_recognizers.vectorized_checksums import (
+    luhn_checksum,
+    should_vectorize,
+    validate_digits,
+)
 
 
 class CreditCardRecognizer(PatternRecognizer):
@@ -78,6 +83,23 @@ class CreditCardRecognizer(PatternRecognizer):
             checksum += sum(digits_of(str(d * 2)))
         return checksum % 10 == 0
 
+    def validate_results(self, pattern_texts: Sequence[str]) -> List[Optional[bool]]:
+        """
+        Validate a batch of detected texts, computing the Luhn checksums with NumPy.
+
+        :param pattern_texts: the texts to validate
+        :return: A bool for each text, indicating whether the validation was successful.
+        """
+        if not should_vectorize(self, CreditCardRecognizer, pattern_texts):
+            return super().validate_results(pattern_texts)
+        sanitized = [
+            self.__sanitize_value(pattern_text, self.replacement_pairs)
+            for pattern_text in pattern_texts
+        ]
+        return validate_digits(
+            pattern_texts, sanitized, luhn_checksum, self.validate_result
+        )
+
     @staticmethod
     def __sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
         for search_string, replacement_string in replacement_pairs:
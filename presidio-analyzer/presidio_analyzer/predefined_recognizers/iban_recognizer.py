@@ -1,5 +1,7 @@
 import logging
 import string
+import time
+from functools import lru_cache
 from typing import Tuple, List, Dict, Optional
 
 import regex as re
@@ -10,12 +12,14 @@ from presidio_analyzer import (
     RecognizerResult,
     EntityRecognizer,
 )
+from presidio_analyzer.metrics import metrics_registry
 from presidio_analyzer.nlp_engine import NlpArtifacts
 from presidio_analyzer.predefined_recognizers.iban_patterns import (
     regex_per_country,
     BOS,
     EOS,
 )
+from presidio_analyzer.text_prefilter import TextPrefilter
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -68,6 +72,7 @@ class IbanRecognizer(PatternRecognizer):
         self.exact_match = exact_match
         self.BOSEOS = bos_eos if exact_match else ()
         self.flags = regex_flags
+        self._country_regexes = _compile_country_regexes(tuple(self.BOSEOS))
         patterns = patterns if patterns else self.PATTERNS
         context = context if context else self.CONTEXT
         super().__init__(
@@ -87,15 +92,23 @@ class IbanRecognizer(PatternRecognizer):
             # score = EntityRecognizer.MIN_SCORE
             result = False
             if is_valid_checksum:
-                if self.__is_valid_format(pattern_text, self.BOSEOS):
+                if self.__is_valid_format(pattern_text):
                     result = True
-                elif self.__is_valid_format(pattern_text.upper(), self.BOSEOS):
-                    result = None
+                else:
+                    upper_text = pattern_text.upper()
+                    if upper_text != pattern_text and self.__is_valid_format(
+                        upper_text
+                    ):
+                        result = None
             return result
         except ValueError:
             logger.error("Failed to validate text %s", pattern_text)
             return False
 
+    def compile_patterns(self, flags: Optional[int] = None) -> None:
+        """Compile the regexes of all patterns, with the recognizer's flags."""
+        super().compile_patterns(flags if flags else self.flags)
+
     def analyze(
         self,
         text: str,
@@ -126,54 +139,77 @@ class IbanRecognizer(PatternRecognizer):
         :param flags: regex flags
         :return: A list of RecognizerResult
         """
+        text_prefilter = TextPrefilter.for_text(text)
         results = []
         for pattern in self.patterns:
-            matches = re.finditer(pattern.regex, text, flags=self.flags)
+            if not self._prefilter_matches(text_prefilter, pattern, self.flags):
+                continue
+            match_start_time = time.perf_counter()
+            matches = pattern.compile(self.flags).finditer(text)
 
             for match in matches:
+                start = match.start()
+                # Try the longest candidate first, ending at each optional group
+                tried_ends = set()
                 for grp_num in reversed(range(1, len(match.groups()) + 1)):
-                    start = match.span(0)[0]
-                    end = (
-                        match.span(grp_num)[1]
-                        if match.span(grp_num)[1] > 0
-                        else match.span(0)[1]
-                    )
+                    group_end = match.end(grp_num)
+                    end = group_end if group_end > 0 else match.end()
+                    if end in tried_ends:
+                        continue
+                    tried_ends.add(end)
                     current_match = text[start:end]
 
                     # Skip empty results
                     if current_match == "":
                         continue
 
-                    score = pattern.score
-
                     validation_result = self.validate_result(current_match)
-                    description = PatternRecognizer.build_regex_explanation(
-                        self.name, pattern.name, pattern.regex, score, validation_result
-                    )
-                    pattern_result = RecognizerResult(
-                        entity_type=self.supported_entities[0],
-                        start=start,
-                        end=end,
-                        score=score,
-                        analysis_explanation=description,
-                        recognition_metadata={
-                            RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
-                            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
-                        },
-                    )
-
-                    if validation_result is not None:
-                        if validation_result:
-                            pattern_result.score = EntityRecognizer.MAX_SCORE
-                        else:
-                            pattern_result.score = EntityRecognizer.MIN_SCORE
-
-                    if pattern_result.score > EntityRecognizer.MIN_SCORE:
-                        results.append(pattern_result)
-                        break
+                    if validation_result is None or validation_result:
+                        score = (
+                            EntityRecognizer.MAX_SCORE
+                            if validation_result
+                            else pattern.score
+                        )
+                        if score > EntityRecognizer.MIN_SCORE:
+                            results.append(
+                                self.__create_result(
+                                    pattern, start, end, validation_result, score
+                                )
+                            )
+                            break
+
+            metrics_registry.observe(
+                "pattern_duration_seconds",
+                time.perf_counter() - match_start_time,
+                recognizer=self.name,
+                pattern=pattern.name,
+            )
 
         return results
 
+    def __create_result(
+        self,
+        pattern: Pattern,
+        start: int,
+        end: int,
+        validation_result: Optional[bool],
+        score: float,
+    ) -> RecognizerResult:
+        description = PatternRecognizer.build_regex_explanation(
+            self.name, pattern.name, pattern.regex, pattern.score, validation_result
+        )
+        return RecognizerResult(
+            entity_type=self.supported_entities[0],
+            start=start,
+            end=end,
+            score=score,
+            analysis_explanation=description,
+            recognition_metadata={
+                RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+            },
+        )
+
     @staticmethod
     def __number_iban(iban: str, letters: Dict[int, str]) -> str:
         return (iban[4:] + iban[:4]).translate(letters)
@@ -184,23 +220,31 @@ class IbanRecognizer(PatternRecognizer):
         number_iban = IbanRecognizer.__number_iban(transformed_iban, letters)
         return "{:0>2}".format(98 - (int(number_iban) % 97))
 
-    @staticmethod
-    def __is_valid_format(
-        iban: str,
-        bos_eos: Tuple[str, str] = (BOS, EOS),
-        flags: int = re.DOTALL | re.MULTILINE,
-    ) -> bool:
-        country_code = iban[:2]
-        if country_code in regex_per_country:
-            country_regex = regex_per_country.get(country_code, "")
-            if bos_eos and country_regex:
-                country_regex = bos_eos[0] + country_regex + bos_eos[1]
-            return country_regex and re.match(country_regex, iban, flags=flags)
-
-        return False
+    def __is_valid_format(self, iban: str) -> bool:
+        country_regex = self._country_regexes.get(iban[:2])
+        return bool(country_regex and country_regex.match(iban))
 
     @staticmethod
     def __sanitize_value(text: str, replacement_pairs: List[Tuple[str, str]]) -> str:
         for search_string, replacement_string in replacement_pairs:
             text = text.replace(search_string, replacement_string)
         return text
+
+
+@lru_cache(maxsize=None)
+def _compile_country_regexes(bos_eos: Tuple[str, ...]) -> Dict[str, "re.Pattern"]:
+    """
+    Compile the IBAN format regex of each country, once per BOS/EOS mode.
+
+    :param bos_eos: Strings added before and after each regex, if any
+    """
+    country_regexes = {}
+    for country_code, country_regex in regex_per_country.items():
+        if not country_regex:
+            continue
+        if bos_eos:
+            country_regex = bos_eos[0] + country_regex + bos_eos[1]
+        country_regexes[country_code] = re.compile(
+            country_regex, flags=re.DOTALL | re.MULTILINE
+        )
+    return country_regexes
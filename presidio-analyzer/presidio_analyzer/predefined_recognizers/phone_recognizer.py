@@ -1,7 +1,20 @@
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import phonenumbers
 
+try:
+    # Internals of python-phonenumbers 8.x and 9.x (see setup.py),
+    # without them every region is matched against the whole text
+    from phonenumbers.phonenumbermatcher import _PATTERN as CANDIDATE_PATTERN
+    from phonenumbers.phonenumberutil import (
+        _maybe_strip_national_prefix_carrier_code as strip_national_prefix,
+    )
+except ImportError:
+    CANDIDATE_PATTERN = None
+    strip_national_prefix = None
+
 from presidio_analyzer import (
     RecognizerResult,
     LocalRecognizer,
@@ -10,6 +23,8 @@ from presidio_analyzer import (
 )
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
+DIGIT_GROUPS = re.compile(r"\d+")
+
 
 class PhoneRecognizer(LocalRecognizer):
     """Recognize multi-regional phone numbers.
@@ -23,6 +38,10 @@ class PhoneRecognizer(LocalRecognizer):
     SCORE = 0.4
     CONTEXT = ["phone", "number", "telephone", "cell", "cellphone", "mobile", "call"]
     DEFAULT_SUPPORTED_REGIONS = ("US", "UK", "DE", "FE", "IL", "IN", "CA", "BR")
+    # Characters around a candidate checked by python-phonenumbers,
+    # e.g. a letter before it or a time suffix (":30") after it
+    CANDIDATE_PREFIX_LENGTH = 1
+    CANDIDATE_SUFFIX_LENGTH = 3
 
     def __init__(
         self,
@@ -50,27 +69,71 @@ class PhoneRecognizer(LocalRecognizer):
     ) -> List[RecognizerResult]:
         """Analyzes text to detect phone numbers using python-phonenumbers.
 
-        Iterates over entities, fetching regions, then matching regional
-        phone numbers patterns against the text.
+        The text is scanned once for phone number candidates (digit sequences
+        with phone punctuation), using python-phonenumbers' candidate pattern.
+        Each candidate is then matched against the regional phone numbers
+        patterns, which are cached per candidate string. Regions whose
+        national number patterns can't match any of the candidate's digits
+        are skipped, so that checking all regions costs about the same as a few.
         :param text: Text to be analyzed
         :param entities: Entities this recognizer can detect
         :param nlp_artifacts: Additional metadata from the NLP engine
         :return: List of phone numbers RecognizerResults
         """
+        if CANDIDATE_PATTERN is None:
+            return self._analyze_per_region(text)
+
         results = []
-        for region in self.supported_regions:
-            for match in phonenumbers.PhoneNumberMatcher(text, region, leniency=1):
+        for candidate in CANDIDATE_PATTERN.finditer(text):
+            # The characters around the candidate are used for validating it
+            window_start = max(candidate.start() - self.CANDIDATE_PREFIX_LENGTH, 0)
+            window_end = candidate.end() + self.CANDIDATE_SUFFIX_LENGTH
+            window = text[window_start:window_end]
+            own_start = candidate.start() - window_start
+            own_end = candidate.end() - window_start
+            candidate_text = candidate.group()
+            international = candidate_text.startswith("+")
+
+            digit_groups = tuple(
+                phonenumbers.normalize_digits_only(group)
+                for group in DIGIT_GROUPS.findall(candidate_text)
+            )
+            for region in _get_candidate_regions(
+                digit_groups,
+                "+" in candidate_text,
+                tuple(self.supported_regions),
+            ):
+                matches = [
+                    (start, end)
+                    for start, end in _match_phone_numbers(window, region)
+                    if own_start <= start and end <= own_end
+                ]
                 results += [
-                    self._get_recognizer_result(match, text, region, nlp_artifacts)
+                    self._get_recognizer_result(
+                        window_start + start, window_start + end, region
+                    )
+                    for start, end in matches
                 ]
+                # Numbers in international format are parsed the same in all regions
+                if international and matches == [(own_start, own_end)]:
+                    break
 
         return EntityRecognizer.remove_duplicates(results)
 
-    def _get_recognizer_result(self, match, text, region, nlp_artifacts):
+    def _analyze_per_region(self, text: str) -> List[RecognizerResult]:
+        """Match the phone numbers of each region against the whole text."""
+        results = [
+            self._get_recognizer_result(match.start, match.end, region)
+            for region in self.supported_regions
+            for match in phonenumbers.PhoneNumberMatcher(text, region, leniency=1)
+        ]
+        return EntityRecognizer.remove_duplicates(results)
+
+    def _get_recognizer_result(self, start: int, end: int, region: str):
         result = RecognizerResult(
             entity_type="PHONE_NUMBER",
-            start=match.start,
-            end=match.end,
+            start=start,
+            end=end,
             score=self.SCORE,
             analysis_explanation=self._get_analysis_explanation(region),
             recognition_metadata={
@@ -88,3 +151,152 @@ class PhoneRecognizer(LocalRecognizer):
             textual_explanation=f"Recognized as {region} region phone number, "
             f"using PhoneRecognizer",
         )
+
+
+@lru_cache(maxsize=10000)
+def _match_phone_numbers(text: str, region: str) -> Tuple[Tuple[int, int], ...]:
+    """Return the (start, end) offsets of the phone numbers of a region in text."""
+    return tuple(
+        (match.start, match.end)
+        for match in phonenumbers.PhoneNumberMatcher(text, region, leniency=1)
+    )
+
+
+class _RegionDigitsFilter:
+    """
+    Check whether a region's national format phone numbers could be in a candidate.
+
+    Phone numbers are found in a part of a candidate starting and ending
+    at digit groups boundaries. Once its national prefix (and possibly its
+    country code) is stripped, a valid number has to match one of
+    the number types' patterns of a region sharing the country code.
+    Numbers with a country code (+44...) are parsed the same in all regions,
+    and aren't checked here.
+
+    :param metadata: The region's phone number metadata
+    """
+
+    def __init__(self, metadata: phonenumbers.PhoneMetadata):
+        self.metadata = metadata
+        self.country_code = str(metadata.country_code)
+        self.international_prefix = (
+            re.compile(metadata.international_prefix)
+            if metadata.international_prefix
+            else None
+        )
+        self.national_prefix = (
+            re.compile(metadata.national_prefix_for_parsing)
+            if metadata.national_prefix_for_parsing
+            else None
+        )
+        self.national_number_pattern = _get_national_number_pattern(
+            metadata.country_code
+        )
+
+    def may_match(self, digit_groups: Tuple[str, ...]) -> bool:
+        """Return whether a national format phone number could be in the candidate."""
+        digits = "".join(digit_groups)
+        starts, ends = [], []
+        position = 0
+        for group in digit_groups:
+            starts.append(position)
+            position += len(group)
+            ends.append(position)
+
+        for start in starts:
+            if self.international_prefix and self.international_prefix.match(
+                digits, start
+            ):
+                return True
+            for end in ends:
+                if end > start and self._has_national_number(digits[start:end]):
+                    return True
+        return False
+
+    def _has_national_number(self, digits: str) -> bool:
+        """Check whether the digits could be parsed to a valid national number."""
+        numbers = [digits]
+        # Numbers may start with the country code, without a plus sign
+        if digits.startswith(self.country_code):
+            numbers.append(digits[len(self.country_code) :])
+        if self.metadata.national_prefix_transform_rule:
+            for number in list(numbers):
+                _, national_number, _ = strip_national_prefix(number, self.metadata)
+                numbers.append(national_number)
+        elif self.national_prefix:
+            for number in list(numbers):
+                prefix = self.national_prefix.match(number)
+                if prefix:
+                    numbers.append(number[prefix.end() :])
+
+        return any(self.national_number_pattern.fullmatch(number) for number in numbers)
+
+
+NUMBER_TYPES = (
+    "fixed_line",
+    "mobile",
+    "toll_free",
+    "premium_rate",
+    "shared_cost",
+    "personal_number",
+    "voip",
+    "pager",
+    "uan",
+    "voicemail",
+)
+
+
+@lru_cache(maxsize=None)
+def _get_national_number_pattern(country_code: int) -> "re.Pattern":
+    """Return a pattern matching the valid national numbers of a country code."""
+    patterns = set()
+    for region in phonenumbers.COUNTRY_CODE_TO_REGION_CODE.get(country_code, ()):
+        metadata = phonenumbers.PhoneMetadata.metadata_for_region(region)
+        if metadata is None:
+            continue
+        for number_type in NUMBER_TYPES:
+            desc = getattr(metadata, number_type)
+            if desc is not None and desc.national_number_pattern:
+                patterns.add(desc.national_number_pattern)
+    return re.compile("|".join(f"(?:{pattern})" for pattern in sorted(patterns)))
+
+
+_region_filters = {}
+
+
+@lru_cache(maxsize=None)
+def _get_region_filter(region: str) -> Optional[_RegionDigitsFilter]:
+    """Return the region's filter, shared by regions parsing numbers the same way."""
+    metadata = phonenumbers.PhoneMetadata.metadata_for_region(region)
+    if metadata is None:
+        return None
+    key = (
+        metadata.country_code,
+        metadata.international_prefix,
+        metadata.national_prefix_for_parsing,
+        # Transformations depend on the region's patterns
+        region if metadata.national_prefix_transform_rule else None,
+    )
+    if key not in _region_filters:
+        _region_filters[key] = _RegionDigitsFilter(metadata)
+    return _region_filters[key]
+
+
+@lru_cache(maxsize=10000)
+def _get_candidate_regions(
+    digit_groups: Tuple[str, ...], has_plus: bool, regions: Tuple[str, ...]
+) -> List[str]:
+    """Return the regions in which phone numbers could be found in a candidate."""
+    candidate_regions = []
+    filter_results = {}
+    for i, region in enumerate(regions):
+        region_filter = _get_region_filter(region)
+        if region_filter not in filter_results:
+            # Unknown regions only parse numbers with a country code
+            filter_results[region_filter] = (
+                region_filter is not None and region_filter.may_match(digit_groups)
+            )
+        # Numbers with a country code are found by the first region
+        if (has_plus and i == 0) or filter_results[region_filter]:
+            candidate_regions.append(region)
+    return candidate_regions
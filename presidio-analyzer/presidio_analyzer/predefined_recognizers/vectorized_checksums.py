@@ -0,0 +1,105 @@
+"""Checksums computed with NumPy over batches of matched texts."""
+from typing import Callable, List, Optional, Sequence, Tuple, Type
+
+from presidio_analyzer import PatternRecognizer
+
+# Below this number of texts, validating one text at a time is faster
+# than converting the batch to an array
+MIN_VECTORIZED_BATCH = 16
+
+
+def should_vectorize(
+    recognizer: PatternRecognizer,
+    recognizer_class: Type[PatternRecognizer],
+    pattern_texts: Sequence[str],
+) -> bool:
+    """
+    Return whether to validate a batch with the class's vectorized checksum.
+
+    Small batches, and subclasses overriding `validate_result`,
+    are validated one text at a time.
+
+    :param recognizer: The recognizer validating the batch
+    :param recognizer_class: The class implementing the vectorized checksum
+    :param pattern_texts: The texts to validate
+    """
+    return (
+        len(pattern_texts) >= MIN_VECTORIZED_BATCH
+        and type(recognizer).validate_result is recognizer_class.validate_result
+    )
+
+
+def digit_matrix(
+    texts: Sequence[str], length: Optional[int] = None
+) -> Tuple["np.ndarray", List[int], List[int]]:  # noqa F821
+    """
+    Convert texts of ASCII digits to a matrix of digits, one row per text.
+
+    :param texts: The texts to convert
+    :param length: Number of digits of the converted texts, texts of other
+    lengths aren't converted. If None, texts of any length are converted,
+    right aligned and padded with leading zeros.
+    :return: The matrix, the indices of the converted texts
+    and the indices of the other texts
+    """
+    import numpy as np
+
+    rows = []
+    others = []
+    for i, text in enumerate(texts):
+        if text.isascii() and text.isdigit() and length in (None, len(text)):
+            rows.append(i)
+        else:
+            others.append(i)
+
+    width = length
+    if width is None:
+        width = max((len(texts[i]) for i in rows), default=0)
+    digits = "".join(texts[i].rjust(width, "0") for i in rows).encode("ascii")
+    matrix = np.frombuffer(digits, dtype=np.uint8).reshape(len(rows), width)
+    return matrix.astype(np.int64) - ord("0"), rows, others
+
+
+def validate_digits(
+    pattern_texts: Sequence[str],
+    digit_texts: Sequence[str],
+    checksum: Callable[["np.ndarray"], "np.ndarray"],  # noqa F821
+    validate_result: Callable[[str], Optional[bool]],
+    length: Optional[int] = None,
+) -> List[Optional[bool]]:
+    """
+    Validate a batch of texts with a checksum computed over their digits.
+
+    :param pattern_texts: The matched texts
+    :param digit_texts: The digits of each matched text, after sanitization
+    :param checksum: Function returning whether each row of a digit matrix is valid
+    :param validate_result: Validation of a single text, used for texts whose
+    digits aren't `length` ASCII digits
+    :param length: Number of digits of the texts, any number if None
+    :return: The validation result of each text
+    """
+    matrix, rows, others = digit_matrix(digit_texts, length)
+    results: List[Optional[bool]] = [None] * len(pattern_texts)
+    for i, valid in zip(rows, checksum(matrix).tolist()):
+        results[i] = valid
+    for i in others:
+        results[i] = validate_result(pattern_texts[i])
+    return results
+
+
+def luhn_checksum(matrix: "np.ndarray") -> "np.ndarray":  # noqa F821
+    """Return whether each row of right aligned digits passes the Luhn check."""
+    reversed_digits = matrix[:, ::-1]
+    doubled = reversed_digits[:, 1::2] * 2
+    total = reversed_digits[:, ::2].sum(axis=1)
+    total += (doubled - 9 * (doubled > 9)).sum(axis=1)
+    return total % 10 == 0
+
+
+def weighted_sum(
+    matrix: "np.ndarray", weights: Sequence[int]  # noqa F821
+) -> "np.ndarray":  # noqa F821
+    """Return the sum of each row's first digits, multiplied by the weights."""
+    import numpy as np
+
+    return matrix[:, : len(weights)] @ np.asarray(weights, dtype=np.int64)
@@ -1,47 +1,13 @@
 import copy
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, List, Iterable, Union, Type, Dict
-from presidio_analyzer.nlp_engine.transformers_nlp_engine import (
-    TransformersNlpEngine,
-)
 
 import yaml
 
 from presidio_analyzer import EntityRecognizer, PatternRecognizer
-from presidio_analyzer.nlp_engine import NlpEngine, SpacyNlpEngine, StanzaNlpEngine
-from presidio_analyzer.predefined_recognizers import (
-    CreditCardRecognizer,
-    CryptoRecognizer,
-    DateRecognizer,
-    EmailRecognizer,
-    IbanRecognizer,
-    IpRecognizer,
-    MedicalLicenseRecognizer,
-    NhsRecognizer,
-    PhoneRecognizer,
-    UrlRecognizer,
-    UsBankRecognizer,
-    UsLicenseRecognizer,
-    UsItinRecognizer,
-    UsPassportRecognizer,
-    UsSsnRecognizer,
-    SgFinRecognizer,
-    SpacyRecognizer,
-    EsNifRecognizer,
-    StanzaRecognizer,
-    AuAbnRecognizer,
-    AuAcnRecognizer,
-    AuTfnRecognizer,
-    AuMedicareRecognizer,
-    ItDriverLicenseRecognizer,
-    ItFiscalCodeRecognizer,
-    ItVatCodeRecognizer,
-    TransformersRecognizer,
-    ItPassportRecognizer,
-    ItIdentityCardRecognizer,
-    InPanRecognizer,
-)
+from presidio_analyzer.nlp_engine import NlpEngine
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -61,19 +27,79 @@ class RecognizerRegistry:
         else:
             self.recognizers = []
 
+        # Languages whose predefined recognizers are loaded on first use
+        self._lazy_languages: Dict[str, NlpEngine] = {}
+        self._lazy_lock = threading.Lock()
+
+    def get_lazy_languages(self) -> List[str]:
+        """Return the languages whose predefined recognizers aren't loaded yet."""
+        return list(self._lazy_languages)
+
     def load_predefined_recognizers(
-        self, languages: Optional[List[str]] = None, nlp_engine: NlpEngine = None
+        self,
+        languages: Optional[List[str]] = None,
+        nlp_engine: NlpEngine = None,
+        lazy: bool = False,
     ) -> None:
         """
         Load the existing recognizers into memory.
 
         :param languages: List of languages for which to load recognizers
         :param nlp_engine: The NLP engine to use.
+        :param lazy: Whether to load the recognizers of each language
+        only when recognizers of that language are first requested.
         :return: None
         """
         if not languages:
             languages = ["en"]
 
+        if lazy:
+            with self._lazy_lock:
+                for lang in languages:
+                    self._lazy_languages[lang] = nlp_engine
+            return
+
+        for lang in languages:
+            self.recognizers.extend(
+                self._create_predefined_recognizers(lang, nlp_engine)
+            )
+
+    def _create_predefined_recognizers(
+        self, language: str, nlp_engine: NlpEngine
+    ) -> List[EntityRecognizer]:
+        """Create the predefined recognizers of a single language."""
+        # Imported here, as importing all predefined recognizers is slow
+        # and not needed when using custom recognizers only
+        from presidio_analyzer.predefined_recognizers import (
+            CreditCardRecognizer,
+            CryptoRecognizer,
+            DateRecognizer,
+            EmailRecognizer,
+            IbanRecognizer,
+            IpRecognizer,
+            MedicalLicenseRecognizer,
+            NhsRecognizer,
+            PhoneRecognizer,
+            UrlRecognizer,
+            UsBankRecognizer,
+            UsLicenseRecognizer,
+            UsItinRecognizer,
+            UsPassportRecognizer,
+            UsSsnRecognizer,
+            SgFinRecognizer,
+            EsNifRecognizer,
+            AuAbnRecognizer,
+            AuAcnRecognizer,
+            AuTfnRecognizer,
+            AuMedicareRecognizer,
+            ItDriverLicenseRecognizer,
+            ItFiscalCodeRecognizer,
+            ItVatCodeRecognizer,
+            ItPassportRecognizer,
+            ItIdentityCardRecognizer,
+            InPanRecognizer,
+        )
+
         nlp_recognizer = self._get_nlp_recognizer(nlp_engine)
         recognizers_map = {
             "en": [
@@ -111,34 +137,57 @@ class RecognizerRegistry:
                 UrlRecognizer,
             ],
         }
-        for lang in languages:
-            lang_recognizers = [rc() for rc in recognizers_map.get(lang, [])]
-            self.recognizers.extend(lang_recognizers)
-            all_recognizers = [
-                rc(supported_language=lang) for rc in recognizers_map.get("ALL", [])
-            ]
-            self.recognizers.extend(all_recognizers)
+        lang_recognizers = [rc() for rc in recognizers_map.get(language, [])]
+        all_recognizers = [
+            rc(supported_language=language) for rc in recognizers_map.get("ALL", [])
+        ]
+        return lang_recognizers + all_recognizers
+
+    def _load_lazy_languages(self, languages: Optional[List[str]] = None) -> None:
+        """
+        Load the predefined recognizers of lazily loaded languages.
+
+        :param languages: Languages to load, all pending languages if None
+        """
+        if not self._lazy_languages:
+            return
+        with self._lazy_lock:
+            if languages is None:
+                languages = list(self._lazy_languages)
+            for lang in languages:
+                if lang not in self._lazy_languages:
+                    continue
+                logger.info(f"Loading predefined recognizers for language {lang}")
+                nlp_engine = self._lazy_languages[lang]
+                self.recognizers.extend(
+                    self._create_predefined_recognizers(lang, nlp_engine)
+                )
+                del self._lazy_languages[lang]
 
     @staticmethod
-    def _get_nlp_recognizer(
-        nlp_engine: NlpEngine,
-    ) -> Union[Type[SpacyRecognizer], Type[StanzaRecognizer]]:
+    def _get_nlp_recognizer(nlp_engine: NlpEngine) -> Type[EntityRecognizer]:
         """Return the recognizer leveraging the selected NLP Engine."""
+        from presidio_analyzer.predefined_recognizers import (
+            NLP_RECOGNIZERS,
+            SpacyRecognizer,
+        )
 
-        if not nlp_engine or type(nlp_engine) is SpacyNlpEngine:
-            return SpacyRecognizer
-        if isinstance(nlp_engine, StanzaNlpEngine):
-            return StanzaRecognizer
-        if isinstance(nlp_engine, TransformersNlpEngine):
-            return TransformersRecognizer
-        else:
-            logger.warning(
-                "nlp engine should be either SpacyNlpEngine,"
-                "StanzaNlpEngine or TransformersNlpEngine"
-            )
-            # Returning default
+        if not nlp_engine:
             return SpacyRecognizer
 
+        # Matching by engine name avoids importing all NLP engines
+        # (and their NLP frameworks) for isinstance checks
+        engine_name = getattr(nlp_engine, "engine_name", None)
+        if engine_name in NLP_RECOGNIZERS:
+            return NLP_RECOGNIZERS[engine_name]
+
+        logger.warning(
+            "nlp engine should be either SpacyNlpEngine,"
+            "StanzaNlpEngine or TransformersNlpEngine"
+        )
+        # Returning default
+        return SpacyRecognizer
+
     def get_recognizers(
         self,
         language: str,
@@ -163,6 +212,8 @@ class RecognizerRegistry:
         if entities is None and all_fields is False:
             raise ValueError("No entities provided")
 
+        self._load_lazy_languages([language])
+
         all_possible_recognizers = copy.copy(self.recognizers)
         if ad_hoc_recognizers:
             all_possible_recognizers.extend(ad_hoc_recognizers)
@@ -219,8 +270,11 @@ class RecognizerRegistry:
         """
         Remove a recognizer based on its name.
 
+        Predefined recognizers of lazily loaded languages are loaded first,
+        so that they are removed as well.
         :param recognizer_name: Name of recognizer to remove
         """
+        self._load_lazy_languages()
         new_recognizers = [
             rec for rec in self.recognizers if rec.name != recognizer_name
         ]
@@ -0,0 +1,147 @@
+import logging
+from typing import Iterable, Iterator, List, Optional
+
+from presidio_analyzer import AnalyzerEngine, RecognizerResult
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class StreamingAnalyzer:
+    """
+    Analyze a text arriving as a stream of chunks (e.g. a chat or a log tail).
+
+    Chunks are buffered until at least min_chunk_size new characters arrived,
+    and the buffer is then analyzed. Entities found early enough in the buffer
+    to be complete, with all their context words available, are final:
+    they are returned with offsets relative to the whole stream,
+    and the text before them is dropped from the buffer.
+    Only a carry-over of the last max_entity_length + context_length characters,
+    and of the entities or context before them, is analyzed again with the next
+    chunks, so that entities crossing a chunk boundary are detected, and each
+    entity is returned exactly once.
+
+    :param analyzer_engine: AnalyzerEngine instance to use, a default one if None
+    :param language: Language of the stream
+    :param max_entity_length: Length in characters of the longest expected entity.
+    Longer entities might be missed or truncated, as might entities of patterns
+    looking further ahead (e.g. a lookahead spanning lines).
+    :param context_length: Number of characters around an entity
+    in which context words are looked for
+    :param min_chunk_size: Minimum number of new characters before the buffer
+    is analyzed. Larger values reduce the overhead of re-analyzing the carry-over.
+    :param kwargs: Additional parameters for `AnalyzerEngine.analyze`
+    """
+
+    def __init__(
+        self,
+        analyzer_engine: Optional[AnalyzerEngine] = None,
+        language: str = "en",
+        max_entity_length: int = 256,
+        context_length: int = 100,
+        min_chunk_size: int = 1000,
+        **kwargs,
+    ):
+        if max_entity_length < 1:
+            raise ValueError("max_entity_length should be a positive number")
+        if context_length < 0 or min_chunk_size < 0:
+            raise ValueError("context_length and min_chunk_size should not be negative")
+        self.analyzer_engine = analyzer_engine or AnalyzerEngine()
+        self.language = language
+        self.max_entity_length = max_entity_length
+        self.context_length = context_length
+        self.min_chunk_size = min_chunk_size
+        self.analyze_kwargs = kwargs
+
+        self._buffer = ""
+        self._buffer_offset = 0
+        self._committed_offset = 0
+
+    @property
+    def offset(self) -> int:
+        """Return the number of characters fed so far."""
+        return self._buffer_offset + len(self._buffer)
+
+    @property
+    def committed_offset(self) -> int:
+        """Return the offset up to which all entities were returned."""
+        return self._committed_offset
+
+    def feed(self, text: str) -> List[RecognizerResult]:
+        """
+        Add the next chunk of the stream.
+
+        :param text: The next chunk of text
+        :return: Entities which became final, with offsets in the whole stream
+        """
+        self._buffer += text
+        lookahead = self.max_entity_length + self.context_length
+        if self.offset - self._committed_offset < lookahead + max(
+            self.min_chunk_size, 1
+        ):
+            return []
+        return self._analyze_buffer(commit_offset=self.offset - lookahead)
+
+    def flush(self) -> List[RecognizerResult]:
+        """
+        End the stream, analyzing the rest of the buffer.
+
+        The analyzer can then be used for a new stream.
+
+        :return: The remaining entities, with offsets in the whole stream
+        """
+        results = []
+        if self._committed_offset < self.offset:
+            results = self._analyze_buffer(commit_offset=self.offset)
+        self._buffer = ""
+        self._buffer_offset = 0
+        self._committed_offset = 0
+        return results
+
+    def analyze_stream(self, texts: Iterable[str]) -> Iterator[RecognizerResult]:
+        """
+        Analyze a whole stream of chunks, yielding entities as they become final.
+
+        :param texts: The chunks of the stream
+        """
+        for text in texts:
+            yield from self.feed(text)
+        yield from self.flush()
+
+    def _analyze_buffer(self, commit_offset: int) -> List[RecognizerResult]:
+        """
+        Analyze the buffer and return the entities starting before commit_offset.
+
+        Entities starting before the committed offset were already returned
+        by a previous analysis of the carry-over, and are skipped.
+        """
+        results = self.analyzer_engine.analyze(
+            text=self._buffer, language=self.language, **self.analyze_kwargs
+        )
+        final_results = []
+        for result in results:
+            result.start += self._buffer_offset
+            result.end += self._buffer_offset
+            if self._committed_offset <= result.start < commit_offset:
+                final_results.append(result)
+        final_results.sort(key=lambda result: (result.start, result.end))
+
+        self._committed_offset = commit_offset
+        # Keep the preceding context of entities which are not final yet,
+        # and the whole of entities crossing the committed offset, so that
+        # the next analysis doesn't find a truncated part of them
+        carry_length = max(self.context_length, self.max_entity_length)
+        carry_start = max(commit_offset - carry_length - self._buffer_offset, 0)
+        # Start the carry-over between words, not in the middle of a token
+        min_carry_start = max(carry_start - self.max_entity_length, 0)
+        while (
+            carry_start > min_carry_start
+            and not self._buffer[carry_start - 1].isspace()
+        ):
+            carry_start -= 1
+        self._buffer = self._buffer[carry_start:]
+        self._buffer_offset += carry_start
+        logger.debug(
+            f"Streaming analysis committed offset {commit_offset}, "
+            f"{len(final_results)} final results"
+        )
+        return final_results
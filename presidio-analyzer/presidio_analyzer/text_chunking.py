@@ -0,0 +1,88 @@
+import re
+from typing import List, NamedTuple, Optional, Pattern
+
+# Chunk boundaries, from most to least preferred
+PARAGRAPH_BOUNDARY = re.compile(r"\n\s*\n")
+SENTENCE_BOUNDARY = re.compile(r"[.!?;]\s|\n")
+WORD_BOUNDARY = re.compile(r"\s")
+
+
+class TextChunk(NamedTuple):
+    """
+    A part of a long text, analyzed separately.
+
+    :param start: Start offset of the chunk in the text
+    :param end: End offset of the chunk in the text
+    :param own_start: Start offset of the part of the text this chunk is
+    responsible for. Entities starting in this part are taken from this chunk.
+    :param own_end: End offset of the part of the text this chunk is responsible for
+    """
+
+    start: int
+    end: int
+    own_start: int
+    own_end: int
+
+
+def split_text(text: str, chunk_size: int, overlap: int = 0) -> List[TextChunk]:
+    """
+    Split a text into overlapping chunks, on paragraph or sentence boundaries.
+
+    Chunks end on the last paragraph boundary in the second half of the chunk,
+    or on the last sentence or word boundary if there isn't any.
+    Consecutive chunks share about overlap characters, and each chunk is
+    responsible for its part of the text up to the middle of the overlap,
+    so that entities crossing a chunk's end are detected by the next chunk.
+
+    :param text: The text to split
+    :param chunk_size: Maximum length of a chunk in characters
+    :param overlap: Number of characters shared by consecutive chunks.
+    Should be longer than the longest expected entity,
+    and shorter than half the chunk size.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be a positive number")
+    if not 0 <= overlap < chunk_size // 2:
+        raise ValueError("overlap should be between 0 and half of chunk_size")
+
+    spans = []
+    start = 0
+    while len(text) - start > chunk_size:
+        end = _find_chunk_end(text, start + chunk_size // 2, start + chunk_size)
+        spans.append((start, end))
+        start = _find_word_start(text, start + 1, end - overlap) if overlap else end
+    spans.append((start, len(text)))
+
+    chunks = []
+    own_start = 0
+    for i, (start, end) in enumerate(spans):
+        if i == len(spans) - 1:
+            own_end = len(text)
+        else:
+            own_end = (spans[i + 1][0] + end) // 2
+        chunks.append(TextChunk(start, end, own_start, own_end))
+        own_start = own_end
+    return chunks
+
+
+def _find_chunk_end(text: str, min_end: int, max_end: int) -> int:
+    for boundary in (PARAGRAPH_BOUNDARY, SENTENCE_BOUNDARY, WORD_BOUNDARY):
+        match = _last_match(boundary, text, min_end, max_end)
+        if match:
+            return match.end()
+    return max_end
+
+
+def _find_word_start(text: str, min_start: int, start: int) -> int:
+    """Move a chunk start back to the beginning of a word, if possible."""
+    match = _last_match(WORD_BOUNDARY, text, min_start, start + 1)
+    return match.end() if match else start
+
+
+def _last_match(
+    pattern: Pattern, text: str, start: int, end: int
+) -> Optional["re.Match"]:
+    match = None
+    for match in pattern.finditer(text, start, end):  # noqa B007
+        pass
+    return match
@@ -0,0 +1,233 @@
+import logging
+import string
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import regex as re
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+logger = logging.getLogger("presidio-analyzer")
+
+# A derived prefilter with a higher cost than this would rarely skip a pattern,
+# so it isn't used. The cost is the number of printable ASCII characters
+# the prefilter matches, with letters and spaces weighted as more frequent.
+MAX_PREFILTER_COST = 12
+LETTER_COST = 5
+SPACE_COST = 20
+
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: r"\d",
+    sre_constants.CATEGORY_SPACE: r"\s",
+    sre_constants.CATEGORY_WORD: r"\w",
+}
+_REPEATS = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+# Syntax which the regex package, running the patterns, parses differently
+# from the re module: inline verbose flags, POSIX classes and fuzzy constraints
+_REGEX_ONLY_SYNTAX = re.compile(
+    r"\(\?[a-zA-Z]*x|\[:\^?[a-z]+:\]|\{[^{}]*[eids][^{}]*\}"
+)
+_PRINTABLE_ASCII = "".join(sorted(set(string.printable) - set("\t\n\r\x0b\x0c")))
+
+_current_prefilter: ContextVar[Optional["TextPrefilter"]] = ContextVar(
+    "presidio_text_prefilter", default=None
+)
+
+
+class TextPrefilter:
+    """
+    Check cheaply whether patterns could match a text, before running their regexes.
+
+    A pattern's prefilter is a regex which has to be found in the text
+    for the pattern to match, e.g. "@" for email addresses.
+    Prefilters matching a single character are checked against the set
+    of the text's distinct characters, computed in a single pass over the text.
+    Other prefilters are searched in the text. Results are cached per prefilter,
+    so patterns sharing a prefilter only check it once.
+
+    :param text: The text to check
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._characters: Optional[str] = None
+        self._results: Dict[Tuple[str, int], bool] = {}
+
+    @classmethod
+    def for_text(cls, text: str) -> "TextPrefilter":
+        """Return the prefilter of the text being analyzed, or a new one."""
+        prefilter = _current_prefilter.get()
+        if prefilter is not None and prefilter.text is text:
+            return prefilter
+        return cls(text)
+
+    @classmethod
+    @contextmanager
+    def scope(cls, text: str) -> Iterator["TextPrefilter"]:
+        """
+        Share a text's prefilter results between the recognizers analyzing it.
+
+        :param text: The text analyzed in the managed block
+        """
+        token = _current_prefilter.set(cls(text))
+        try:
+            yield _current_prefilter.get()
+        finally:
+            _current_prefilter.reset(token)
+
+    @property
+    def characters(self) -> str:
+        """Return the distinct characters of the text."""
+        if self._characters is None:
+            self._characters = "".join(set(self.text))
+        return self._characters
+
+    def matches(self, prefilter: Optional[str], flags: int = 0) -> bool:
+        """
+        Return whether the prefilter is found in the text.
+
+        :param prefilter: The prefilter regex, no prefilter if None or empty
+        :param flags: Regex flags of the pattern, e.g. re.IGNORECASE
+        """
+        if not prefilter:
+            return True
+        key = (prefilter, flags)
+        result = self._results.get(key)
+        if result is None:
+            compiled = re.compile(prefilter, flags)
+            if is_single_character(prefilter):
+                result = compiled.search(self.characters) is not None
+            else:
+                result = compiled.search(self.text) is not None
+            self._results[key] = result
+        return result
+
+
+@lru_cache(maxsize=1024)
+def derive_prefilter(regex: str, flags: int = 0) -> Optional[str]:
+    """
+    Derive a prefilter from a regex: a character class required by every match.
+
+    The most selective character (or character class) which every match
+    has to contain is chosen, e.g. "@" for an email regex.
+
+    :param regex: The pattern's regex
+    :param flags: Regex flags the pattern is matched with
+    :return: A single character regex, or None if no selective enough
+    required character was found (or the regex couldn't be parsed,
+    or uses verbose mode or syntax only supported by the regex package)
+    """
+    if flags & re.VERBOSE or _REGEX_ONLY_SYNTAX.search(regex):
+        return None
+    try:
+        parsed = sre_parse.parse(regex)
+    except Exception:
+        # Syntax only supported by the regex package
+        logger.debug(f"Could not derive a prefilter for regex {regex}")
+        return None
+
+    character_class = _best_character_class(_required_character_classes(parsed))
+    if character_class is None or _get_cost(character_class) > MAX_PREFILTER_COST:
+        return None
+    prefilter = _to_regex(character_class)
+    if parsed.state.flags & sre_constants.SRE_FLAG_IGNORECASE:
+        return "(?i)" + prefilter
+    return prefilter
+
+
+@lru_cache(maxsize=1024)
+def is_single_character(regex: str) -> bool:
+    """Return whether a regex always matches a single character."""
+    try:
+        parsed = list(sre_parse.parse(regex))
+    except Exception:
+        return False
+    return len(parsed) == 1 and parsed[0][0] in (
+        sre_constants.LITERAL,
+        sre_constants.IN,
+    )
+
+
+# A character class is represented by its items, e.g. ("a-z", "@", r"\d")
+CharacterClass = Tuple[str, ...]
+
+
+def _required_character_classes(parsed) -> List[CharacterClass]:
+    """Return the character classes every match of a parsed sequence contains."""
+    classes = []
+    for op, av in parsed:
+        if op == sre_constants.LITERAL:
+            classes.append((re.escape(chr(av)),))
+        elif op == sre_constants.IN:
+            character_class = _to_character_class(av)
+            if character_class:
+                classes.append(character_class)
+        elif op in _REPEATS:
+            min_count, _, item = av
+            if min_count > 0:
+                classes.extend(_required_character_classes(item))
+        elif op == sre_constants.SUBPATTERN:
+            _, add_flags, _, item = av
+            # Characters of case insensitive groups aren't required as written
+            if not add_flags & sre_constants.SRE_FLAG_IGNORECASE:
+                classes.extend(_required_character_classes(item))
+        elif op == sre_constants.BRANCH:
+            # One of the alternatives' required characters
+            alternatives = [
+                _best_character_class(_required_character_classes(alternative))
+                for alternative in av[1]
+            ]
+            if alternatives and all(alternatives):
+                items = (item for alternative in alternatives for item in alternative)
+                classes.append(tuple(dict.fromkeys(items)))
+    return classes
+
+
+def _to_character_class(items) -> Optional[CharacterClass]:
+    character_class = []
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            character_class.append(re.escape(chr(av)))
+        elif op == sre_constants.RANGE:
+            character_class.append(f"{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}")
+        elif op == sre_constants.CATEGORY and av in _CATEGORIES:
+            character_class.append(_CATEGORIES[av])
+        else:
+            # Negated classes and other categories are too broad
+            return None
+    return tuple(character_class) or None
+
+
+def _to_regex(character_class: CharacterClass) -> str:
+    item = character_class[0]
+    is_range = len(item) > 2 and "-" in item[1:]
+    if len(character_class) == 1 and not is_range:
+        return item
+    return f"[{''.join(character_class)}]"
+
+
+def _best_character_class(
+    character_classes: List[CharacterClass],
+) -> Optional[CharacterClass]:
+    if not character_classes:
+        return None
+    return min(character_classes, key=_get_cost)
+
+
+@lru_cache(maxsize=4096)
+def _get_cost(character_class: CharacterClass) -> int:
+    matches = re.findall(_to_regex(character_class), _PRINTABLE_ASCII)
+    letters = sum(1 for character in matches if character in string.ascii_letters)
+    spaces = 1 if " " in matches else 0
+    return len(matches) + LETTER_COST * letters + SPACE_COST * spaces
@@ -36,10 +36,12 @@ setuptools.setup(
         "regex",
         "tldextract",
         "pyyaml",
-        "phonenumbers>=8.12",
+        "phonenumbers>=8.12,<10.0.0",
+        "presidio-anonymizer>=2.2.33",
     ],
     extras_require={
         'transformers': ['torch', 'transformers'],
+        'onnx': ['transformers', 'onnxruntime', 'optimum[exporters]'],
     },
     include_package_data=True,
     license="MIT",
@@ -833,3 +833,53 @@ def test_when_multiple_nameless_recognizers_context_is_correct(nlp_engine):
 
     for recognizer_result in recognizer_results:
         assert recognizer_result.score > 0.3
+
+
+def test_when_warm_up_then_recognizers_loaded_and_patterns_compiled(nlp_engine):
+    loads = []
+
+    class LazyRecognizer(EntityRecognizer):
+        def load(self) -> None:
+            loads.append(self.name)
+
+        def analyze(self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts):
+            return []
+
+    lazy_recognizer = LazyRecognizer(supported_entities=["LAZY"])
+    lazy_recognizer.is_loaded = False
+    loads.clear()
+    pattern = Pattern("zip", r"\b\d{5}\b", 0.5)
+    registry = RecognizerRegistry(
+        [lazy_recognizer, PatternRecognizer("ZIP", patterns=[pattern])]
+    )
+    analyzer_engine = AnalyzerEngine(nlp_engine=nlp_engine, registry=registry)
+
+    durations = analyzer_engine.warm_up(sample_texts={"en": ["zip code 98052"]})
+
+    assert list(durations) == ["en"]
+    assert lazy_recognizer.is_loaded
+    assert loads == ["LazyRecognizer"]
+    assert pattern._compiled
+
+    # Recognizers are not loaded again by later requests
+    analyzer_engine.analyze("zip code 98052", language="en")
+    assert loads == ["LazyRecognizer"]
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_when_analyze_long_text_then_results_have_document_offsets(
+    analyzer_engine_simple, n_process
+):
+    sentence = "Call me at (425) 882-9090 or visit https://www.microsoft.com now. "
+    text = sentence * 50
+
+    expected = analyzer_engine_simple.analyze(text, language="en")
+    results = analyzer_engine_simple.analyze_long_text(
+        text, language="en", chunk_size=500, chunk_overlap=100, n_process=n_process
+    )
+
+    def spans(rs):
+        return sorted((r.entity_type, r.start, r.end, r.score) for r in rs)
+
+    assert len(results) == 100
+    assert spans(results) == spans(expected)
@@ -0,0 +1,183 @@
+import pytest
+
+from presidio_analyzer import AnalyzerEngine
+from presidio_analyzer.app_tracer import (
+    AppTracer,
+    InMemorySpanExporter,
+    OtlpHttpSpanExporter,
+)
+from tests.mocks import AppTracerMock
+
+
+@pytest.fixture(scope="function")
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture(scope="function")
+def traced_analyzer_engine(mock_registry, nlp_engine, exporter):
+    return AnalyzerEngine(
+        registry=mock_registry,
+        nlp_engine=nlp_engine,
+        app_tracer=AppTracer(exporter=exporter),
+    )
+
+
+def test_when_analyze_then_spans_exported_per_stage(traced_analyzer_engine, exporter):
+    traced_analyzer_engine.analyze(
+        "My credit card is 4095-2609-9393-4932",
+        language="en",
+        correlation_id="abc",
+    )
+
+    spans = exporter.get_finished_spans()
+    names = [span.name for span in spans]
+    root = spans[-1]
+    assert root.name == "analyze"
+    assert root.parent_span_id is None
+    assert root.attributes["presidio.correlation_id"] == "abc"
+    assert root.attributes["results"] == 1
+    for name in ("nlp", "recognizer", "context_enhancement", "deduplication"):
+        assert name in names
+    assert "threshold" in names
+    for span in spans[:-1]:
+        assert span.trace_id == root.trace_id
+        assert span.parent_span_id == root.span_id
+        assert span.duration >= 0
+
+    recognizer_spans = {
+        span.attributes["recognizer"]: span
+        for span in spans
+        if span.name == "recognizer"
+    }
+    assert recognizer_spans["CreditCardRecognizer"].attributes["results"] == 1
+
+
+def test_when_nested_spans_then_parent_is_enclosing_span(exporter):
+    tracer = AppTracer(exporter=exporter)
+    with tracer.span("root") as root:
+        with tracer.span("child") as child:
+            with tracer.span("grandchild") as grandchild:
+                pass
+
+    assert exporter.get_finished_spans() == [grandchild, child, root]
+    assert grandchild.parent_span_id == child.span_id
+    assert child.parent_span_id == root.span_id
+
+
+def test_when_exception_then_span_records_error(exporter):
+    tracer = AppTracer(exporter=exporter)
+    with pytest.raises(ValueError):
+        with tracer.span("root"):
+            raise ValueError("bad input")
+
+    assert exporter.get_finished_spans()[0].error == "ValueError: bad input"
+
+
+def test_when_no_exporter_then_spans_not_recorded():
+    tracer = AppTracer()
+    with tracer.span("root") as root:
+        with tracer.span("child") as child:
+            child.set_attribute("results", 1)
+
+    assert not root.is_recording
+    assert not child.is_recording
+
+
+def test_when_not_sampled_then_no_spans_exported(exporter):
+    tracer = AppTracer(sample_rate=0, exporter=exporter)
+    with tracer.span("root", correlation_id="abc"):
+        with tracer.span("child") as child:
+            pass
+
+    assert not child.is_recording
+    assert exporter.get_finished_spans() == []
+
+
+def test_when_sampled_by_correlation_id_then_decision_is_consistent():
+    tracer = AppTracer(sample_rate=0.3)
+    correlation_ids = [f"request-{i}" for i in range(2000)]
+
+    decisions = [tracer.is_sampled(c) for c in correlation_ids]
+
+    assert decisions == [tracer.is_sampled(c) for c in correlation_ids]
+    assert 0.25 < sum(decisions) / len(decisions) < 0.35
+
+
+def test_when_subclass_skips_init_then_analyze_logs_without_spans(
+    mock_registry, nlp_engine
+):
+    class LegacyTracer(AppTracer):
+        def __init__(self):
+            self.messages = []
+
+        def trace(self, request_id, trace_data):
+            self.messages.append(trace_data)
+
+    app_tracer = LegacyTracer()
+    engine = AnalyzerEngine(
+        registry=mock_registry,
+        nlp_engine=nlp_engine,
+        app_tracer=app_tracer,
+        log_decision_process=True,
+    )
+
+    engine.analyze("My credit card is 4095-2609-9393-4932", language="en")
+
+    assert app_tracer.messages
+    with app_tracer.span("root") as span:
+        assert not span.is_recording
+
+
+def test_when_request_not_sampled_then_decision_process_not_logged(
+    mock_registry, nlp_engine
+):
+    app_tracer = AppTracerMock(enable_decision_process=True)
+    app_tracer.sample_rate = 0
+    engine = AnalyzerEngine(
+        registry=mock_registry,
+        nlp_engine=nlp_engine,
+        app_tracer=app_tracer,
+        log_decision_process=True,
+    )
+
+    engine.analyze("My credit card is 4095-2609-9393-4932", language="en")
+
+    assert app_tracer.get_msg_counter() == 0
+
+
+def test_when_to_otlp_json_then_spans_converted(exporter):
+    tracer = AppTracer(exporter=exporter)
+    with tracer.span("root", language="en"):
+        with tracer.span("child", results=2, score=0.5, is_valid=True):
+            pass
+
+    otlp = OtlpHttpSpanExporter(service_name="test").to_otlp_json(
+        exporter.get_finished_spans()
+    )
+
+    resource_spans = otlp["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "test"}}
+    ]
+    child, root = resource_spans["scopeSpans"][0]["spans"]
+    assert len(root["traceId"]) == 32
+    assert len(root["spanId"]) == 16
+    assert "parentSpanId" not in root
+    assert child["parentSpanId"] == root["spanId"]
+    assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+    assert child["attributes"] == [
+        {"key": "results", "value": {"intValue": "2"}},
+        {"key": "score", "value": {"doubleValue": 0.5}},
+        {"key": "is_valid", "value": {"boolValue": True}},
+    ]
+
+
+def test_when_collector_unreachable_then_export_does_not_raise(exporter):
+    tracer = AppTracer(exporter=exporter)
+    with tracer.span("root"):
+        pass
+
+    OtlpHttpSpanExporter(endpoint="http://localhost:1/v1/traces", timeout=1).export(
+        exporter.get_finished_spans()
+    )
@@ -1,5 +1,17 @@
+from unittest.mock import patch
+
 import pytest
-from presidio_analyzer import RecognizerResult, BatchAnalyzerEngine, DictAnalyzerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    RecognizerRegistry,
+    RecognizerResult,
+    BatchAnalyzerEngine,
+    DictAnalyzerResult,
+)
+from presidio_analyzer.predefined_recognizers import CreditCardRecognizer
+from presidio_analyzer.predefined_recognizers.vectorized_checksums import (
+    luhn_checksum,
+)
 
 
 @pytest.fixture(scope="module")
@@ -266,3 +278,271 @@ def test_analyze_dict_with_nones_returns_empty_result(batch_analyzer_engine_simp
     assert len(res) == len(input_list)
     for r in res:
         assert not r
+
+
+@pytest.mark.parametrize("batch_size, max_cached_values", [(100, 100), (3, 1)])
+def test_analyze_column_returns_same_results_as_analyze_iterator(
+    batch_analyzer_engine_simple, batch_size, max_cached_values
+):
+    column = ["Hi", "Call me at 2121551234", 2121551234, "Hi", "", None] * 4
+
+    results = list(
+        batch_analyzer_engine_simple.analyze_column(
+            column,
+            language="en",
+            batch_size=batch_size,
+            max_cached_values=max_cached_values,
+        )
+    )
+
+    expected = batch_analyzer_engine_simple.analyze_iterator(column, language="en")
+    assert results == expected
+
+
+def test_analyze_column_analyzes_each_distinct_value_once(
+    batch_analyzer_engine_simple,
+):
+    column = ["Call me at 2121551234", "Seattle", "Seattle"] * 100
+    analyzer_engine = batch_analyzer_engine_simple.analyzer_engine
+
+    with patch.object(
+        analyzer_engine, "analyze", wraps=analyzer_engine.analyze
+    ) as analyze:
+        results = list(
+            batch_analyzer_engine_simple.analyze_column(
+                column, language="en", batch_size=7
+            )
+        )
+
+    assert analyze.call_count == 2
+    assert len(results) == 300
+    assert results[0] is results[3]
+    assert results[0][0].entity_type == "PHONE_NUMBER"
+    assert results[1] == []
+
+
+def test_analyze_column_validates_matches_of_all_values_at_once(nlp_engine):
+    registry = RecognizerRegistry([CreditCardRecognizer()])
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=analyzer_engine)
+    column = [f"4000 0000 0000 {i:04d}" for i in range(40)]
+
+    with patch(
+        "presidio_analyzer.predefined_recognizers.credit_card_recognizer."
+        "luhn_checksum",
+        wraps=luhn_checksum,
+    ) as checksum:
+        results = list(batch_analyzer.analyze_column(column, language="en"))
+
+    assert checksum.call_count == 1
+    assert checksum.call_args[0][0].shape == (40, 16)
+    expected = [analyzer_engine.analyze(text, language="en") for text in column]
+    assert results == expected
+    assert sum(1 for value_results in results if value_results) == 4
+
+
+def test_analyze_column_on_pandas_series(batch_analyzer_engine_simple):
+    pd = pytest.importorskip("pandas")
+    column = pd.Series(["Call me at 2121551234", None, "Hi"], dtype="string")
+
+    results = list(
+        batch_analyzer_engine_simple.analyze_column(column, language="en")
+    )
+
+    assert [len(result) for result in results] == [1, 0, 0]
+    float_column = pd.Series([1.5, float("nan")])
+    assert list(
+        batch_analyzer_engine_simple.analyze_column(float_column, language="en")
+    ) == [[], []]
+
+
+@pytest.fixture(scope="module")
+def table():
+    rows = 1000
+    return {
+        "phone": [f"212-555-{1000 + i}" for i in range(rows)],
+        "notes": [
+            f"call me at 212-555-{1000 + i}" if i % 2 else "see you soon"
+            for i in range(rows)
+        ],
+        "city": ["Seattle", "Boston", None, "Denver"] * (rows // 4),
+        "id": 12,
+    }
+
+
+def test_profile_dict_classifies_columns_from_sample(
+    batch_analyzer_engine_simple, table
+):
+    profiles = batch_analyzer_engine_simple.profile_dict(table, language="en", seed=1)
+
+    assert set(profiles) == {"phone", "notes", "city", "id"}
+    assert profiles["phone"].sample_size == 278
+    assert profiles["phone"].entity_type == "PHONE_NUMBER"
+    assert 0.98 < profiles["phone"].confidence < 1
+    assert profiles["notes"].entity_type is None
+    assert 0.4 < profiles["notes"].entity_fractions["PHONE_NUMBER"] < 0.6
+    assert not profiles["city"].has_pii
+    assert profiles["id"].row_count == 1
+
+
+def test_analyze_dict_with_profiles_only_analyzes_partial_pii_columns(
+    batch_analyzer_engine_simple, table
+):
+    profiles = batch_analyzer_engine_simple.profile_dict(
+        table, language="en", sample_size=50, seed=1, keys_to_skip=["id"]
+    )
+    analyzer_engine = batch_analyzer_engine_simple.analyzer_engine
+
+    with patch.object(
+        analyzer_engine, "analyze", wraps=analyzer_engine.analyze
+    ) as analyze:
+        results = {
+            result.key: result
+            for result in batch_analyzer_engine_simple.analyze_dict_with_profiles(
+                table, profiles, language="en"
+            )
+        }
+
+    # Only the distinct values of the notes column are analyzed
+    assert analyze.call_count == 501
+    assert results["phone"].recognizer_results[0] == [
+        RecognizerResult("PHONE_NUMBER", 0, 12, profiles["phone"].confidence)
+    ]
+    assert len(results["notes"].recognizer_results[1]) == 1
+    assert results["notes"].recognizer_results[0] == []
+    assert results["city"].recognizer_results[2] == []
+    assert results["id"].value == 12
+    assert results["id"].recognizer_results == []
+
+
+def test_profile_dict_with_context_adds_column_name(batch_analyzer_engine_simple):
+    table = {"notes": ["call me at 212-555-1000", "see you soon"]}
+    analyzer_engine = batch_analyzer_engine_simple.analyzer_engine
+
+    with patch.object(
+        analyzer_engine, "analyze", wraps=analyzer_engine.analyze
+    ) as analyze:
+        profiles = batch_analyzer_engine_simple.profile_dict(
+            table, language="en", context=["contact"]
+        )
+        list(
+            batch_analyzer_engine_simple.analyze_dict_with_profiles(
+                table, profiles, language="en", context=["contact"]
+            )
+        )
+
+    assert analyze.call_count == 4
+    for call in analyze.call_args_list:
+        assert call.kwargs["context"] == ["contact", "notes"]
+
+
+def test_profile_dict_with_nested_dict_raises_error(batch_analyzer_engine_simple):
+    with pytest.raises(ValueError):
+        batch_analyzer_engine_simple.profile_dict({"a": {"b": ["c"]}}, language="en")
+
+
+def test_analyze_dict_runs_nlp_engine_once_with_key_path_context(
+    batch_analyzer_engine_simple,
+):
+    input_dict = {
+        "name": "Dan",
+        "contact": {"phone": "212-555-1234", "urls": ["www.abc.com", "hi"]},
+        "skipped": "212-555-1234",
+        "empty": "",
+    }
+    analyzer_engine = batch_analyzer_engine_simple.analyzer_engine
+
+    with patch.object(
+        analyzer_engine.nlp_engine,
+        "process_batch",
+        wraps=analyzer_engine.nlp_engine.process_batch,
+    ) as process_batch, patch.object(
+        analyzer_engine, "analyze", wraps=analyzer_engine.analyze
+    ) as analyze:
+        results = list(
+            batch_analyzer_engine_simple.analyze_dict(
+                input_dict,
+                language="en",
+                keys_to_skip=["skipped"],
+                context=["customer"],
+            )
+        )
+
+    assert process_batch.call_count == 1
+    assert list(process_batch.call_args.kwargs["texts"]) == [
+        "Dan",
+        "212-555-1234",
+        "www.abc.com",
+        "hi",
+    ]
+    assert [call.kwargs["context"] for call in analyze.call_args_list] == [
+        ["customer", "name"],
+        ["customer", "contact", "phone"],
+        ["customer", "contact", "urls"],
+        ["customer", "contact", "urls"],
+    ]
+
+    assert [result.key for result in results] == [
+        "name",
+        "contact",
+        "skipped",
+        "empty",
+    ]
+    contact = {result.key: result for result in results[1].recognizer_results}
+    assert contact["phone"].recognizer_results[0].entity_type == "PHONE_NUMBER"
+    assert contact["urls"].recognizer_results[0][0].entity_type == "URL"
+    assert contact["urls"].recognizer_results[1] == []
+    assert results[2].recognizer_results == []
+
+
+def test_analyze_records_returns_same_results_as_analyze_dict(
+    batch_analyzer_engine_simple,
+):
+    records = [
+        {
+            "id": i,
+            "phone": f"212-555-{1000 + i}",
+            "profile": {"site": "www.abc.com" if i % 2 else "none"},
+            "tags": ["a", "call 212-555-1234"],
+        }
+        for i in range(1, 8)
+    ]
+    analyzer_engine = batch_analyzer_engine_simple.analyzer_engine
+
+    with patch.object(
+        analyzer_engine.nlp_engine,
+        "process_batch",
+        wraps=analyzer_engine.nlp_engine.process_batch,
+    ) as process_batch:
+        results = list(
+            batch_analyzer_engine_simple.analyze_records(
+                iter(records), language="en", batch_size=3
+            )
+        )
+
+    assert process_batch.call_count == 3
+    # Values are grouped by key path
+    assert list(process_batch.call_args_list[0].kwargs["texts"])[:4] == [
+        "1",
+        "2",
+        "3",
+        "212-555-1001",
+    ]
+    assert len(results) == len(records)
+    for record, record_results in zip(records, results):
+        expected = list(
+            batch_analyzer_engine_simple.analyze_dict(record, language="en")
+        )
+        assert [r.key for r in record_results] == [r.key for r in expected]
+        assert record_results[1].recognizer_results == expected[1].recognizer_results
+        assert list(record_results[2].recognizer_results)[0].recognizer_results == (
+            list(expected[2].recognizer_results)[0].recognizer_results
+        )
+        assert record_results[3].recognizer_results == expected[3].recognizer_results
+
+
+def test_analyze_records_with_non_dict_record_raises_error(
+    batch_analyzer_engine_simple,
+):
+    with pytest.raises(ValueError):
+        list(batch_analyzer_engine_simple.analyze_records(["text"], language="en"))
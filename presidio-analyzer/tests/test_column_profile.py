@@ -0,0 +1,40 @@
+import pytest
+
+from presidio_analyzer.column_profile import (
+    get_sample_size,
+    get_wilson_lower_bound,
+    get_z_score,
+)
+
+
+@pytest.mark.parametrize(
+    "row_count, confidence_level, margin_of_error, expected",
+    [
+        (10_000_000, 0.95, 0.05, 385),
+        (10_000_000, 0.99, 0.01, 16560),
+        (1000, 0.95, 0.05, 278),
+        (10, 0.95, 0.05, 10),
+        (0, 0.95, 0.05, 0),
+    ],
+)
+def test_when_sample_size_then_cochran_formula(
+    row_count, confidence_level, margin_of_error, expected
+):
+    assert get_sample_size(row_count, confidence_level, margin_of_error) == expected
+
+
+def test_when_invalid_confidence_level_then_raise():
+    with pytest.raises(ValueError):
+        get_sample_size(100, confidence_level=1)
+
+
+def test_when_z_score_then_normal_distribution_quantile():
+    assert get_z_score(0.95) == pytest.approx(1.96, abs=1e-3)
+    assert get_z_score(0.99) == pytest.approx(2.576, abs=1e-3)
+
+
+def test_when_wilson_lower_bound_then_below_fraction():
+    assert get_wilson_lower_bound(0, 0, 1.96) == 0
+    assert get_wilson_lower_bound(0, 100, 1.96) == 0
+    assert get_wilson_lower_bound(50, 100, 1.96) == pytest.approx(0.404, abs=1e-3)
+    assert 0.99 < get_wilson_lower_bound(385, 385, 1.96) < 1
@@ -0,0 +1,133 @@
+import json
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    EntityRecognizer,
+    LemmaContextAwareEnhancer,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.engine_spec import (
+    get_spec_hash,
+    recognizer_from_spec,
+    recognizer_to_spec,
+)
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+from presidio_analyzer.predefined_recognizers import (
+    CreditCardRecognizer,
+    PhoneRecognizer,
+    SpacyRecognizer,
+)
+
+TEXT = "Mr. Smith's card is 4012888888881881, call him at 212-555-1234"
+
+
+@pytest.fixture(scope="module")
+def analyzer_engine(nlp_engine):
+    registry = RecognizerRegistry(
+        [
+            CreditCardRecognizer(),
+            PhoneRecognizer(supported_regions=["US", "GB"]),
+            SpacyRecognizer(),
+            PatternRecognizer(supported_entity="TITLE", deny_list=["Mr.", "Mrs."]),
+        ]
+    )
+    return AnalyzerEngine(
+        registry=registry,
+        nlp_engine=nlp_engine,
+        default_score_threshold=0.3,
+        context_aware_enhancer=LemmaContextAwareEnhancer(context_prefix_count=3),
+    )
+
+
+def _as_tuples(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+def test_when_created_from_spec_then_same_results(analyzer_engine):
+    spec = json.loads(json.dumps(analyzer_engine.to_spec()))
+
+    engine = AnalyzerEngine.from_spec(spec, use_cache=False)
+
+    assert _as_tuples(engine.analyze(TEXT, language="en")) == _as_tuples(
+        analyzer_engine.analyze(TEXT, language="en")
+    )
+    assert engine.default_score_threshold == 0.3
+    assert engine.context_aware_enhancer.context_prefix_count == 3
+    assert get_spec_hash(engine.to_spec()) == get_spec_hash(spec)
+
+
+def test_when_created_from_equal_specs_then_engine_is_cached(analyzer_engine):
+    spec = analyzer_engine.to_spec()
+
+    engine = AnalyzerEngine.from_spec(spec)
+
+    assert AnalyzerEngine.from_spec(json.loads(json.dumps(spec))) is engine
+    assert AnalyzerEngine.from_spec(spec, use_cache=False) is not engine
+
+
+def test_when_recognizer_has_deny_list_then_its_pattern_is_not_duplicated():
+    recognizer = PatternRecognizer(supported_entity="TITLE", deny_list=["Mr."])
+
+    spec = recognizer_to_spec(recognizer)
+    created = recognizer_from_spec(spec)
+
+    assert spec["arguments"]["patterns"] == []
+    assert len(created.patterns) == 1
+    assert created.deny_list == ["Mr."]
+
+
+def test_when_recognizer_has_custom_arguments_then_they_are_kept():
+    recognizer = PhoneRecognizer(
+        context=["mobile"], supported_language="es", supported_regions=["ES"]
+    )
+
+    created = recognizer_from_spec(recognizer_to_spec(recognizer))
+
+    assert type(created) is PhoneRecognizer
+    assert created.context == ["mobile"]
+    assert created.supported_language == "es"
+    assert created.supported_regions == ["ES"]
+
+
+def test_when_recognizer_class_is_local_then_raise():
+    class LocalRecognizer(EntityRecognizer):
+        def analyze(self, text, entities, nlp_artifacts=None):
+            return []
+
+    with pytest.raises(ValueError):
+        recognizer_to_spec(LocalRecognizer(supported_entities=["LOCAL"]))
+
+
+def test_when_unserializable_argument_has_default_then_spec_is_created():
+    spec = recognizer_to_spec(SpacyRecognizer())
+
+    assert "check_label_groups" not in spec["arguments"]
+
+
+def test_when_unserializable_argument_differs_from_default_then_raise():
+    recognizer = SpacyRecognizer(check_label_groups=[({"PERSON"}, {"PER"})])
+
+    with pytest.raises(ValueError):
+        recognizer_to_spec(recognizer)
+
+
+def test_when_spec_class_is_not_a_recognizer_then_raise():
+    with pytest.raises(ValueError):
+        recognizer_from_spec({"class": "collections.OrderedDict", "arguments": {}})
+
+
+def test_when_languages_are_loaded_lazily_then_spec_keeps_them_lazy():
+    nlp_engine = SpacyNlpEngine(models={"en": "en_core_web_lg"}, lazy_load=True)
+    analyzer_engine = AnalyzerEngine(nlp_engine=nlp_engine)
+
+    spec = analyzer_engine.to_spec()
+    engine = AnalyzerEngine.from_spec(spec, use_cache=False)
+
+    assert spec["recognizers"] == []
+    assert spec["lazy_languages"] == ["en"]
+    assert spec["nlp_configuration"]["lazy_load"] is True
+    assert engine.registry.get_lazy_languages() == ["en"]
+    assert engine.get_supported_entities("en")
@@ -369,3 +369,26 @@ def test_when_all_ibans_then_succeed(
     for res, (start, end) in zip(results, expected_res):
 
         assert_result(res, entities[0], start, end, max_score)
+
+
+def test_when_iban_with_trailing_groups_then_explanation_keeps_pattern_score(
+    recognizer, entities
+):
+    text = "I want my deposit in DE89 3704 0044 0532 0130 00 2 days from today."
+    results = recognizer.analyze(text, entities)
+
+    assert len(results) == 1
+    assert text[results[0].start : results[0].end] == "DE89 3704 0044 0532 0130 00"
+    assert results[0].score == 1.0
+    assert results[0].analysis_explanation.validation_result is True
+    assert results[0].analysis_explanation.original_score == 0.5
+
+
+def test_when_recognizers_share_mode_then_country_regexes_compiled_once():
+    assert (
+        IbanRecognizer()._country_regexes is IbanRecognizer()._country_regexes
+    )
+    assert (
+        IbanRecognizer(exact_match=True)._country_regexes
+        is not IbanRecognizer()._country_regexes
+    )
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+import spacy
+from spacy.language import Language
+from spacy.tokens import Span
+
+from presidio_analyzer import AnalyzerEngine, IncrementalAnalyzer, RecognizerRegistry
+from presidio_analyzer.incremental_analyzer import _find_edited_region
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+
+
+@Language.component("sentence_dependent_ner")
+def sentence_dependent_ner(doc):
+    """Tag capitalized words as PERSON, in sentences mentioning a name."""
+    entities = []
+    for sentence in doc.sents:
+        if any(token.lower_ == "name" for token in sentence):
+            entities.extend(
+                Span(doc, token.i, token.i + 1, "PERSON")
+                for token in sentence
+                if token.is_title and token.i != sentence.start
+            )
+    doc.ents = entities
+    return doc
+
+
+def _as_tuples(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+@pytest.fixture(scope="module")
+def incremental_analyzer(analyzer_engine_simple):
+    return IncrementalAnalyzer(
+        analyzer_engine_simple, language="en", max_entity_length=40, context_length=60
+    )
+
+
+@pytest.fixture(scope="module")
+def document():
+    return "\n".join(
+        f"Line {i}: call my phone 212-555-1234 or pay with 4012888888881881."
+        if i % 4 == 0
+        else f"Line {i}: nothing to see in this line of the document."
+        for i in range(60)
+    )
+
+
+@pytest.mark.parametrize(
+    "old_text, new_text, expected",
+    [
+        ("abcdef", "abcdef", (6, 6, 6)),
+        ("abcdef", "abXdef", (2, 3, 3)),
+        ("abcdef", "abef", (2, 4, 2)),
+        ("abcdef", "abcdefgh", (6, 6, 8)),
+        ("aaaa", "aaaaa", (4, 4, 5)),
+        ("", "abc", (0, 0, 3)),
+    ],
+)
+def test_find_edited_region(old_text, new_text, expected):
+    assert _find_edited_region(old_text, new_text) == expected
+
+
+@pytest.mark.parametrize(
+    "replacement",
+    [
+        "",
+        "x",
+        " my phone is 212-555-9876 ",
+        "4012888888881881 ",
+        "\nA new line with a credit card 4012888888881881.\n",
+    ],
+)
+def test_when_text_edited_then_results_match_full_analysis(
+    incremental_analyzer, analyzer_engine_simple, document, replacement
+):
+    previous = incremental_analyzer.analyze(document)
+    rng = random.Random(len(replacement))
+
+    for _ in range(10):
+        start = rng.randrange(len(previous.text))
+        end = min(start + rng.randrange(20), len(previous.text))
+        new_text = previous.text[:start] + replacement + previous.text[end:]
+
+        current = incremental_analyzer.analyze(new_text, previous)
+        expected = analyzer_engine_simple.analyze(new_text, language="en")
+
+        assert _as_tuples(current.results) == _as_tuples(expected)
+        previous = current
+
+
+def test_when_text_edited_then_nlp_artifacts_match_full_analysis(
+    incremental_analyzer, nlp_engine, document
+):
+    previous = incremental_analyzer.analyze(document)
+    start = document.index("4012888888881881")
+
+    current = incremental_analyzer.apply_edit(previous, start, start, "card ")
+    expected = nlp_engine.process_text(current.text, "en")
+
+    assert current.nlp_artifacts.tokens.text == current.text
+    assert current.nlp_artifacts.tokens_indices == expected.tokens_indices
+    assert current.nlp_artifacts.lemmas == expected.lemmas
+
+
+def test_when_edited_next_to_ner_entity_then_results_match_full_analysis(
+    nlp_engine,
+):
+    analyzer_engine = AnalyzerEngine(nlp_engine=nlp_engine)
+    incremental_analyzer = IncrementalAnalyzer(
+        analyzer_engine, max_entity_length=20, context_length=10
+    )
+    text = " ".join(
+        ["The weather was fine today."] * 10
+        + ["My name is David Johnson and I live in Seattle."]
+        + ["The weather was fine today."] * 10
+    )
+    previous = incremental_analyzer.analyze(text)
+    start = text.index("David Johnson")
+
+    current = incremental_analyzer.apply_edit(previous, start, start, "Mr. ")
+    expected = analyzer_engine.analyze(current.text, language="en")
+
+    assert _as_tuples(current.results) == _as_tuples(expected)
+
+
+def test_when_ner_depends_on_sentence_then_results_match_full_analysis():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("sentence_dependent_ner")
+    nlp_engine = SpacyNlpEngine(models={"en": "custom"}, lazy_load=True)
+    nlp_engine.nlp["en"] = nlp
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry([SpacyRecognizer()]), nlp_engine=nlp_engine
+    )
+    incremental_analyzer = IncrementalAnalyzer(
+        analyzer_engine, max_entity_length=10, context_length=0
+    )
+    text = " ".join(
+        ["nothing happens here."] * 10
+        + ["my name, as you may have guessed after all this time, is Jonathan."]
+        + ["nothing happens here."] * 10
+    )
+    previous = incremental_analyzer.analyze(text)
+    end = text.index("Jonathan") + len("Jonathan")
+
+    current = incremental_analyzer.apply_edit(previous, end, end, " Smith")
+    expected = analyzer_engine.analyze(current.text, language="en")
+
+    assert [r.entity_type for r in expected] == ["PERSON", "PERSON"]
+    assert _as_tuples(current.results) == _as_tuples(expected)
+    assert [e.text for e in current.nlp_artifacts.entities] == ["Jonathan", "Smith"]
+
+
+def test_when_edit_splits_an_entity_then_entity_removed(
+    incremental_analyzer, document
+):
+    previous = incremental_analyzer.analyze(document)
+    phone_start = document.index("212-555-1234")
+
+    current = incremental_analyzer.apply_edit(
+        previous, phone_start + 3, phone_start + 4, " hello "
+    )
+
+    assert phone_start not in [r.start for r in current.results]
+    assert len(current.results) == len(previous.results) - 1
+    # The previous snapshot is left untouched
+    assert phone_start in [r.start for r in previous.results]
+
+
+def test_when_edit_is_invalid_then_raise(incremental_analyzer):
+    previous = incremental_analyzer.analyze("some text")
+    with pytest.raises(ValueError):
+        incremental_analyzer.apply_edit(previous, 5, 3, "x")
@@ -0,0 +1,92 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import presidio_analyzer
+from presidio_analyzer import nlp_engine, predefined_recognizers
+
+HEAVY_MODULES = (
+    "spacy",
+    "phonenumbers",
+    "tldextract",
+    "torch",
+    "transformers",
+    "stanza",
+    "spacy_stanza",
+)
+
+
+def imported_heavy_modules(code: str):
+    """Run code in a fresh interpreter and return the heavy modules it imported."""
+    check = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    package_root = str(Path(presidio_analyzer.__file__).parent.parent)
+    output = subprocess.run(
+        [sys.executable, "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=package_root,
+    ).stdout
+    modules = json.loads(output.splitlines()[-1])
+    return [module for module in HEAVY_MODULES if module in modules]
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import presidio_analyzer",
+        "from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine",
+        "from presidio_analyzer import PatternRecognizer, Pattern, RecognizerRegistry",
+        "from presidio_analyzer.nlp_engine import NlpEngineProvider, NlpArtifacts",
+        "import presidio_analyzer.predefined_recognizers",
+    ],
+)
+def test_when_importing_then_heavy_dependencies_not_imported(code):
+    assert imported_heavy_modules(code) == []
+
+
+def test_when_registry_created_with_custom_recognizers_then_heavy_dependencies_not_imported():  # noqa E501
+    code = (
+        "from presidio_analyzer import PatternRecognizer, RecognizerRegistry\n"
+        "registry = RecognizerRegistry()\n"
+        "registry.add_recognizer(PatternRecognizer('TITLE', deny_list=['Mr.']))\n"
+        "registry.get_recognizers(language='en', all_fields=True)"
+    )
+    assert imported_heavy_modules(code) == []
+
+
+def test_when_lazy_nlp_engine_accessed_then_class_returned():
+    from presidio_analyzer.nlp_engine.spacy_nlp_engine import SpacyNlpEngine
+
+    assert nlp_engine.SpacyNlpEngine is SpacyNlpEngine
+    assert "TransformersNlpEngine" in dir(nlp_engine)
+
+
+def test_when_lazy_recognizer_accessed_then_class_returned():
+    from presidio_analyzer.predefined_recognizers.phone_recognizer import (
+        PhoneRecognizer,
+    )
+
+    assert predefined_recognizers.PhoneRecognizer is PhoneRecognizer
+    assert predefined_recognizers.NLP_RECOGNIZERS["spacy"].__name__ == (
+        "SpacyRecognizer"
+    )
+    assert set(predefined_recognizers.__all__) <= set(dir(predefined_recognizers))
+
+
+def test_when_nlp_recognizers_changed_then_change_is_kept(monkeypatch):
+    nlp_recognizers = predefined_recognizers.NLP_RECOGNIZERS
+    monkeypatch.setitem(nlp_recognizers, "custom", object)
+
+    assert predefined_recognizers.NLP_RECOGNIZERS is nlp_recognizers
+    assert predefined_recognizers.NLP_RECOGNIZERS["custom"] is object
+
+
+def test_when_unknown_attribute_then_attribute_error():
+    with pytest.raises(AttributeError):
+        predefined_recognizers.NotARecognizer  # noqa B018
+    with pytest.raises(AttributeError):
+        nlp_engine.NotAnEngine  # noqa B018
@@ -0,0 +1,35 @@
+from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.metrics import metrics_registry
+
+
+def test_when_analyze_then_recognizer_and_pattern_durations_recorded(
+    analyzer_engine_simple,
+):
+    metrics_registry.reset()
+    recognizer = PatternRecognizer(
+        supported_entity="ROCKET",
+        name="rocket recognizer",
+        patterns=[Pattern("rocket pattern", r"\W*(rocket)\W*", 0.8)],
+    )
+
+    analyzer_engine_simple.analyze(
+        "I'm a rocket", language="en", ad_hoc_recognizers=[recognizer]
+    )
+
+    assert metrics_registry.get_histogram(
+        "analyze_duration_seconds", language="en"
+    ).count == 1
+    assert (
+        metrics_registry.get_histogram(
+            "recognizer_duration_seconds", recognizer="rocket recognizer", language="en"
+        ).count
+        == 1
+    )
+    assert (
+        metrics_registry.get_histogram(
+            "pattern_duration_seconds",
+            recognizer="rocket recognizer",
+            pattern="rocket pattern",
+        ).count
+        == 1
+    )
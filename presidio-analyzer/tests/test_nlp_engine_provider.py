@@ -51,6 +51,27 @@ def test_when_create_nlp_engine_then_two_models_succeeds(mock_he_model, mock_bn_
     assert isinstance(engine.nlp["bn"], spacy.lang.bn.Bengali)
 
 
+def test_when_create_nlp_engine_with_lazy_load_then_models_not_loaded(
+    mock_he_model, mock_bn_model
+):
+    nlp_configuration = {
+        "nlp_engine_name": "spacy",
+        "models": [
+            {"lang_code": "he", "model_name": "he_test"},
+            {"lang_code": "bn", "model_name": "bn_test"},
+        ],
+        "lazy_load": True,
+        "max_loaded_models": 1,
+    }
+
+    engine = NlpEngineProvider(nlp_configuration=nlp_configuration).create_engine()
+
+    assert engine.lazy_load
+    assert engine.nlp.max_loaded_models == 1
+    assert engine.nlp.loaded_languages == []
+    assert isinstance(engine.nlp["bn"], spacy.lang.bn.Bengali)
+
+
 def test_when_create_nlp_engine_from_wrong_conf_then_fail():
     with pytest.raises(OSError):
         nlp_configuration = {
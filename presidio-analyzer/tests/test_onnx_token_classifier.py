@@ -0,0 +1,92 @@
+import numpy as np
+
+from presidio_analyzer.nlp_engine.onnx_token_classifier import (
+    OnnxTokenClassifier,
+    aggregate_token_predictions,
+)
+
+
+class SpecialTokensTokenizer:
+    """Mock tokenizer adding a [CLS] (101) and [SEP] (102) token."""
+
+    pad_token_id = 0
+
+    def build_inputs_with_special_tokens(self, token_ids):
+        return [101] + token_ids + [102]
+
+    def get_special_tokens_mask(self, token_ids):
+        return [1] + [0] * len(token_ids) + [1]
+
+
+class FakeInput:
+    def __init__(self, name):
+        self.name = name
+
+
+class LabelPerTokenIdSession:
+    """Mock ONNX Runtime session, predicting the label with the token's id."""
+
+    def __init__(self, num_labels):
+        self.num_labels = num_labels
+        self.inputs = []
+
+    def get_inputs(self):
+        return [FakeInput("input_ids"), FakeInput("attention_mask")]
+
+    def run(self, output_names, inputs):
+        self.inputs.append(inputs)
+        input_ids = inputs["input_ids"]
+        logits = np.zeros(input_ids.shape + (self.num_labels,))
+        for (i, j), token_id in np.ndenumerate(input_ids):
+            if token_id < self.num_labels:
+                logits[i, j, token_id] = 10
+        return [logits]
+
+
+def test_when_aggregate_iob_labels_then_grouped_to_entities():
+    labels = ["O", "B-PER", "I-PER", "B-PER", "O", "I-LOC", "I-LOC"]
+    scores = [0.9, 0.8, 0.6, 0.7, 0.9, 0.5, 0.7]
+    offsets = [(0, 2), (3, 7), (8, 13), (14, 18), (19, 21), (22, 25), (26, 30)]
+
+    entities = aggregate_token_predictions(labels, scores, offsets)
+
+    assert [(e["entity_group"], e["start"], e["end"]) for e in entities] == [
+        ("PER", 3, 13),
+        ("PER", 14, 18),
+        ("LOC", 22, 30),
+    ]
+    assert np.isclose(entities[0]["score"], 0.7)
+    assert np.isclose(entities[2]["score"], 0.6)
+
+
+def test_when_predict_then_padded_batch_and_special_tokens_ignored():
+    classifier = OnnxTokenClassifier.__new__(OnnxTokenClassifier)
+    classifier.tokenizer = SpecialTokensTokenizer()
+    classifier.id2label = {0: "O", 1: "B-PER", 2: "I-PER", 3: "B-LOC"}
+    classifier.session = LabelPerTokenIdSession(num_labels=4)
+    classifier.input_names = {"input_ids", "attention_mask"}
+
+    windows = [
+        ([0, 1, 2], [(0, 2), (3, 7), (8, 13)]),
+        ([3], [(0, 6)]),
+        ([0], [(0, 2)]),
+    ]
+    results = classifier.predict(windows, batch_size=2)
+
+    assert len(classifier.session.inputs) == 2
+    first_batch = classifier.session.inputs[0]
+    assert first_batch["input_ids"].tolist() == [
+        [101, 0, 1, 2, 102],
+        [101, 3, 102, 0, 0],
+    ]
+    assert first_batch["attention_mask"].tolist() == [
+        [1, 1, 1, 1, 1],
+        [1, 1, 1, 0, 0],
+    ]
+    assert "token_type_ids" not in first_batch
+    entities = [[(e["entity_group"], e["start"], e["end"]) for e in r] for r in results]
+    assert entities == [
+        [("PER", 3, 13)],
+        [("LOC", 0, 6)],
+        [],
+    ]
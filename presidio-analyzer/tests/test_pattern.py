@@ -27,3 +27,33 @@ def test_when_use_from_dict_return_pattern(my_pattern, my_pattern_dict):
     assert expected.name == actual.name
     assert expected.score == actual.score
     assert expected.regex == actual.regex
+
+
+def test_when_compile_then_compiled_regex_cached_per_flags(my_pattern):
+    compiled = my_pattern.compile()
+    assert compiled.pattern == "[re]"
+    assert my_pattern.compile() is compiled
+    assert my_pattern.compile(flags=0) is not compiled
+
+
+@pytest.mark.parametrize(
+    "regex, prefilter, expected",
+    [
+        (r"\b[\w.]+@[\w.]+\b", None, "@"),
+        (r"\d{3}-\d{4}", None, r"\-"),
+        (r"[a-z]+", None, None),
+        (r"\b[\w.]+@[\w.]+\b", "", None),
+        (r"\d{3}-\d{4}", r"\d{3}", r"\d{3}"),
+    ],
+)
+def test_when_prefilter_then_declared_or_derived(regex, prefilter, expected):
+    pattern = Pattern(name="p", regex=regex, score=0.5, prefilter=prefilter)
+
+    assert pattern.prefilter == expected
+
+
+def test_when_prefilter_declared_then_serialized():
+    pattern = Pattern(name="p", regex=r"\d+@", score=0.5, prefilter="@")
+
+    assert pattern.to_dict()["prefilter"] == "@"
+    assert Pattern.from_dict(pattern.to_dict()).prefilter == "@"
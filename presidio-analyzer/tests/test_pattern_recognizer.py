@@ -201,3 +201,53 @@ def test_empty_deny_list_raises_value_error():
             supported_language="en",
             deny_list=[],
         )
+
+
+def test_when_pattern_matches_then_validate_results_called_once_per_pattern():
+    class BatchRecognizer(PatternRecognizer):
+        def __init__(self):
+            super().__init__(
+                supported_entity="NUMBER",
+                patterns=[Pattern(name="digits", regex=r"\d+", score=0.5)],
+            )
+            self.batches = []
+
+        def validate_results(self, pattern_texts):
+            self.batches.append(list(pattern_texts))
+            return [int(pattern_text) % 2 == 0 for pattern_text in pattern_texts]
+
+    recognizer = BatchRecognizer()
+    results = recognizer.analyze("1 22 333 4444", entities=["NUMBER"])
+
+    assert recognizer.batches == [["1", "22", "333", "4444"]]
+    assert [(r.start, r.end, r.score) for r in results] == [(2, 4, 1.0), (9, 13, 1.0)]
+
+
+def test_when_batch_scope_then_validate_results_called_once_for_all_texts():
+    class BatchRecognizer(PatternRecognizer):
+        def __init__(self):
+            super().__init__(
+                supported_entity="NUMBER",
+                patterns=[Pattern(name="digits", regex=r"\d+", score=0.5)],
+            )
+            self.batches = []
+
+        def validate_results(self, pattern_texts):
+            self.batches.append(list(pattern_texts))
+            return [int(pattern_text) % 2 == 0 for pattern_text in pattern_texts]
+
+    recognizer = BatchRecognizer()
+    texts = ["1 22", "333", "no digits", "4444 5"]
+    with recognizer.batch_scope(texts):
+        results = [recognizer.analyze(text, entities=["NUMBER"]) for text in texts]
+    assert recognizer.batches == [["1", "22", "333", "4444", "5"]]
+    assert [[(r.start, r.end) for r in result] for result in results] == [
+        [(2, 4)],
+        [],
+        [],
+        [(0, 4)],
+    ]
+
+    # Texts outside of the batch are matched on analysis
+    recognizer.analyze("66", entities=["NUMBER"])
+    assert recognizer.batches[-1] == ["66"]
@@ -1,5 +1,7 @@
+import phonenumbers
 import pytest
 
+from presidio_analyzer.predefined_recognizers import phone_recognizer
 from presidio_analyzer.predefined_recognizers.phone_recognizer import PhoneRecognizer
 from tests import assert_result
 
@@ -45,3 +47,55 @@ def test_when_all_phones_then_succeed(
     assert len(results) == expected_len
     for i, (res, (st_pos, fn_pos)) in enumerate(zip(results, expected_positions)):
         assert_result(res, entities[i], st_pos, fn_pos, score)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Call (415) 555-0132 or +44 20 7946 0958, not 2023-01-05 10:30",
+        "Order 123456789012 shipped on 12/05/2020 to abc8005001234",
+        "Numbers: 020 7946 0958 / 030 901820, 09-7625400 and 98765 43210",
+        "tel:+972-3-1234567 ext. 12, fax 555-0132/33",
+    ],
+)
+@pytest.mark.parametrize(
+    "supported_regions",
+    [PhoneRecognizer.DEFAULT_SUPPORTED_REGIONS, ("US", "GB", "AR", "MX", "RU")],
+)
+def test_when_text_scanned_once_then_same_results_as_phonenumbers_matcher(
+    text, supported_regions
+):
+    recognizer = PhoneRecognizer(supported_regions=supported_regions)
+    expected = {
+        (match.start, match.end)
+        for region in supported_regions
+        for match in phonenumbers.PhoneNumberMatcher(text, region, leniency=1)
+    }
+
+    results = recognizer.analyze(text, ["PHONE_NUMBER"])
+
+    assert {(res.start, res.end) for res in results} == expected
+
+
+def test_when_phonenumbers_internals_missing_then_same_results(monkeypatch):
+    monkeypatch.setattr(phone_recognizer, "CANDIDATE_PATTERN", None)
+    text = "Call (415) 555-0132 or +44 20 7946 0958, not 2023-01-05 10:30"
+    recognizer = PhoneRecognizer()
+    expected = {
+        (match.start, match.end)
+        for region in recognizer.supported_regions
+        for match in phonenumbers.PhoneNumberMatcher(text, region, leniency=1)
+    }
+
+    results = recognizer.analyze(text, ["PHONE_NUMBER"])
+
+    assert {(res.start, res.end) for res in results} == expected
+
+
+def test_when_all_regions_then_succeed():
+    recognizer = PhoneRecognizer(supported_regions=phonenumbers.SUPPORTED_REGIONS)
+
+    results = recognizer.analyze("Call me at +1 415 555 0132", ["PHONE_NUMBER"])
+
+    assert len(results) == 1
+    assert_result(results[0], "PHONE_NUMBER", 11, 26, PhoneRecognizer.SCORE)
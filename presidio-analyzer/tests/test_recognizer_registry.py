@@ -143,6 +143,29 @@ def test_when_remove_pattern_recognizer_then_item_removed():
     assert len(recognizer_registry.recognizers) == 0
 
 
+def test_when_lazy_load_predefined_recognizers_then_loaded_on_first_request():
+    registry = RecognizerRegistry()
+    registry.load_predefined_recognizers(languages=["en", "es"], lazy=True)
+    assert registry.recognizers == []
+
+    es_recognizers = registry.get_recognizers(language="es", all_fields=True)
+    assert "EsNifRecognizer" in [rec.name for rec in es_recognizers]
+    assert {rec.supported_language for rec in registry.recognizers} == {"es"}
+
+    en_recognizers = registry.get_recognizers(language="en", entities=["US_SSN"])
+    assert [rec.name for rec in en_recognizers] == ["UsSsnRecognizer"]
+
+
+def test_when_remove_recognizer_with_lazy_languages_then_removed_from_all():
+    registry = RecognizerRegistry()
+    registry.load_predefined_recognizers(languages=["en", "es"], lazy=True)
+    registry.remove_recognizer("EmailRecognizer")
+
+    for language in ("en", "es"):
+        recognizers = registry.get_recognizers(language=language, all_fields=True)
+        assert "EmailRecognizer" not in [rec.name for rec in recognizers]
+
+
 def test_add_recognizer_from_dict():
     registry = RecognizerRegistry()
     recognizer = {
@@ -1,5 +1,10 @@
 from typing import Iterator
 
+import pytest
+
+from presidio_analyzer.metrics import metrics_registry
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+
 
 def test_simple_process_text(nlp_engine):
 
@@ -21,3 +26,49 @@ def test_process_batch_strings(nlp_engine):
     for text, nlp_artifacts in nlp_artifacts_batch:
         assert text == "simple text"
         assert len(nlp_artifacts.tokens) == 2
+
+
+def test_when_lazy_load_then_models_loaded_on_first_use(mock_he_model, mock_bn_model):
+    engine = SpacyNlpEngine(models={"he": "he_test", "bn": "bn_test"}, lazy_load=True)
+    assert engine.nlp.loaded_languages == []
+    assert sorted(engine.nlp.keys()) == ["bn", "he"]
+    assert "he" in engine.nlp
+
+    nlp_artifacts = engine.process_text("simple text", language="he")
+    assert len(nlp_artifacts.tokens) == 2
+    assert engine.nlp.loaded_languages == ["he"]
+    assert "he" in engine.nlp.load_times
+    assert metrics_registry.get_gauge("nlp_model_loaded", language="he") == 1
+    assert metrics_registry.get_gauge("nlp_model_loaded", language="bn") == 0
+
+
+def test_when_max_loaded_models_exceeded_then_least_recently_used_evicted(
+    mock_he_model, mock_bn_model
+):
+    engine = SpacyNlpEngine(
+        models={"he": "he_test", "bn": "bn_test"}, lazy_load=True, max_loaded_models=1
+    )
+    evictions = metrics_registry.get_counter("nlp_model_evictions_total", language="he")
+
+    he_nlp = engine.get_nlp("he")
+    engine.get_nlp("bn")
+
+    assert engine.nlp.loaded_languages == ["bn"]
+    assert (
+        metrics_registry.get_counter("nlp_model_evictions_total", language="he")
+        == evictions + 1
+    )
+    # Evicted models are reloaded on the next request
+    assert engine.get_nlp("he") is not he_nlp
+    assert engine.nlp.loaded_languages == ["he"]
+
+
+def test_when_unknown_language_then_key_error(mock_he_model):
+    engine = SpacyNlpEngine(models={"he": "he_test"}, lazy_load=True)
+    with pytest.raises(KeyError):
+        engine.process_text("simple text", language="xx")
+
+
+def test_when_max_loaded_models_invalid_then_value_error():
+    with pytest.raises(ValueError):
+        SpacyNlpEngine(models={"he": "he_test"}, lazy_load=True, max_loaded_models=0)
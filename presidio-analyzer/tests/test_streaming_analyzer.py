@@ -0,0 +1,101 @@
+import pytest
+
+from presidio_analyzer import StreamingAnalyzer
+
+
+def _split(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _as_tuples(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+@pytest.fixture(scope="module")
+def long_text():
+    lines = [
+        f"Message {i}: my card is 4012888888881881 and my phone is 212-555-1234."
+        if i % 3 == 0
+        else f"Message {i}: nothing interesting here, see you tomorrow."
+        for i in range(40)
+    ]
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 500, 5000])
+def test_when_streamed_in_chunks_then_same_results_as_full_text(
+    analyzer_engine_simple, long_text, chunk_size
+):
+    expected = analyzer_engine_simple.analyze(long_text, language="en")
+    streaming = StreamingAnalyzer(
+        analyzer_engine_simple,
+        language="en",
+        max_entity_length=40,
+        context_length=60,
+        min_chunk_size=200,
+    )
+
+    results = list(streaming.analyze_stream(_split(long_text, chunk_size)))
+
+    assert len(expected) > 0
+    assert _as_tuples(results) == _as_tuples(expected)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 13, 97])
+def test_when_no_context_length_then_same_results_as_full_text(
+    analyzer_engine_simple, long_text, chunk_size
+):
+    expected = analyzer_engine_simple.analyze(long_text, language="en")
+    streaming = StreamingAnalyzer(
+        analyzer_engine_simple,
+        language="en",
+        max_entity_length=40,
+        context_length=0,
+        min_chunk_size=50,
+    )
+
+    results = list(streaming.analyze_stream(_split(long_text, chunk_size)))
+
+    assert _as_tuples(results) == _as_tuples(expected)
+
+
+def test_when_fed_then_results_are_final_and_buffer_is_bounded(
+    analyzer_engine_simple, long_text
+):
+    streaming = StreamingAnalyzer(
+        analyzer_engine_simple,
+        max_entity_length=40,
+        context_length=60,
+        min_chunk_size=200,
+    )
+
+    results = []
+    for chunk in _split(long_text, 50):
+        new_results = streaming.feed(chunk)
+        assert all(r.start < streaming.committed_offset for r in new_results)
+        results.extend(new_results)
+        assert len(streaming._buffer) <= 40 + 60 + 200 + 60 + 40 + 50
+    assert streaming.committed_offset > 0
+    results.extend(streaming.flush())
+
+    assert len({(r.start, r.end) for r in results}) == len(results)
+    assert streaming.offset == 0
+
+
+def test_when_text_is_short_then_results_only_on_flush(analyzer_engine_simple):
+    streaming = StreamingAnalyzer(analyzer_engine_simple)
+
+    assert streaming.feed("Call me at ") == []
+    assert streaming.feed("212-555-1234") == []
+    results = streaming.flush()
+
+    assert [(r.entity_type, r.start, r.end) for r in results] == [
+        ("PHONE_NUMBER", 11, 23)
+    ]
+
+
+def test_when_invalid_lengths_then_raise(analyzer_engine_simple):
+    with pytest.raises(ValueError):
+        StreamingAnalyzer(analyzer_engine_simple, max_entity_length=0)
+    with pytest.raises(ValueError):
+        StreamingAnalyzer(analyzer_engine_simple, context_length=-1)
@@ -0,0 +1,43 @@
+import pytest
+
+from presidio_analyzer.text_chunking import TextChunk, split_text
+
+
+def test_when_text_shorter_than_chunk_size_then_single_chunk():
+    assert split_text("short text", chunk_size=100) == [TextChunk(0, 10, 0, 10)]
+
+
+def test_when_text_has_paragraphs_then_split_on_paragraph_boundaries():
+    text = "First paragraph. Still first.\n\nSecond paragraph here.\n\nThird one."
+    chunks = split_text(text, chunk_size=40)
+
+    assert [text[c.start : c.end] for c in chunks] == [
+        "First paragraph. Still first.\n\n",
+        "Second paragraph here.\n\nThird one.",
+    ]
+
+
+def test_when_no_paragraphs_then_split_on_sentence_boundaries():
+    text = "One sentence here. Another sentence there. And a third one."
+    chunks = split_text(text, chunk_size=30)
+
+    assert text[chunks[0].start : chunks[0].end] == "One sentence here. "
+
+
+def test_when_overlap_then_chunks_overlap_and_own_the_text_once():
+    text = " ".join(f"word{i}" for i in range(200))
+    chunks = split_text(text, chunk_size=100, overlap=20)
+
+    assert chunks[0].start == 0 and chunks[-1].end == len(text)
+    for chunk, next_chunk in zip(chunks, chunks[1:]):
+        assert chunk.end - next_chunk.start >= 20
+        assert next_chunk.start < chunk.own_end == next_chunk.own_start < chunk.end
+        # Chunks start at the beginning of a word
+        assert text[next_chunk.start - 1] == " "
+    assert all(c.end - c.start <= 100 for c in chunks)
+
+
+@pytest.mark.parametrize("chunk_size, overlap", [(0, 0), (100, 50), (100, -1)])
+def test_when_invalid_sizes_then_value_error(chunk_size, overlap):
+    with pytest.raises(ValueError):
+        split_text("some text", chunk_size=chunk_size, overlap=overlap)
@@ -0,0 +1,99 @@
+import pytest
+import regex as re
+
+from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.metrics import metrics_registry
+from presidio_analyzer.text_prefilter import (
+    TextPrefilter,
+    derive_prefilter,
+    is_single_character,
+)
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [
+        (r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "@"),
+        (r"(bc1|[13])[a-zA-HJ-NP-Z0-9]{25,59}", "[13]"),
+        (r"https?://\w+", ":"),
+        (r"\b\d{4}\b", r"\d"),
+        (r"(?i)abc\.def", r"(?i)\."),
+        # Optional parts aren't required
+        (r"\d*@?", None),
+        # Look arounds don't consume characters
+        (r"(?<=@)[a-z]+", None),
+        # Too frequent to be useful
+        (r"[a-z]+ [a-z]+", None),
+        (r"[^@]+", None),
+        # Syntax not supported by the re module
+        (r"\p{L}+@", None),
+        # Syntax parsed differently by the re module
+        (r"(?x) \d{3} - \d{4}  # phone", None),
+        (r"[[:digit:]]+@", None),
+        (r"(?:hello){e<=1}@", None),
+    ],
+)
+def test_when_derive_prefilter_then_required_character_returned(regex, expected):
+    assert derive_prefilter(regex) == expected
+
+
+def test_when_verbose_pattern_then_not_skipped():
+    recognizer = PatternRecognizer(
+        supported_entity="PHONE",
+        patterns=[Pattern("phone", r"\d{3} - \d{4}  # local phone", 0.5)],
+    )
+
+    results = recognizer.analyze("call 555-1234", ["PHONE"], regex_flags=re.VERBOSE)
+
+    assert derive_prefilter(r"@\w+", re.VERBOSE) is None
+    assert [(r.start, r.end) for r in results] == [(5, 13)]
+
+
+@pytest.mark.parametrize(
+    "regex, expected", [("@", True), (r"[\d]", True), ("0x", False), (r"\d+", False)]
+)
+def test_is_single_character(regex, expected):
+    assert is_single_character(regex) == expected
+
+
+def test_when_prefilter_checked_then_matched_against_text():
+    text_prefilter = TextPrefilter("Write to john@example.com")
+
+    assert text_prefilter.matches("@")
+    assert not text_prefilter.matches(r"\d")
+    assert text_prefilter.matches("john@")
+    assert not text_prefilter.matches("JOHN@")
+    assert text_prefilter.matches("JOHN@", flags=re.IGNORECASE)
+    assert text_prefilter.matches(None)
+
+
+def test_when_scope_then_prefilter_shared_for_the_same_text():
+    text = "some text"
+    with TextPrefilter.scope(text) as text_prefilter:
+        assert TextPrefilter.for_text(text) is text_prefilter
+        assert TextPrefilter.for_text("other text") is not text_prefilter
+    assert TextPrefilter.for_text(text) is not text_prefilter
+
+
+def test_when_prefilter_not_found_then_pattern_skipped_and_counted():
+    metrics_registry.reset()
+    recognizer = PatternRecognizer(
+        supported_entity="EMAIL",
+        name="MyEmailRecognizer",
+        patterns=[Pattern("email", r"\b[\w.]+@[\w.]+\b", 0.5)],
+    )
+
+    assert recognizer.analyze("no address here", ["EMAIL"]) == []
+    results = recognizer.analyze("write to a@b.com", ["EMAIL"])
+
+    assert len(results) == 1
+    labels = {"recognizer": "MyEmailRecognizer", "pattern": "email"}
+    assert metrics_registry.get_counter(
+        "pattern_prefilter_checks_total", result="skip", **labels
+    ) == 1
+    assert metrics_registry.get_counter(
+        "pattern_prefilter_checks_total", result="match", **labels
+    ) == 1
+    assert metrics_registry.get_histogram(
+        "pattern_duration_seconds", **labels
+    ).count == 1
@@ -0,0 +1,130 @@
+import re
+
+import pytest
+import spacy
+from spacy.tokens import Span
+
+from presidio_analyzer.nlp_engine.transformers_nlp_engine import (
+    TextWindow,
+    TransformersComponent,
+    merge_window_entities,
+    split_to_windows,
+)
+
+
+def whitespace_offsets(text):
+    return [match.span() for match in re.finditer(r"\S+", text)]
+
+
+class CapitalizedWordsPipeline:
+    """Mock of a transformers NER pipeline, tagging capitalized words as PER."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size):
+        self.calls.append(list(texts))
+        return [
+            [
+                {
+                    "entity_group": "PER",
+                    "start": match.start(),
+                    "end": match.end(),
+                    "score": 0.9,
+                }
+                for match in re.finditer(r"\b[A-Z]\w+", text)
+            ]
+            for text in texts
+        ]
+
+
+class WhitespaceTokenizer:
+    def __call__(self, text, add_special_tokens, return_offsets_mapping):
+        offsets = whitespace_offsets(text)
+        return {
+            "input_ids": [hash(text[start:end]) % 1000 for start, end in offsets],
+            "offset_mapping": offsets,
+        }
+
+
+@pytest.fixture
+def transformers_component():
+    # Avoid loading a transformers model, using mocks of the tokenizer and pipeline
+    component = TransformersComponent.__new__(TransformersComponent)
+    Span.set_extension("confidence_score", default=1.0, force=True)
+    component.nlp = CapitalizedWordsPipeline()
+    component.onnx_model = None
+    component.tokenizer = WhitespaceTokenizer()
+    component.batch_size = 4
+    component.max_tokens = 4
+    component.stride = 2
+    return component
+
+
+def test_when_text_shorter_than_max_tokens_then_single_window():
+    text = "one two three"
+    windows = split_to_windows(len(text), whitespace_offsets(text), 4, 2)
+    assert windows == [TextWindow(0, len(text), 0, len(text), 0, 3)]
+
+
+def test_when_text_longer_than_max_tokens_then_overlapping_windows():
+    text = "aa bb cc dd ee ff"
+    windows = split_to_windows(len(text), whitespace_offsets(text), 4, 2)
+
+    assert [text[w.start : w.end] for w in windows] == ["aa bb cc dd", "cc dd ee ff"]
+    assert [(w.token_start, w.token_end) for w in windows] == [(0, 4), (2, 6)]
+    # Each window owns the text up to the middle of the overlap ("cc dd")
+    assert windows[0].own_start == 0
+    assert windows[0].own_end == windows[1].own_start == 8
+    assert windows[1].own_end == len(text)
+
+
+def test_when_no_stride_then_windows_do_not_overlap():
+    text = "aa bb cc dd ee"
+    windows = split_to_windows(len(text), whitespace_offsets(text), 2, 0)
+
+    assert [text[w.start : w.end] for w in windows] == ["aa bb", "cc dd", "ee"]
+    assert [w.own_start for w in windows] == [0, 6, 12]
+
+
+def test_when_entity_found_in_overlap_then_kept_once_with_text_offsets():
+    windows = [TextWindow(0, 11, 0, 7), TextWindow(6, 17, 7, 17)]
+    predictions = [
+        [{"entity_group": "PER", "start": 6, "end": 8, "score": 0.8}],
+        [
+            {"entity_group": "PER", "start": 0, "end": 2, "score": 0.9},
+            {"entity_group": "LOC", "start": 9, "end": 11, "score": 0.7},
+        ],
+    ]
+
+    entities = merge_window_entities(windows, predictions)
+
+    assert [(e["entity_group"], e["start"], e["end"]) for e in entities] == [
+        ("PER", 6, 8),
+        ("LOC", 15, 17),
+    ]
+    assert entities[0]["score"] == 0.8
+
+
+def test_when_pipe_then_windows_of_all_docs_batched(transformers_component):
+    nlp = spacy.blank("en")
+    texts = ["Hello David how are you Sarah", "Call Lisa", ""]
+    docs = list(transformers_component.pipe(nlp.pipe(texts)))
+
+    assert len(transformers_component.nlp.calls) == 1
+    assert transformers_component.nlp.calls[0] == [
+        "Hello David how are",
+        "how are you Sarah",
+        "Call Lisa",
+    ]
+    assert [[ent.text for ent in doc.ents] for doc in docs] == [
+        ["Hello", "David", "Sarah"],
+        ["Call", "Lisa"],
+        [],
+    ]
+
+
+def test_when_call_then_entities_set(transformers_component):
+    doc = transformers_component(spacy.blank("en")("meet John tomorrow"))
+    assert [(ent.text, ent.label_) for ent in doc.ents] == [("John", "PER")]
+    assert doc.ents[0]._.confidence_score == 0.9
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from presidio_analyzer import PatternRecognizer
+from presidio_analyzer.predefined_recognizers import (
+    AuAbnRecognizer,
+    AuAcnRecognizer,
+    AuMedicareRecognizer,
+    AuTfnRecognizer,
+    CreditCardRecognizer,
+    NhsRecognizer,
+)
+from presidio_analyzer.predefined_recognizers.vectorized_checksums import (
+    MIN_VECTORIZED_BATCH,
+    digit_matrix,
+)
+
+
+def _random_texts(lengths, separators, count=2000):
+    rng = random.Random(1)
+    texts = []
+    for _ in range(count):
+        text = "".join(rng.choice("0123456789") for _ in range(rng.choice(lengths)))
+        if rng.random() < 0.3:
+            position = rng.randrange(1, len(text))
+            text = text[:position] + rng.choice(separators) + text[position:]
+        texts.append(text)
+    return texts
+
+
+@pytest.mark.parametrize(
+    "recognizer, lengths",
+    [
+        (CreditCardRecognizer(), [13, 14, 15, 16, 19]),
+        (AuAbnRecognizer(), [11]),
+        (AuAcnRecognizer(), [9]),
+        (AuMedicareRecognizer(), [10]),
+        (AuTfnRecognizer(), [9]),
+        (NhsRecognizer(), [10]),
+    ],
+)
+def test_when_batch_validated_then_same_results_as_single_validation(
+    recognizer, lengths
+):
+    texts = _random_texts(lengths, separators=[" ", "-"])
+
+    expected = [recognizer.validate_result(text) for text in texts]
+    results = recognizer.validate_results(texts)
+
+    assert results == expected
+    assert any(expected) and not all(expected)
+
+
+def test_when_small_batch_then_validated_one_at_a_time():
+    class CountingRecognizer(CreditCardRecognizer):
+        calls = 0
+
+        def validate_result(self, pattern_text):
+            CountingRecognizer.calls += 1
+            return super().validate_result(pattern_text)
+
+    texts = ["4012888888881881"] * MIN_VECTORIZED_BATCH
+    assert CreditCardRecognizer().validate_results(texts[:1]) == [True]
+    assert CountingRecognizer().validate_results(texts) == [True] * len(texts)
+    assert CountingRecognizer.calls == len(texts)
+
+
+def test_when_default_validate_results_then_validate_result_per_text():
+    recognizer = PatternRecognizer(supported_entity="TEST", deny_list=["a"])
+
+    assert recognizer.validate_results(["a", "b"]) == [None, None]
+
+
+def test_when_digit_matrix_then_texts_right_aligned():
+    matrix, rows, others = digit_matrix(["123", "4", "5a", "", "٣"])
+
+    assert matrix.tolist() == [[1, 2, 3], [0, 0, 4]]
+    assert rows == [0, 1]
+    assert others == [2, 3, 4]
+
+
+def test_when_digit_matrix_with_length_then_other_lengths_not_converted():
+    matrix, rows, others = digit_matrix(["123", "4", "567"], length=3)
+
+    assert matrix.tolist() == [[1, 2, 3], [5, 6, 7]]
+    assert rows == [0, 2]
+    assert others == [1]
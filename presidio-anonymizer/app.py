@@ -3,16 +3,24 @@ import logging
 import os
 from logging.config import fileConfig
 from pathlib import Path
+from typing import Optional
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, g
 from werkzeug.exceptions import BadRequest, HTTPException
 
 from presidio_anonymizer import AnonymizerEngine, DeanonymizeEngine
+from presidio_anonymizer.core.metrics import MultiprocessMetrics, metrics_registry
 from presidio_anonymizer.entities import InvalidParamException
+from presidio_anonymizer.services.admission_controller import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
 from presidio_anonymizer.services.app_entities_convertor import AppEntitiesConvertor
 
 DEFAULT_PORT = "3000"
 
+ADMISSION_CONTROLLED_ENDPOINTS = ("anonymize", "deanonymize")
+
 LOGGING_CONF_FILE = "logging.ini"
 
 WELCOME_MESSAGE = r"""
@@ -31,20 +39,67 @@ class Server:
     """Flask server for anonymizer."""
 
     def __init__(self):
-        fileConfig(Path(Path(__file__).parent, LOGGING_CONF_FILE))
+        fileConfig(
+            Path(Path(__file__).parent, LOGGING_CONF_FILE),
+            disable_existing_loggers=False,
+        )
         self.logger = logging.getLogger("presidio-anonymizer")
         self.logger.setLevel(os.environ.get("LOG_LEVEL", self.logger.level))
         self.app = Flask(__name__)
         self.logger.info("Starting anonymizer engine")
         self.anonymizer = AnonymizerEngine()
         self.deanonymize = DeanonymizeEngine()
+        self.admission_controller = AdmissionController(
+            max_concurrent_requests=_get_env_int("MAX_CONCURRENT_REQUESTS"),
+            max_inflight_bytes=_get_env_int("MAX_INFLIGHT_BYTES"),
+            max_request_bytes=_get_env_int("MAX_REQUEST_BYTES"),
+            max_queue_size=_get_env_int("MAX_QUEUE_SIZE"),
+            queue_timeout=float(os.environ.get("QUEUE_TIMEOUT", "10")),
+            small_request_bytes=_get_env_int("SMALL_REQUEST_BYTES") or 0,
+        )
+        self.multiprocess_metrics = None
+        if os.environ.get("METRICS_MULTIPROC_DIR"):
+            self.multiprocess_metrics = MultiprocessMetrics(
+                metrics_registry, os.environ["METRICS_MULTIPROC_DIR"]
+            )
         self.logger.info(WELCOME_MESSAGE)
 
+        @self.app.before_request
+        def admit_request() -> None:
+            """Limit the in-flight work, rejecting requests when overloaded."""
+            if request.endpoint in ADMISSION_CONTROLLED_ENDPOINTS:
+                # None for chunked requests, rejected when a byte limit is set
+                size = request.content_length
+                self.admission_controller.acquire(size)
+                g.admitted_size = size or 0
+
+        @self.app.teardown_request
+        def release_request(exception: Optional[BaseException]) -> None:
+            """Release the capacity held by an admitted request, record metrics."""
+            size = g.pop("admitted_size", None)
+            if size is not None:
+                self.admission_controller.release(size)
+            if self.multiprocess_metrics:
+                self.multiprocess_metrics.write_snapshot()
+
         @self.app.route("/health")
         def health() -> str:
             """Return basic health probe result."""
             return "Presidio Anonymizer service is up"
 
+        @self.app.route("/ready")
+        def ready():
+            """Return readiness probe result, served once the engines are created."""
+            return jsonify(ready=True), 200
+
+        @self.app.route("/metrics")
+        def metrics() -> Response:
+            """Return the latency metrics in Prometheus format."""
+            exporter = self.multiprocess_metrics or metrics_registry
+            return Response(
+                exporter.to_prometheus(), mimetype="text/plain; version=0.0.4"
+            )
+
         @self.app.route("/anonymize", methods=["POST"])
         def anonymize() -> Response:
             content = request.get_json()
@@ -103,6 +158,12 @@ class Server:
             )
             return jsonify(error=err.err_msg), 422
 
+        @self.app.errorhandler(AdmissionRejectedError)
+        def admission_rejected(e):
+            response = jsonify(error=e.message)
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, e.status_code
+
         @self.app.errorhandler(HTTPException)
         def http_exception(e):
             return jsonify(error=e.description), e.code
@@ -113,6 +174,23 @@ class Server:
             return jsonify(error="Internal server error"), 500
 
 
+def _get_env_int(name: str) -> Optional[int]:
+    """Return an integer environment variable, or None if it is not set."""
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+def create_app() -> Flask:
+    """
+    Create the anonymizer WSGI application.
+
+    Used by production WSGI servers, for example:
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+    """
+    server = Server()
+    return server.app
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", DEFAULT_PORT))
     server = Server()
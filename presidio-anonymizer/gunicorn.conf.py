@@ -0,0 +1,67 @@
+"""
+Gunicorn configuration for running Presidio Anonymizer with multiple workers.
+
+Usage: gunicorn -c gunicorn.conf.py "app:create_app()"
+
+The application is loaded once in the master process before forking,
+so workers share its memory pages copy-on-write. Loaded objects are frozen
+before each fork, so that the garbage collector does not touch (and copy)
+shared pages. Garbage collection, disabled while loading, is re-enabled in the
+master once it is ready, and in each worker.
+
+Settings are read from environment variables:
+- PORT: Port to bind to (default 3000)
+- WORKERS: Number of worker processes (default 1)
+- THREADS: Number of threads per worker (default 1)
+- PRELOAD_APP: Whether to load the app in the master process (default true)
+- TIMEOUT: Worker timeout in seconds (default 120)
+- GRACEFUL_TIMEOUT: Seconds to finish in-flight requests on reload/stop (default 30)
+- MAX_REQUESTS: Recycle a worker after this many requests, 0 to disable (default 0)
+- METRICS_MULTIPROC_DIR: Directory shared by the workers to aggregate their /metrics
+  (default unset, each worker reports its own metrics)
+
+Send SIGHUP to the master to gracefully restart the workers.
+As the app is preloaded, picking up new code or configuration requires
+a new master: send SIGUSR2 to start one, then SIGTERM to the old master.
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '3000')}"
+workers = int(os.environ.get("WORKERS", "1"))
+threads = int(os.environ.get("THREADS", "1"))
+preload_app = os.environ.get("PRELOAD_APP", "true").lower() == "true"
+timeout = int(os.environ.get("TIMEOUT", "120"))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+max_requests = int(os.environ.get("MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+if preload_app:
+    # Avoid collections in the master while the app is being loaded.
+    gc.disable()
+
+
+def on_starting(server):  # noqa: ANN001
+    """Remove the metrics snapshots of a previous run."""
+    metrics_dir = os.environ.get("METRICS_MULTIPROC_DIR")
+    if metrics_dir and os.path.isdir(metrics_dir):
+        for file_name in os.listdir(metrics_dir):
+            os.remove(os.path.join(metrics_dir, file_name))
+
+
+def when_ready(server):  # noqa: ANN001
+    """Freeze the loaded objects and re-enable garbage collection in the master."""
+    if preload_app:
+        gc.freeze()
+        gc.enable()
+
+
+def pre_fork(server, worker):  # noqa: ANN001
+    """Move all objects allocated so far to the permanent generation."""
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server, worker):  # noqa: ANN001
+    """Re-enable garbage collection in the worker."""
+    gc.enable()
@@ -1,13 +1,40 @@
 """Anonymizer root module."""
+import importlib
 import logging
+from typing import List
+
+# The engines import the operators and their dependencies (e.g. pycryptodome),
+# so they are only imported on first access. This keeps importing modules
+# such as presidio_anonymizer.services.metrics (used by the analyzer) light.
+_LAZY_IMPORTS = {
+    "AnonymizerEngine": ".anonymizer_engine",
+    "DeanonymizeEngine": ".deanonymize_engine",
+    "BatchAnonymizerEngine": ".batch_anonymizer_engine",
+    "ArrowAnonymizationPipeline": ".arrow_pipeline",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .anonymizer_engine import AnonymizerEngine
-from .deanonymize_engine import DeanonymizeEngine
-from .batch_anonymizer_engine import BatchAnonymizerEngine
 
 # Set up default logging (with NullHandler)
 
 
 logging.getLogger("presidio-anonymizer").addHandler(logging.NullHandler())
 
-__all__ = ["AnonymizerEngine", "DeanonymizeEngine", "BatchAnonymizerEngine"]
+__all__ = [
+    "AnonymizerEngine",
+    "DeanonymizeEngine",
+    "BatchAnonymizerEngine",
+    "ArrowAnonymizationPipeline",
+]
@@ -1,11 +1,17 @@
 """Handles the entire logic of the Presidio-anonymizer and text anonymizing."""
+import copy
+import json
 import logging
 import re
+import time
 from typing import List, Dict, Optional
 
 from presidio_anonymizer.core import EngineBase
+from presidio_anonymizer.core.metrics import metrics_registry
 from presidio_anonymizer.entities import OperatorConfig, RecognizerResult, EngineResult
+from presidio_anonymizer.entities import InvalidParamException
 from presidio_anonymizer.operators import OperatorType
+from presidio_anonymizer.services.app_entities_convertor import AppEntitiesConvertor
 
 DEFAULT = "replace"
 
@@ -75,6 +81,7 @@ class AnonymizerEngine(EngineBase):
 
 
         """
+        anonymize_start_time = time.perf_counter()
         analyzer_results = self._remove_conflicts_and_get_text_manipulation_data(
             analyzer_results
         )
@@ -85,7 +92,13 @@ class AnonymizerEngine(EngineBase):
 
         operators = self.__check_or_add_default_operator(operators)
 
-        return self._operate(text, merged_results, operators, OperatorType.Anonymize)
+        engine_result = self._operate(
+            text, merged_results, operators, OperatorType.Anonymize
+        )
+        metrics_registry.observe(
+            "anonymize_duration_seconds", time.perf_counter() - anonymize_start_time
+        )
+        return engine_result
 
     def _remove_conflicts_and_get_text_manipulation_data(
             self, analyzer_results: List[RecognizerResult]
@@ -162,6 +175,55 @@ class AnonymizerEngine(EngineBase):
             prev_result = result
         return merged_results
 
+    def to_spec(self, operators: Optional[Dict[str, OperatorConfig]] = None) -> Dict:
+        """
+        Describe this engine and an operator plan by a JSON serializable dictionary.
+
+        Worker processes or cluster executors receiving the spec
+        create the engine with `from_spec`,
+        and the operators with `operators_from_spec`.
+
+        :param operators: The operators per entity type, to use with this engine
+        :return: The spec, with the operators in the JSON format of the REST API
+        """
+        operators_spec = {}
+        for entity_type, operator in (operators or {}).items():
+            operator_spec = {"type": operator.operator_name, **operator.params}
+            try:
+                json.dumps(operator_spec)
+            except (TypeError, ValueError):
+                raise InvalidParamException(
+                    f"Operator {operator.operator_name} of {entity_type} "
+                    "can't be described by a spec"
+                )
+            operators_spec[entity_type] = operator_spec
+        return {"operators": operators_spec}
+
+    @classmethod
+    def from_spec(cls, spec: Dict) -> "AnonymizerEngine":
+        """
+        Create an engine from its description by `to_spec`.
+
+        The engine holds no state of its own, the spec's operator plan
+        is returned by `operators_from_spec`.
+
+        :param spec: The engine's spec
+        """
+        return cls()
+
+    @staticmethod
+    def operators_from_spec(spec: Dict) -> Dict[str, OperatorConfig]:
+        """
+        Return the operator plan of a spec created by `to_spec`.
+
+        :param spec: The engine's spec
+        :return: The operators per entity type
+        """
+        # from_json pops the operator type out of its parameters
+        return AppEntitiesConvertor.operators_config_from_json(
+            copy.deepcopy(spec.get("operators"))
+        )
+
     def get_anonymizers(self) -> List[str]:
         """Return a list of supported anonymizers."""
         names = [p for p in self.operators_factory.get_anonymizers().keys()]
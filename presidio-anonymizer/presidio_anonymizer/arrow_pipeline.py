@@ -0,0 +1,342 @@
+import collections
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from presidio_anonymizer import BatchAnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig
+
+logger = logging.getLogger("presidio-anonymizer")
+
+DEFAULT_BATCH_SIZE = 10000
+
+_FORMATS_BY_SUFFIX = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".csv": "csv",
+}
+
+
+class ArrowAnonymizationPipeline:
+    """
+    Anonymize columns of Arrow record batches, one batch at a time.
+
+    Each batch's selected columns are analyzed with
+    `BatchAnalyzerEngine.analyze_column` and anonymized with
+    `BatchAnonymizerEngine.anonymize_list`, the other columns are kept as is.
+    Anonymized columns are converted to strings.
+    Files (Parquet, Arrow IPC or CSV) are read and written as streams of batches,
+    so memory is bounded by the batch size and the number of batches
+    in flight, regardless of the file's size.
+
+    Requires pyarrow (`pip install presidio-anonymizer[arrow]`).
+
+    :param batch_analyzer: A presidio_analyzer.BatchAnalyzerEngine instance
+    :param columns: Names of the columns to anonymize
+    :param language: Language of the columns' texts
+    :param batch_anonymizer: BatchAnonymizerEngine instance to use,
+    a default one if None
+    :param operators: The anonymization operators per entity type,
+    for `AnonymizerEngine.anonymize`
+    :param max_workers: Number of workers processing batches in parallel.
+    Worker processes are forked, sharing the engines' loaded models.
+    Where fork isn't available, threads are used instead.
+    :param max_pending_batches: Maximum number of batches being processed
+    at once, twice max_workers if None
+    :param analyze_kwargs: Additional parameters for
+    `BatchAnalyzerEngine.analyze_column`
+    """
+
+    def __init__(
+        self,
+        batch_analyzer: "BatchAnalyzerEngine",  # noqa F821
+        columns: List[str],
+        language: str = "en",
+        batch_anonymizer: Optional[BatchAnonymizerEngine] = None,
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        max_workers: int = 1,
+        max_pending_batches: Optional[int] = None,
+        **analyze_kwargs,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers should be a positive number")
+        if max_pending_batches is None:
+            max_pending_batches = 2 * max_workers
+        if max_pending_batches < max_workers:
+            raise ValueError("max_pending_batches should be at least max_workers")
+        self.batch_analyzer = batch_analyzer
+        self.columns = list(columns)
+        self.language = language
+        self.batch_anonymizer = batch_anonymizer or BatchAnonymizerEngine()
+        self.operators = operators
+        self.max_workers = max_workers
+        self.max_pending_batches = max_pending_batches
+        self.analyze_kwargs = analyze_kwargs
+
+    def output_schema(self, schema: "pa.Schema") -> "pa.Schema":  # noqa F821
+        """
+        Return the schema of the anonymized batches of a schema's batches.
+
+        :param schema: Schema of the input batches
+        """
+        import pyarrow as pa
+
+        missing = [name for name in self.columns if name not in schema.names]
+        if missing:
+            raise ValueError(f"Columns {missing} are not in the schema")
+        fields = []
+        for schema_field in schema:
+            if schema_field.name in self.columns and not (
+                pa.types.is_string(schema_field.type)
+                or pa.types.is_large_string(schema_field.type)
+            ):
+                schema_field = schema_field.with_type(pa.string())
+            fields.append(schema_field)
+        return pa.schema(fields, metadata=schema.metadata)
+
+    def process_batch(
+        self, batch: "pa.RecordBatch"  # noqa F821
+    ) -> "pa.RecordBatch":  # noqa F821
+        """
+        Anonymize the selected columns of a record batch.
+
+        :param batch: The batch to anonymize
+        :return: The anonymized batch
+        """
+        import pyarrow as pa
+
+        schema = self.output_schema(batch.schema)
+        arrays = []
+        for schema_field, array in zip(schema, batch.columns):
+            if schema_field.name in self.columns:
+                array = pa.array(self._anonymize_values(array), type=schema_field.type)
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def process_batches(
+        self, batches: Iterable["pa.RecordBatch"]  # noqa F821
+    ) -> Iterator["pa.RecordBatch"]:  # noqa F821
+        """
+        Anonymize a stream of record batches.
+
+        Batches are read from the stream as workers become available,
+        and yielded in the input order.
+
+        :param batches: The batches to anonymize
+        :return: The anonymized batches
+        """
+        if self.max_workers == 1:
+            yield from map(self.process_batch, batches)
+            return
+
+        executor, process = self._create_executor()
+        with executor:
+            pending = collections.deque()
+            for batch in batches:
+                pending.append(executor.submit(process, batch))
+                if len(pending) >= self.max_pending_batches:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def process_file(
+        self,
+        source: Union[str, Path],
+        destination: Union[str, Path],
+        source_format: Optional[str] = None,
+        destination_format: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """
+        Anonymize a Parquet, Arrow IPC or CSV file into a new file.
+
+        :param source: Path of the file to anonymize
+        :param destination: Path of the anonymized file
+        :param source_format: "parquet", "ipc" or "csv",
+        inferred from the file's extension if None
+        :param destination_format: Format of the anonymized file,
+        the source's format if None
+        :param batch_size: Maximum number of rows in a batch
+        :return: Number of anonymized rows
+        """
+        source_format = source_format or get_file_format(source)
+        destination_format = destination_format or source_format
+        row_count = 0
+        with open_batch_reader(source, source_format, batch_size) as reader:
+            with open_batch_writer(
+                destination, self.output_schema(reader.schema), destination_format
+            ) as writer:
+                for batch in self.process_batches(reader):
+                    writer.write_batch(batch)
+                    row_count += batch.num_rows
+        logger.info(f"Anonymized {row_count} rows of {source} into {destination}")
+        return row_count
+
+    def _anonymize_values(self, array: "pa.Array") -> List[Optional[str]]:  # noqa F821
+        values = [None if value is None else str(value) for value in array.to_pylist()]
+        results = list(
+            self.batch_analyzer.analyze_column(
+                values, language=self.language, **self.analyze_kwargs
+            )
+        )
+        kwargs = {"operators": self.operators} if self.operators else {}
+        return self.batch_anonymizer.anonymize_list(values, results, **kwargs)
+
+    def _create_executor(self):
+        if "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit this pipeline, no need to pickle its engines
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_set_worker_pipeline,
+                initargs=(self,),
+            )
+            return executor, _process_batch_in_worker
+        logger.warning("fork is not available, processing batches using threads")
+        return ThreadPoolExecutor(max_workers=self.max_workers), self.process_batch
+
+
+def get_file_format(path: Union[str, Path]) -> str:
+    """Return the format of a file ("parquet", "ipc" or "csv") by its extension."""
+    suffix = Path(path).suffix.lower()
+    if suffix not in _FORMATS_BY_SUFFIX:
+        raise ValueError(f"Unknown file format of {path}, please specify it")
+    return _FORMATS_BY_SUFFIX[suffix]
+
+
+def open_batch_reader(
+    path: Union[str, Path], file_format: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> "_BatchReader":
+    """
+    Open a file for reading it as a stream of record batches.
+
+    :param path: Path of the file
+    :param file_format: "parquet", "ipc" or "csv"
+    :param batch_size: Maximum number of rows in a batch. Larger batches
+    (e.g. as written in an IPC file) are split.
+    :return: A reader with the file's schema, iterating its batches
+    """
+    import pyarrow as pa
+
+    if batch_size < 1:
+        raise ValueError("batch_size should be a positive number")
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        schema = parquet_file.schema_arrow
+        batches = parquet_file.iter_batches(batch_size=batch_size)
+        source = parquet_file
+    elif file_format == "ipc":
+        source = pa.memory_map(str(path))
+        try:
+            reader = pa.ipc.open_file(source)
+        except Exception:
+            source.close()
+            raise
+        schema = reader.schema
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    elif file_format == "csv":
+        import pyarrow.csv
+
+        source = pyarrow.csv.open_csv(path)
+        schema = source.schema
+        batches = iter(source)
+    else:
+        raise ValueError(f"Unsupported file format {file_format}")
+    return _BatchReader(source, schema, _split_batches(batches, batch_size))
+
+
+def open_batch_writer(
+    path: Union[str, Path], schema: "pa.Schema", file_format: str  # noqa F821
+) -> "_BatchWriter":
+    """
+    Open a file for writing record batches.
+
+    :param path: Path of the file
+    :param schema: Schema of the written batches
+    :param file_format: "parquet", "ipc" or "csv"
+    """
+    import pyarrow as pa
+
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(str(path), schema)
+    elif file_format == "ipc":
+        writer = pa.ipc.new_file(str(path), schema)
+    elif file_format == "csv":
+        import pyarrow.csv
+
+        writer = pyarrow.csv.CSVWriter(str(path), schema)
+    else:
+        raise ValueError(f"Unsupported file format {file_format}")
+    return _BatchWriter(writer)
+
+
+class _BatchReader:
+    """Iterate the record batches of a file, closing it when done."""
+
+    def __init__(self, source, schema: "pa.Schema", batches):  # noqa F821
+        self.source = source
+        self.schema = schema
+        self.batches = batches
+
+    def __iter__(self) -> Iterator["pa.RecordBatch"]:  # noqa F821
+        return self.batches
+
+    def close(self) -> None:
+        self.source.close()
+
+    def __enter__(self) -> "_BatchReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class _BatchWriter:
+    """Write record batches with any of pyarrow's Parquet, IPC and CSV writers."""
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def write_batch(self, batch: "pa.RecordBatch") -> None:  # noqa F821
+        import pyarrow as pa
+
+        self.writer.write_table(pa.Table.from_batches([batch]))
+
+    def close(self) -> None:
+        self.writer.close()
+
+    def __enter__(self) -> "_BatchWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _split_batches(
+    batches: Iterable["pa.RecordBatch"], batch_size: int  # noqa F821
+) -> Iterator["pa.RecordBatch"]:  # noqa F821
+    for batch in batches:
+        for offset in range(0, batch.num_rows, batch_size):
+            yield batch.slice(offset, batch_size)
+
+
+# The pipeline of a process anonymizing batches
+_worker_pipeline: Optional[ArrowAnonymizationPipeline] = None
+
+
+def _set_worker_pipeline(pipeline: ArrowAnonymizationPipeline) -> None:
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _process_batch_in_worker(batch: "pa.RecordBatch") -> "pa.RecordBatch":  # noqa F821
+    return _worker_pipeline.process_batch(batch)
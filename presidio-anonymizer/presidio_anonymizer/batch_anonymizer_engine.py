@@ -1,5 +1,5 @@
 import collections
-from typing import List, Dict, Union, Iterable, Optional
+from typing import List, Dict, Union, Iterable, Iterator, Optional, Any
 
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import DictRecognizerResult
@@ -82,3 +82,19 @@ class BatchAnonymizerEngine:
             else:
                 return_dict[result.key] = result.value
         return return_dict
+
+    def anonymize_records(
+        self,
+        analyzer_results: Iterable[Iterable[DictRecognizerResult]],
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Anonymize a stream of records (dictionaries).
+
+        :param analyzer_results: For each record, its `DictRecognizerResult`s,
+        e.g. the output of `BatchAnalyzerEngine.analyze_records`
+        :param kwargs: Additional kwargs for the `AnonymizerEngine.anonymize` method
+        :return: The anonymized records, in the input order
+        """
+        for record_results in analyzer_results:
+            yield self.anonymize_dict(record_results, **kwargs)
@@ -3,6 +3,7 @@ import logging
 from abc import ABC
 from typing import List, Dict
 
+from presidio_anonymizer.core.metrics import metrics_registry
 from presidio_anonymizer.core.text_replace_builder import TextReplaceBuilder
 from presidio_anonymizer.entities import (
     PIIEntity,
@@ -89,7 +90,12 @@ class EngineBase(ABC):
         params = operator_metadata.params
         params["entity_type"] = entity_type
         self.logger.debug(f"operating on {entity_type} with {operator}")
-        operated_on_text = operator.operate(params=params, text=text_to_operate_on)
+        with metrics_registry.timer(
+            "operator_duration_seconds",
+            operator=operator_metadata.operator_name,
+            operator_type=operator_type.name,
+        ):
+            operated_on_text = operator.operate(params=params, text=text_to_operate_on)
         return operated_on_text
 
     @staticmethod
@@ -0,0 +1,16 @@
+"""Latency metrics of the anonymizer."""
+from presidio_anonymizer.services.metrics import (
+    Histogram,
+    MetricsRegistry,
+    MultiprocessMetrics,
+)
+
+__all__ = ["Histogram", "MetricsRegistry", "MultiprocessMetrics", "metrics_registry"]
+
+metrics_registry = MetricsRegistry(namespace="presidio_anonymizer")
+metrics_registry.describe(
+    "anonymize_duration_seconds", "Time spent in AnonymizerEngine.anonymize"
+)
+metrics_registry.describe(
+    "operator_duration_seconds", "Time spent in each operator's operate"
+)
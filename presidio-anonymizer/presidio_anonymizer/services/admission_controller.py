@@ -0,0 +1,218 @@
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Deque, Iterator
+
+logger = logging.getLogger("presidio-anonymizer")
+
+
+class AdmissionRejectedError(Exception):
+    """
+    Raised when a request is not admitted by the AdmissionController.
+
+    :param message: Description of the rejection reason
+    :param status_code: HTTP status code to return to the caller
+    :param retry_after: Suggested number of seconds before retrying
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: int = 1):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    """A request waiting in the admission queue."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.granted = False
+        self.event = threading.Event()
+
+
+class AdmissionController:
+    """
+    Cap the in-flight work of a server by request count and text size.
+
+    Requests which cannot be admitted immediately wait in a queue until
+    capacity frees up or their deadline passes. Small requests wait in a
+    separate priority lane, so they are not starved by large ones.
+
+    :param max_concurrent_requests: Maximum number of requests processed
+    at the same time (None for no limit)
+    :param max_inflight_bytes: Maximum total size (in bytes) of requests
+    processed at the same time (None for no limit).
+    A single request larger than this limit is admitted only when no other
+    request is in flight.
+    :param max_request_bytes: Maximum size of a single request (None for no limit).
+    Larger requests are rejected with status 413.
+    :param max_queue_size: Maximum number of waiting requests (None for no limit).
+    When the queue is full, new requests are rejected with status 429.
+    :param queue_timeout: Maximum time in seconds a request waits to be admitted.
+    Requests waiting longer are rejected with status 503.
+    :param small_request_bytes: Requests of at most this size are
+    prioritized over larger ones (0 to disable the priority lane).
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: Optional[int] = None,
+        max_inflight_bytes: Optional[int] = None,
+        max_request_bytes: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        queue_timeout: float = 10.0,
+        small_request_bytes: int = 0,
+    ):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_inflight_bytes = max_inflight_bytes
+        self.max_request_bytes = max_request_bytes
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.small_request_bytes = small_request_bytes
+
+        self.inflight_requests = 0
+        self.inflight_bytes = 0
+        self._lock = threading.Lock()
+        self._priority_lane: Deque[_Waiter] = deque()
+        self._regular_lane: Deque[_Waiter] = deque()
+
+    @property
+    def queued_requests(self) -> int:
+        """Return the number of requests waiting to be admitted."""
+        return len(self._priority_lane) + len(self._regular_lane)
+
+    def acquire(self, size: Optional[int]) -> None:
+        """
+        Admit a request of a given size, waiting in the queue if needed.
+
+        :param size: Size of the request in bytes, None if unknown
+        (e.g. a request without a Content-Length header).
+        Requests of unknown size are rejected with status 411 when a byte
+        limit is set, as they could bypass it, and counted as 0 bytes otherwise.
+        :raises AdmissionRejectedError: if the request was not admitted
+        """
+        if size is None:
+            if (
+                self.max_request_bytes is not None
+                or self.max_inflight_bytes is not None
+            ):
+                raise AdmissionRejectedError(
+                    "Requests without a Content-Length header are not accepted",
+                    status_code=411,
+                )
+            size = 0
+
+        if self.max_request_bytes is not None and size > self.max_request_bytes:
+            raise AdmissionRejectedError(
+                f"Request size {size} exceeds the maximum "
+                f"of {self.max_request_bytes} bytes",
+                status_code=413,
+            )
+
+        with self._lock:
+            # Small requests only wait behind small ones, large requests
+            # behind any queued request
+            lane = self._lane(size)
+            if lane is self._priority_lane:
+                queued_ahead = len(self._priority_lane)
+            else:
+                queued_ahead = self.queued_requests
+            if not queued_ahead and self._fits(size):
+                self._admit(size)
+                return
+
+            if (
+                self.max_queue_size is not None
+                and self.queued_requests >= self.max_queue_size
+            ):
+                logger.warning("Admission queue is full, rejecting request")
+                raise AdmissionRejectedError(
+                    "Too many requests, try again later", status_code=429
+                )
+
+            waiter = _Waiter(size)
+            lane.append(waiter)
+
+        if waiter.event.wait(self.queue_timeout):
+            return
+
+        with self._lock:
+            # The request might have been admitted right after the timeout
+            if waiter.granted:
+                return
+            self._lane(size).remove(waiter)
+            # Requests queued behind this one might fit now
+            self._admit_waiters()
+
+        logger.warning(
+            "Request was not admitted within %s seconds, rejecting request",
+            self.queue_timeout,
+        )
+        raise AdmissionRejectedError(
+            "Server is overloaded, try again later",
+            status_code=503,
+            retry_after=max(1, int(self.queue_timeout)),
+        )
+
+    def release(self, size: int) -> None:
+        """
+        Release the capacity held by an admitted request.
+
+        :param size: Size of the request in bytes, as passed to acquire
+        """
+        with self._lock:
+            self.inflight_requests -= 1
+            self.inflight_bytes -= size
+            self._admit_waiters()
+
+    @contextmanager
+    def admit(self, size: int) -> Iterator[None]:
+        """
+        Context manager holding capacity for a request for the duration of the block.
+
+        :param size: Size of the request in bytes
+        """
+        self.acquire(size)
+        try:
+            yield
+        finally:
+            self.release(size)
+
+    def _lane(self, size: int) -> Deque[_Waiter]:
+        if size <= self.small_request_bytes:
+            return self._priority_lane
+        return self._regular_lane
+
+    def _fits(self, size: int) -> bool:
+        if self.inflight_requests == 0:
+            return True
+        if (
+            self.max_concurrent_requests is not None
+            and self.inflight_requests >= self.max_concurrent_requests
+        ):
+            return False
+        if (
+            self.max_inflight_bytes is not None
+            and self.inflight_bytes + size > self.max_inflight_bytes
+        ):
+            return False
+        return True
+
+    def _admit(self, size: int) -> None:
+        self.inflight_requests += 1
+        self.inflight_bytes += size
+
+    def _admit_waiters(self) -> None:
+        """Admit queued requests in order, small requests first."""
+        for lane in (self._priority_lane, self._regular_lane):
+            while lane and self._fits(lane[0].size):
+                waiter = lane.popleft()
+                self._admit(waiter.size)
+                waiter.granted = True
+                waiter.event.set()
+            if lane:
+                # Keep the order: don't let requests from the next lane
+                # overtake a waiting request.
+                return
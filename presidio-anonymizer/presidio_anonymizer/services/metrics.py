@@ -0,0 +1,382 @@
+"""
+Latency histograms, counters and gauges, exported in the Prometheus text format.
+
+Also used by presidio-analyzer for its own metrics registry.
+"""
+import bisect
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Tuple, List, Optional, Iterator, Sequence
+
+LabelsKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    A histogram of observed values, bucketed by upper bounds.
+
+    :param buckets: Sorted upper bounds of the buckets
+    """
+
+    DEFAULT_BUCKETS = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # The last bucket counts values larger than all bounds (+Inf)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add an observed value to the histogram."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the observed values."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the observed values.
+
+        Interpolates linearly within the bucket holding the quantile,
+        similar to Prometheus' histogram_quantile.
+
+        :param q: The quantile to estimate, between 0 and 1
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def to_dict(self) -> Dict:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.bucket_counts)),
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread safe, in-process registry of histograms, counters and gauges.
+
+    Metrics are identified by name and a set of labels,
+    and can be exported using the Prometheus text format.
+
+    :param namespace: Prefix added to metric names when exported
+    :param enabled: Whether observations should be recorded
+    """
+
+    def __init__(self, namespace: str, enabled: bool = True):
+        self.namespace = namespace
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelsKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelsKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelsKey, float]] = {}
+        self._descriptions: Dict[str, str] = {}
+
+    def describe(self, name: str, description: str) -> None:
+        """Set the description of a metric, exported as the metric's help text."""
+        self._descriptions[name] = description
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add an observation to a histogram."""
+        if not self.enabled:
+            return
+        key = self._labels_key(labels)
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increment a counter."""
+        if not self.enabled:
+            return
+        key = self._labels_key(labels)
+        with self._lock:
+            counters = self._counters.setdefault(name, {})
+            counters[key] = counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set the current value of a gauge."""
+        if not self.enabled:
+            return
+        key = self._labels_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Observe the duration (in seconds) of the managed block in a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def get_histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        """Return the histogram for a metric name and labels, if observed."""
+        return self._histograms.get(name, {}).get(self._labels_key(labels))
+
+    def get_counter(self, name: str, **labels: str) -> float:
+        """Return the current value of a counter."""
+        return self._counters.get(name, {}).get(self._labels_key(labels), 0)
+
+    def get_gauge(self, name: str, **labels: str) -> Optional[float]:
+        """Return the current value of a gauge, if set."""
+        return self._gauges.get(name, {}).get(self._labels_key(labels))
+
+    def get_metrics(self) -> Dict[str, List[Dict]]:
+        """
+        Return all recorded metrics.
+
+        :return: A dictionary from metric name to a list of series,
+        each holding the series labels and values.
+        """
+        metrics = {}
+        with self._lock:
+            for name, series in self._histograms.items():
+                metrics[name] = [
+                    {"labels": dict(key), **histogram.to_dict()}
+                    for key, histogram in series.items()
+                ]
+            for name, series in {**self._counters, **self._gauges}.items():
+                metrics[name] = [
+                    {"labels": dict(key), "value": value}
+                    for key, value in series.items()
+                ]
+        return metrics
+
+    def to_snapshot(self) -> Dict:
+        """Return all recorded metrics as a JSON serializable snapshot."""
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [
+                        [key, list(h.buckets), h.bucket_counts, h.sum, h.count]
+                        for key, h in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [[key, value] for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [[key, value] for key, value in series.items()]
+                    for name, series in self._gauges.items()
+                },
+            }
+
+    def merge_snapshot(
+        self, snapshot: Dict, gauge_labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Add the metrics of a snapshot, returned by `to_snapshot`, to this registry.
+
+        Histograms and counters are summed. Gauges are only added if gauge_labels
+        is not None, with these labels added to tell the snapshots apart.
+
+        :param snapshot: The snapshot to merge
+        :param gauge_labels: Labels added to the snapshot's gauges
+        """
+        with self._lock:
+            for name, series in snapshot["histograms"].items():
+                histograms = self._histograms.setdefault(name, {})
+                for key, buckets, bucket_counts, total, count in series:
+                    key = self._to_labels_key(key)
+                    histogram = histograms.get(key)
+                    if histogram is None:
+                        histogram = histograms[key] = Histogram(buckets)
+                    for i, bucket_count in enumerate(bucket_counts):
+                        histogram.bucket_counts[i] += bucket_count
+                    histogram.sum += total
+                    histogram.count += count
+            for name, series in snapshot["counters"].items():
+                counters = self._counters.setdefault(name, {})
+                for key, value in series:
+                    key = self._to_labels_key(key)
+                    counters[key] = counters.get(key, 0) + value
+            if gauge_labels is None:
+                return
+            for name, series in snapshot["gauges"].items():
+                gauges = self._gauges.setdefault(name, {})
+                for key, value in series:
+                    labels = {**dict(self._to_labels_key(key)), **gauge_labels}
+                    gauges[self._labels_key(labels)] = value
+
+    def reset(self) -> None:
+        """Remove all recorded metrics."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def to_prometheus(self) -> str:
+        """Export all recorded metrics using the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                full_name = self._full_name(name, lines, "histogram")
+                for key, histogram in series.items():
+                    cumulative = 0
+                    bounds = [self._format_value(b) for b in histogram.buckets]
+                    for bound, count in zip(bounds + ["+Inf"], histogram.bucket_counts):
+                        cumulative += count
+                        labels = self._format_labels(key + (("le", bound),))
+                        lines.append(f"{full_name}_bucket{labels} {cumulative}")
+                    labels = self._format_labels(key)
+                    lines.append(f"{full_name}_sum{labels} {histogram.sum}")
+                    lines.append(f"{full_name}_count{labels} {histogram.count}")
+            for metrics, metric_type in (
+                (self._counters, "counter"),
+                (self._gauges, "gauge"),
+            ):
+                for name, series in sorted(metrics.items()):
+                    full_name = self._full_name(name, lines, metric_type)
+                    for key, value in series.items():
+                        lines.append(f"{full_name}{self._format_labels(key)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def _full_name(self, name: str, lines: List[str], metric_type: str) -> str:
+        full_name = f"{self.namespace}_{name}"
+        if name in self._descriptions:
+            lines.append(f"# HELP {full_name} {self._descriptions[name]}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+        return full_name
+
+    @staticmethod
+    def _labels_key(labels: Dict[str, str]) -> LabelsKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    @staticmethod
+    def _to_labels_key(key: Sequence[Sequence[str]]) -> LabelsKey:
+        """Convert a labels key read from JSON (lists instead of tuples)."""
+        return tuple((k, v) for k, v in key)
+
+    @staticmethod
+    def _format_labels(key: LabelsKey) -> str:
+        if not key:
+            return ""
+        escaped = (
+            (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for k, v in key
+        )
+        return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        return repr(float(value))
+
+
+class MultiprocessMetrics:
+    """
+    Aggregate the metrics of several processes, e.g. gunicorn workers.
+
+    Each process writes snapshots of its registry to a shared directory,
+    in a file named by its process id, at most once per interval.
+    Exporting merges the snapshots of all the processes, so that every scrape
+    returns the same totals whichever process serves it.
+    Gauges are exported per process, with a pid label, and only for processes
+    which are still running.
+
+    :param registry: This process's registry
+    :param directory: Directory shared by the processes.
+    Should be emptied before the processes start.
+    :param interval: Minimum number of seconds between two snapshots
+    """
+
+    def __init__(self, registry: MetricsRegistry, directory: str, interval: float = 1):
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self._last_write_time: Optional[float] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def write_snapshot(self, force: bool = False) -> None:
+        """
+        Write a snapshot of this process's registry, unless one was recently written.
+
+        :param force: Whether to write a snapshot regardless of the interval
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_write_time is not None
+            and now - self._last_write_time < self.interval
+        ):
+            return
+        self._last_write_time = now
+        snapshot = json.dumps(self.registry.to_snapshot())
+        # Replaced atomically, so that readers never see a partial snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(snapshot)
+        os.replace(tmp_path, os.path.join(self.directory, f"{os.getpid()}.json"))
+
+    def to_prometheus(self) -> str:
+        """Export the metrics of all the processes in the Prometheus text format."""
+        self.write_snapshot(force=True)
+        merged = MetricsRegistry(self.registry.namespace)
+        merged._descriptions = dict(self.registry._descriptions)
+        for file_name in sorted(os.listdir(self.directory)):
+            pid, extension = os.path.splitext(file_name)
+            if extension != ".json" or not pid.isdigit():
+                continue
+            try:
+                with open(os.path.join(self.directory, file_name)) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            gauge_labels = {"pid": pid} if _is_running(int(pid)) else None
+            merged.merge_snapshot(snapshot, gauge_labels=gauge_labels)
+        return merged.to_prometheus()
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # running, but owned by another user
+    return True
@@ -0,0 +1,212 @@
+"""Vectorized analysis and anonymization of pandas Series and Arrow arrays."""
+import copy
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from presidio_anonymizer import BatchAnonymizerEngine
+from presidio_anonymizer.services.app_entities_convertor import AppEntitiesConvertor
+
+logger = logging.getLogger("presidio-anonymizer")
+
+
+@dataclass
+class EngineConfig:
+    """
+    Lightweight configuration of the engines used by the series functions.
+
+    Only the configuration is shipped to workers (e.g. in a Spark UDF's closure),
+    each worker process creates its engines from it on first use.
+
+    :param language: Language of the analyzed texts
+    :param nlp_configuration: Configuration of the NLP engine, in the
+    `NlpEngineProvider` format, e.g. {"nlp_engine_name": "spacy",
+    "models": [{"lang_code": "en", "model_name": "en_core_web_lg"}]}.
+    The default spaCy engine is used if None.
+    :param entities: Entity types to look for, all entities if None
+    :param score_threshold: Minimum score of the returned results
+    :param operators: Anonymization operators per entity type, in the JSON format
+    of the anonymizer's REST API, e.g. {"DEFAULT": {"type": "replace",
+    "new_value": "<ANONYMIZED>"}}
+    :param analyzer_spec: Spec of the analyzer engine, from `AnalyzerEngine.to_spec`,
+    for analyzers with custom recognizers. Replaces nlp_configuration if set.
+    """
+
+    language: str = "en"
+    nlp_configuration: Optional[Dict] = None
+    entities: Optional[List[str]] = None
+    score_threshold: float = 0
+    operators: Optional[Dict[str, Dict]] = None
+    analyzer_spec: Optional[Dict] = None
+
+    @property
+    def key(self) -> str:
+        """Return a key identifying the configuration's engines."""
+        return json.dumps(asdict(self), sort_keys=True)
+
+
+# The engines created in this process, by configuration key
+_engines: Dict[str, Tuple["BatchAnalyzerEngine", BatchAnonymizerEngine]] = {}  # noqa
+_engines_lock = threading.Lock()
+
+
+def get_engines(
+    config: Optional[EngineConfig] = None,
+) -> Tuple["BatchAnalyzerEngine", BatchAnonymizerEngine]:  # noqa F821
+    """
+    Return this process's batch analyzer and anonymizer of a configuration.
+
+    The engines are created on the first call in each process,
+    and reused by later calls with an equal configuration.
+
+    :param config: The engines' configuration, the default one if None
+    """
+    config = config or EngineConfig()
+    key = config.key
+    engines = _engines.get(key)
+    if engines is None:
+        with _engines_lock:
+            engines = _engines.get(key)
+            if engines is None:
+                engines = _create_engines(config)
+                _engines[key] = engines
+    return engines
+
+
+def analyze_series(series: Any, config: Optional[EngineConfig] = None) -> Any:
+    """
+    Analyze the texts of a pandas Series or Arrow array.
+
+    All the texts are processed by the NLP engine as one batch,
+    and each distinct text is analyzed once.
+
+    :param series: The texts to analyze, missing values have no results
+    :param config: The engines' configuration, the default one if None
+    :return: For each text, a list of its results as dictionaries
+    with entity_type, start, end and score, as a Series (with the input's index)
+    or an Arrow array of lists of structs
+    """
+    config = config or EngineConfig()
+    batch_analyzer, _ = get_engines(config)
+    results_list = [
+        [
+            {
+                "entity_type": result.entity_type,
+                "start": result.start,
+                "end": result.end,
+                "score": result.score,
+            }
+            for result in results
+        ]
+        for results in _analyze(batch_analyzer, _to_list(series), config)
+    ]
+    return _like(series, results_list, _get_results_arrow_type)
+
+
+def anonymize_series(series: Any, config: Optional[EngineConfig] = None) -> Any:
+    """
+    Anonymize the texts of a pandas Series or Arrow array.
+
+    All the texts are processed by the NLP engine as one batch,
+    and each distinct text is analyzed once.
+
+    :param series: The texts to anonymize, missing values are kept missing
+    :param config: The engines' configuration, the default one if None
+    :return: The anonymized texts, as a Series (with the input's index)
+    or an Arrow string array
+    """
+    config = config or EngineConfig()
+    batch_analyzer, batch_anonymizer = get_engines(config)
+    values = _to_list(series)
+    results_list = _analyze(batch_analyzer, values, config)
+    # from_json pops the operator type out of its parameters
+    operators = AppEntitiesConvertor.operators_config_from_json(
+        copy.deepcopy(config.operators)
+    )
+    anonymized = batch_anonymizer.anonymize_list(
+        values, results_list, operators=operators
+    )
+    anonymized = [None if value is None else str(value) for value in anonymized]
+    return _like(series, anonymized, _get_string_arrow_type)
+
+
+def _create_engines(
+    config: EngineConfig,
+) -> Tuple["BatchAnalyzerEngine", BatchAnonymizerEngine]:  # noqa F821
+    from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine
+    from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+    logger.info(f"Creating engines in process {os.getpid()}")
+    if config.analyzer_spec:
+        analyzer_engine = AnalyzerEngine.from_spec(config.analyzer_spec)
+        return BatchAnalyzerEngine(analyzer_engine), BatchAnonymizerEngine()
+
+    nlp_engine = None
+    if config.nlp_configuration:
+        provider = NlpEngineProvider(nlp_configuration=config.nlp_configuration)
+        nlp_engine = provider.create_engine()
+    analyzer_engine = AnalyzerEngine(
+        nlp_engine=nlp_engine, supported_languages=[config.language]
+    )
+    return BatchAnalyzerEngine(analyzer_engine), BatchAnonymizerEngine()
+
+
+def _analyze(
+    batch_analyzer: "BatchAnalyzerEngine",  # noqa F821
+    values: List[Any],
+    config: EngineConfig,
+) -> List[List["RecognizerResult"]]:  # noqa F821
+    return list(
+        batch_analyzer.analyze_column(
+            values,
+            language=config.language,
+            entities=config.entities,
+            score_threshold=config.score_threshold,
+        )
+    )
+
+
+def _to_list(series: Any) -> List[Any]:
+    """Return the values of a series, with None for missing values."""
+    if hasattr(series, "to_pylist"):
+        return series.to_pylist()
+    if hasattr(series, "notna"):
+        return series.astype(object).where(series.notna(), None).tolist()
+    return list(series)
+
+
+def _like(series: Any, values: List[Any], get_arrow_type) -> Any:
+    """Return values as the same kind of series as the input series."""
+    if hasattr(series, "to_pylist"):
+        import pyarrow as pa
+
+        return pa.array(values, type=get_arrow_type())
+    if hasattr(series, "notna"):
+        import pandas as pd
+
+        return pd.Series(values, index=series.index, name=series.name, dtype=object)
+    return values
+
+
+def _get_results_arrow_type() -> "pa.DataType":  # noqa F821
+    import pyarrow as pa
+
+    return pa.list_(
+        pa.struct(
+            [
+                ("entity_type", pa.string()),
+                ("start", pa.int64()),
+                ("end", pa.int64()),
+                ("score", pa.float64()),
+            ]
+        )
+    )
+
+
+def _get_string_arrow_type() -> "pa.DataType":  # noqa F821
+    import pyarrow as pa
+
+    return pa.string()
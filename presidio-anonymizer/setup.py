@@ -41,6 +41,7 @@ setup(
     include_package_data=True,
     keywords="presidio_anonymizer",
     install_requires=["pycryptodome>=3.10.1"],
+    extras_require={"arrow": ["pyarrow"]},
     packages=find_packages(include=["presidio_anonymizer", "presidio_anonymizer.*"]),
     test_suite="tests",
     tests_require=test_requirements,
@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+
+from presidio_anonymizer.services.admission_controller import (
+    AdmissionController,
+    AdmissionRejectedError,
+)
+
+
+def test_when_no_limits_then_all_requests_admitted():
+    controller = AdmissionController()
+    for _ in range(10):
+        controller.acquire(1000)
+    assert controller.inflight_requests == 10
+    assert controller.inflight_bytes == 10000
+
+
+def test_when_request_too_large_then_rejected_with_413():
+    controller = AdmissionController(max_request_bytes=100)
+    with pytest.raises(AdmissionRejectedError) as e:
+        controller.acquire(101)
+    assert e.value.status_code == 413
+    assert controller.inflight_requests == 0
+
+
+@pytest.mark.parametrize(
+    "limits", [{"max_request_bytes": 100}, {"max_inflight_bytes": 100}]
+)
+def test_when_size_unknown_and_bytes_limited_then_rejected_with_411(limits):
+    controller = AdmissionController(**limits)
+    with pytest.raises(AdmissionRejectedError) as e:
+        controller.acquire(None)
+    assert e.value.status_code == 411
+    assert controller.inflight_requests == 0
+
+
+def test_when_size_unknown_and_bytes_not_limited_then_admitted():
+    controller = AdmissionController(max_concurrent_requests=1)
+    controller.acquire(None)
+    assert controller.inflight_requests == 1
+    assert controller.inflight_bytes == 0
+
+
+def test_when_queue_full_then_rejected_with_429():
+    controller = AdmissionController(max_concurrent_requests=1, max_queue_size=0)
+    controller.acquire(10)
+    with pytest.raises(AdmissionRejectedError) as e:
+        controller.acquire(10)
+    assert e.value.status_code == 429
+
+
+def test_when_deadline_passes_then_rejected_with_503():
+    controller = AdmissionController(max_concurrent_requests=1, queue_timeout=0.05)
+    controller.acquire(10)
+    with pytest.raises(AdmissionRejectedError) as e:
+        controller.acquire(10)
+    assert e.value.status_code == 503
+    assert controller.queued_requests == 0
+    assert controller.inflight_requests == 1
+
+
+def test_when_inflight_bytes_exceeded_then_waits_for_release():
+    controller = AdmissionController(max_inflight_bytes=100, queue_timeout=5)
+    controller.acquire(80)
+    admitted = threading.Event()
+
+    def request():
+        controller.acquire(50)
+        admitted.set()
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    time.sleep(0.05)
+    assert not admitted.is_set()
+    assert controller.queued_requests == 1
+
+    controller.release(80)
+    thread.join()
+    assert admitted.is_set()
+    assert controller.inflight_bytes == 50
+
+
+def test_when_single_request_larger_than_inflight_limit_then_admitted_alone():
+    controller = AdmissionController(max_inflight_bytes=100)
+    with controller.admit(500):
+        assert controller.inflight_bytes == 500
+    assert controller.inflight_bytes == 0
+    assert controller.inflight_requests == 0
+
+
+def test_when_capacity_frees_then_small_requests_admitted_first():
+    controller = AdmissionController(
+        max_concurrent_requests=1, small_request_bytes=100, queue_timeout=5
+    )
+    controller.acquire(1000)
+    order = []
+
+    def request(size):
+        controller.acquire(size)
+        order.append(size)
+        controller.release(size)
+
+    large = threading.Thread(target=request, args=(5000,))
+    large.start()
+    time.sleep(0.05)
+    small = threading.Thread(target=request, args=(10,))
+    small.start()
+    time.sleep(0.05)
+    assert controller.queued_requests == 2
+
+    controller.release(1000)
+    large.join()
+    small.join()
+    assert order == [10, 5000]
+
+
+def test_when_large_request_queued_then_small_request_that_fits_admitted():
+    controller = AdmissionController(
+        max_inflight_bytes=1000, small_request_bytes=100, queue_timeout=5
+    )
+    controller.acquire(600)
+    large = threading.Thread(target=controller.acquire, args=(800,))
+    large.start()
+    time.sleep(0.05)
+    assert controller.queued_requests == 1
+
+    start = time.monotonic()
+    controller.acquire(10)
+
+    assert time.monotonic() - start < 1
+    assert controller.inflight_requests == 2
+    assert controller.queued_requests == 1
+    controller.release(10)
+    controller.release(600)
+    large.join()
+    assert controller.inflight_bytes == 800
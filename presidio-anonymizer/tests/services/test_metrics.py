@@ -0,0 +1,106 @@
+import json
+import os
+
+import pytest
+
+from presidio_anonymizer.services.metrics import (
+    Histogram,
+    MetricsRegistry,
+    MultiprocessMetrics,
+)
+
+
+def test_when_values_observed_then_histogram_counts_them():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(6.05)
+    assert histogram.bucket_counts == [1, 2, 1]
+    assert histogram.mean == pytest.approx(6.05 / 4)
+
+
+@pytest.mark.parametrize(
+    "quantile, expected",
+    [(0.25, 0.1), (0.5, 0.55), (0.75, 1.0), (1.0, 1.0)],
+)
+def test_when_quantile_then_interpolated_within_bucket(quantile, expected):
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value)
+
+    assert histogram.quantile(quantile) == pytest.approx(expected)
+
+
+def test_when_no_values_then_quantile_is_zero():
+    assert Histogram().quantile(0.99) == 0
+
+
+def test_when_timer_then_duration_observed_per_labels():
+    registry = MetricsRegistry(namespace="test")
+    with registry.timer("duration_seconds", recognizer="a"):
+        pass
+    with registry.timer("duration_seconds", recognizer="a"):
+        pass
+    with registry.timer("duration_seconds", recognizer="b"):
+        pass
+
+    assert registry.get_histogram("duration_seconds", recognizer="a").count == 2
+    assert registry.get_histogram("duration_seconds", recognizer="b").count == 1
+    assert registry.get_histogram("duration_seconds", recognizer="c") is None
+
+
+def test_when_disabled_then_nothing_recorded():
+    registry = MetricsRegistry(namespace="test", enabled=False)
+    registry.observe("duration_seconds", 1)
+    registry.increment("requests_total")
+
+    assert registry.get_metrics() == {}
+
+
+def test_when_to_prometheus_then_text_format_returned():
+    registry = MetricsRegistry(namespace="test")
+    registry.describe("duration_seconds", "A duration")
+    registry.observe("duration_seconds", 0.2, recognizer='My "quoted" name')
+    registry.increment("requests_total", 3)
+    registry.set_gauge("loaded_models", 2, language="en")
+
+    text = registry.to_prometheus()
+
+    assert "# HELP test_duration_seconds A duration" in text
+    assert "# TYPE test_duration_seconds histogram" in text
+    assert (
+        'test_duration_seconds_bucket{recognizer="My \\"quoted\\" name",le="0.1"} 0'
+        in text
+    )
+    assert (
+        'test_duration_seconds_bucket{recognizer="My \\"quoted\\" name",le="+Inf"} 1'
+        in text
+    )
+    assert 'test_duration_seconds_count{recognizer="My \\"quoted\\" name"} 1' in text
+    assert "# TYPE test_requests_total counter" in text
+    assert "test_requests_total 3" in text
+    assert 'test_loaded_models{language="en"} 2' in text
+
+
+def test_when_multiprocess_then_snapshots_of_all_processes_are_merged(tmp_path):
+    other = MetricsRegistry(namespace="test")
+    other.observe("duration_seconds", 0.5, stage="a")
+    other.increment("calls_total", 2)
+    other.set_gauge("loaded", 1)
+    # A process id above the system's maximum, never running
+    (tmp_path / "999999999.json").write_text(json.dumps(other.to_snapshot()))
+    registry = MetricsRegistry(namespace="test")
+    registry.observe("duration_seconds", 1.5, stage="a")
+    registry.increment("calls_total")
+    registry.set_gauge("loaded", 0)
+
+    exported = MultiprocessMetrics(registry, str(tmp_path)).to_prometheus()
+
+    assert 'test_duration_seconds_count{stage="a"} 2' in exported
+    assert 'test_duration_seconds_sum{stage="a"} 2.0' in exported
+    assert "test_calls_total 3" in exported
+    assert f'test_loaded{{pid="{os.getpid()}"}} 0' in exported
+    assert "999999999" not in exported
+    assert (tmp_path / f"{os.getpid()}.json").exists()
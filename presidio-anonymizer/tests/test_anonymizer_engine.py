@@ -1,3 +1,4 @@
+import json
 from typing import Dict, List
 
 import pytest
@@ -236,6 +237,36 @@ def test_given_sorted_analyzer_results_merge_entities_separated_by_white_space(
     assert sorted(result.items) == sorted(expected.items)
 
 
+def test_given_operators_then_spec_round_trips_them():
+    operators = {
+        "PHONE_NUMBER": OperatorConfig(
+            "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+        ),
+        "DEFAULT": OperatorConfig("replace", {"new_value": "<PII>"}),
+    }
+    spec = json.loads(json.dumps(AnonymizerEngine().to_spec(operators)))
+
+    engine = AnonymizerEngine.from_spec(spec)
+    result = engine.anonymize(
+        "call 212-555-1234 or mail a@b.com",
+        [
+            RecognizerResult("PHONE_NUMBER", 5, 17, 0.8),
+            RecognizerResult("EMAIL_ADDRESS", 26, 33, 0.8),
+        ],
+        AnonymizerEngine.operators_from_spec(spec),
+    )
+
+    assert result.text == "call 212-555-**** or mail <PII>"
+    assert AnonymizerEngine.operators_from_spec(spec) == operators
+
+
+def test_given_custom_lambda_operator_then_spec_raises():
+    operators = {"PERSON": OperatorConfig("custom", {"lambda": lambda x: x[::-1]})}
+
+    with pytest.raises(InvalidParamException):
+        AnonymizerEngine().to_spec(operators)
+
+
 def _operate(
     text: str,
     text_metadata: List[PIIEntity],
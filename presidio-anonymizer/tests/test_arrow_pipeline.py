@@ -0,0 +1,138 @@
+import re
+
+import pytest
+
+from presidio_anonymizer import ArrowAnonymizationPipeline
+from presidio_anonymizer.arrow_pipeline import (
+    get_file_format,
+    open_batch_reader,
+    open_batch_writer,
+)
+from presidio_anonymizer.entities import OperatorConfig, RecognizerResult
+
+
+class PhoneBatchAnalyzer:
+    """Find phone numbers in column values, as BatchAnalyzerEngine would."""
+
+    def analyze_column(self, column, language, **kwargs):
+        for value in column:
+            if value is None:
+                yield []
+                continue
+            yield [
+                RecognizerResult("PHONE_NUMBER", match.start(), match.end(), 0.75)
+                for match in re.finditer(r"\d{3}-\d{3}-\d{4}", value)
+            ]
+
+
+@pytest.fixture(scope="module")
+def pa():
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def batch(pa):
+    return pa.RecordBatch.from_pydict(
+        {
+            "id": [1, 2, 3],
+            "notes": ["call 212-555-1234", None, "nothing here"],
+            "phone": [2125551234, 2125555678, None],
+        }
+    )
+
+
+@pytest.fixture
+def pipeline():
+    return ArrowAnonymizationPipeline(PhoneBatchAnalyzer(), columns=["notes"])
+
+
+def test_given_batch_then_selected_columns_are_anonymized(pa, batch, pipeline):
+    result = pipeline.process_batch(batch)
+
+    assert result.schema == batch.schema
+    assert result.column(0).to_pylist() == [1, 2, 3]
+    assert result.column(1).to_pylist() == ["call <PHONE_NUMBER>", None, "nothing here"]
+    assert result.column(2).to_pylist() == [2125551234, 2125555678, None]
+
+
+def test_given_non_string_column_then_it_is_anonymized_as_strings(pa, batch):
+    pipeline = ArrowAnonymizationPipeline(
+        PhoneBatchAnalyzer(),
+        columns=["phone"],
+        operators={"PHONE_NUMBER": OperatorConfig("redact")},
+    )
+
+    result = pipeline.process_batch(batch)
+
+    assert result.schema.field("phone").type == pa.string()
+    assert result.column(2).to_pylist() == ["2125551234", "2125555678", None]
+
+
+def test_given_missing_column_then_raise(batch):
+    pipeline = ArrowAnonymizationPipeline(PhoneBatchAnalyzer(), columns=["email"])
+
+    with pytest.raises(ValueError):
+        pipeline.process_batch(batch)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_given_batches_then_results_are_in_input_order(
+    pa, batch, pipeline, max_workers
+):
+    pipeline.max_workers = max_workers
+    pipeline.max_pending_batches = 2 * max_workers
+    batches = [batch.slice(i, 1) for i in range(batch.num_rows)] * 4
+
+    results = list(pipeline.process_batches(iter(batches)))
+
+    assert [result.column(0).to_pylist() for result in results] == [
+        b.column(0).to_pylist() for b in batches
+    ]
+    assert results[0].column(1).to_pylist() == ["call <PHONE_NUMBER>"]
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow", ".csv"])
+def test_given_file_then_anonymized_file_is_written(
+    pa, batch, pipeline, tmp_path, suffix
+):
+    source = tmp_path / f"source{suffix}"
+    destination = tmp_path / f"destination{suffix}"
+    file_format = get_file_format(source)
+    with open_batch_writer(source, batch.schema, file_format) as writer:
+        writer.write_batch(batch)
+        writer.write_batch(batch)
+
+    row_count = pipeline.process_file(source, destination, batch_size=2)
+
+    with open_batch_reader(destination, file_format) as reader:
+        notes = [note for b in reader for note in b.column(1).to_pylist()]
+    assert row_count == 6
+    # CSV doesn't distinguish missing strings from empty ones
+    missing = "" if file_format == "csv" else None
+    assert notes == ["call <PHONE_NUMBER>", missing, "nothing here"] * 2
+
+
+def test_given_large_batches_then_they_are_split(pa, batch, tmp_path):
+    source = tmp_path / "source.arrow"
+    table = pa.Table.from_batches([batch] * 3).combine_chunks()
+    with open_batch_writer(source, batch.schema, "ipc") as writer:
+        writer.write_batch(table.to_batches()[0])
+
+    with open_batch_reader(source, "ipc", batch_size=2) as reader:
+        assert [b.num_rows for b in reader] == [2, 2, 2, 2, 1]
+
+    assert reader.source.closed
+
+
+def test_given_unknown_extension_then_raise():
+    with pytest.raises(ValueError):
+        get_file_format("data.xlsx")
+
+
+def test_given_invalid_workers_then_raise():
+    with pytest.raises(ValueError):
+        ArrowAnonymizationPipeline(PhoneBatchAnalyzer(), ["notes"], max_workers=0)
+    with pytest.raises(ValueError):
+        ArrowAnonymizationPipeline(
+            PhoneBatchAnalyzer(), ["notes"], max_workers=4, max_pending_batches=2
+        )
@@ -134,3 +134,24 @@ def test_given_custom_anonymizer_we_anonymize_dict_correctly(engine, analyzer_re
     assert anonymize_results == {
         "name": ["<ENTITY: John>", "<ENTITY: Jill>", "<ENTITY: Jack>"]
     }
+
+
+def test_anonymize_records_anonymizes_each_record_in_order(engine):
+    records_results = [
+        [
+            DictRecognizerResult(
+                "name", "John", [RecognizerResult("PERSON", 0, 4, 0.85)]
+            )
+        ],
+        [
+            DictRecognizerResult("name", "Jill", []),
+            DictRecognizerResult("age", 30, []),
+        ],
+    ]
+
+    anonymized = engine.anonymize_records(
+        iter(records_results),
+        operators={"PERSON": OperatorConfig("replace", {"new_value": "X"})},
+    )
+
+    assert list(anonymized) == [{"name": "X"}, {"name": "Jill", "age": 30}]
@@ -0,0 +1,33 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import presidio_anonymizer
+
+
+def test_when_importing_shared_modules_then_engines_not_imported():
+    code = (
+        "import presidio_anonymizer.services.metrics\n"
+        "import presidio_anonymizer.services.admission_controller\n"
+        "import json, sys\n"
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=str(Path(presidio_anonymizer.__file__).parent.parent),
+    ).stdout
+    modules = json.loads(output.splitlines()[-1])
+
+    assert "presidio_anonymizer.anonymizer_engine" not in modules
+    assert "Crypto" not in modules
+
+
+def test_when_lazy_engine_accessed_then_class_returned():
+    from presidio_anonymizer.anonymizer_engine import AnonymizerEngine
+
+    assert presidio_anonymizer.AnonymizerEngine is AnonymizerEngine
+    assert set(presidio_anonymizer.__all__) <= set(dir(presidio_anonymizer))
@@ -0,0 +1,32 @@
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.core.metrics import metrics_registry
+from presidio_anonymizer.entities import RecognizerResult, OperatorConfig
+
+
+def test_when_anonymize_then_operator_durations_recorded():
+    metrics_registry.reset()
+    engine = AnonymizerEngine()
+
+    engine.anonymize(
+        text="My name is Bond, James Bond",
+        analyzer_results=[
+            RecognizerResult(entity_type="PERSON", start=11, end=15, score=0.8),
+            RecognizerResult(entity_type="PERSON", start=17, end=27, score=0.8),
+        ],
+        operators={
+            "PERSON": OperatorConfig(
+                "mask", {"masking_char": "*", "chars_to_mask": 2, "from_end": False}
+            )
+        },
+    )
+
+    assert metrics_registry.get_histogram("anonymize_duration_seconds").count == 1
+    histogram = metrics_registry.get_histogram(
+        "operator_duration_seconds", operator="mask", operator_type="Anonymize"
+    )
+    assert histogram.count == 2
+    assert (
+        'presidio_anonymizer_operator_duration_seconds_count'
+        '{operator="mask",operator_type="Anonymize"} 2'
+        in metrics_registry.to_prometheus()
+    )
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+from functools import partial
+
+import pytest
+
+from presidio_anonymizer.udf import (
+    EngineConfig,
+    analyze_series,
+    anonymize_series,
+    get_engines,
+)
+
+pytest.importorskip("presidio_analyzer")
+pd = pytest.importorskip("pandas")
+
+
+@pytest.fixture(scope="module")
+def config():
+    return EngineConfig(
+        entities=["PHONE_NUMBER", "EMAIL_ADDRESS"],
+        operators={"PHONE_NUMBER": {"type": "redact"}},
+    )
+
+
+@pytest.fixture
+def series():
+    return pd.Series(
+        ["call 212-555-1234", None, "mail me at john@example.com", "call 212-555-1234"],
+        index=[10, 11, 12, 13],
+        name="notes",
+    )
+
+
+def test_given_series_then_texts_are_anonymized(series, config):
+    anonymized = anonymize_series(series, config)
+
+    assert anonymized.tolist() == ["call ", None, "mail me at <EMAIL_ADDRESS>", "call "]
+    assert anonymized.index.tolist() == [10, 11, 12, 13]
+    assert anonymized.name == "notes"
+
+
+def test_given_series_then_results_are_dictionaries(series, config):
+    results = analyze_series(series, config)
+
+    assert results[11] == []
+    assert [(r["entity_type"], r["start"], r["end"]) for r in results[10]] == [
+        ("PHONE_NUMBER", 5, 17)
+    ]
+    assert results[10] == results[13]
+
+
+def test_given_arrow_array_then_arrow_array_is_returned(config):
+    pa = pytest.importorskip("pyarrow")
+    array = pa.array(["call 212-555-1234", None, "mail me at john@example.com"])
+
+    anonymized = anonymize_series(array, config)
+    results = analyze_series(array, config)
+
+    assert anonymized.type == pa.string()
+    assert anonymized.to_pylist()[2] == "mail me at <EMAIL_ADDRESS>"
+    assert results.to_pylist()[2][0]["entity_type"] == "EMAIL_ADDRESS"
+
+
+def test_given_equal_configs_then_engines_are_reused(config):
+    engines = get_engines(config)
+
+    assert get_engines(EngineConfig(**config.__dict__)) is engines
+    assert get_engines(EngineConfig(language="en")) is not engines
+
+
+def _get_engines_id(config, _):
+    return os.getpid(), id(get_engines(config))
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_given_worker_processes_then_engines_are_created_once_per_worker(
+    series, config
+):
+    context = multiprocessing.get_context("fork")
+    with context.Pool(2) as pool:
+        engine_ids = pool.map(partial(_get_engines_id, config), range(8), chunksize=1)
+        anonymized = pool.map(
+            partial(anonymize_series, config=config), [series, series.iloc[2:]]
+        )
+
+    engines_per_worker = {}
+    for pid, engine_id in engine_ids:
+        engines_per_worker.setdefault(pid, set()).add(engine_id)
+    assert all(len(engine_ids) == 1 for engine_ids in engines_per_worker.values())
+    assert anonymized[1].tolist() == ["mail me at <EMAIL_ADDRESS>", "call "]
+
+
+def test_given_analyzer_spec_then_analyzer_is_created_from_it(series):
+    from presidio_analyzer import AnalyzerEngine, PatternRecognizer
+
+    analyzer_engine = AnalyzerEngine()
+    analyzer_engine.registry.add_recognizer(
+        PatternRecognizer(supported_entity="GREETING", deny_list=["call"])
+    )
+    config = EngineConfig(
+        entities=["GREETING"], analyzer_spec=analyzer_engine.to_spec()
+    )
+
+    anonymized = anonymize_series(series, config)
+
+    assert anonymized[10] == "<GREETING> 212-555-1234"
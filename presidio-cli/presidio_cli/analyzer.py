@@ -1,5 +1,5 @@
-from presidio_analyzer import RecognizerResult
-from typing import Optional, Generator, Union
+from presidio_analyzer import BatchAnalyzerEngine, RecognizerResult
+from typing import Dict, Optional, Generator, Union
 from presidio_cli.config import PresidioCLIConfig
 
 
@@ -53,7 +53,32 @@ class PIIProblem(object):
         recognizer_result: RecognizerResult
     ) -> None:
         assert isinstance(recognizer_result, RecognizerResult)
-        self.recognizer_result = recognizer_result.to_dict()
+        self._set_fields(line, recognizer_result.to_dict())
+
+    @classmethod
+    def from_dict(
+        cls,
+        problem_dict: Dict
+    ) -> "PIIProblem":
+        """
+        Create a PIIProblem from its serialization by `to_dict`.
+
+        :param problem_dict: dict with the line and the recognizer result
+        """
+        problem = cls.__new__(cls)
+        problem._set_fields(problem_dict["line"], problem_dict["recognizer_result"])
+        return problem
+
+    def to_dict(self) -> Dict:
+        """Serialize the problem to a dict."""
+        return {"line": self.line, "recognizer_result": self.recognizer_result}
+
+    def _set_fields(
+        self,
+        line: int,
+        recognizer_result: Dict
+    ) -> None:
+        self.recognizer_result = recognizer_result
         #: Line on which the problem was found (starting at 1)
         self.line = line
         #: Column on which the problem was found (starting at 1)
@@ -79,11 +104,15 @@ def _analyze(
         buffer, "__getitem__"
     ), "_run() argument must be a buffer, not a stream"
 
-    for line in line_generator(buffer):
-        for result in conf.analyzer.analyze(
-            text=line.content, entities=conf.entities, language=conf.language,
-            allow_list=conf.allow_list
-        ):
+    # The lines are processed by the NLP engine in batches,
+    # and repeated lines are only analyzed once
+    lines = list(line_generator(buffer))
+    results_per_line = BatchAnalyzerEngine(conf.analyzer).analyze_column(
+        [line.content for line in lines], language=conf.language,
+        entities=conf.entities, allow_list=conf.allow_list
+    )
+    for line, results in zip(lines, results_per_line):
+        for result in results:
             p = PIIProblem(line.line_no, result)
             if p.score >= conf.threshold:
                 yield p
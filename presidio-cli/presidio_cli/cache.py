@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional
+
+from presidio_cli.analyzer import PIIProblem
+from presidio_cli.config import PresidioCLIConfig
+
+
+class ResultsCache(object):
+    """
+    On-disk cache of the problems found in files, to skip unchanged files
+    when re-running the analysis.
+
+    Entries are keyed by the hash of a file's content, under a directory
+    named by the configuration's hash, so that changing the configuration
+    (e.g. the entities or the recognizers) doesn't reuse stale results.
+    """
+    def __init__(
+        self,
+        directory: str,
+        conf: PresidioCLIConfig
+    ) -> None:
+        self.directory = os.path.join(directory, conf.get_hash()[:16])
+
+    @staticmethod
+    def get_content_hash(
+        file: str
+    ) -> str:
+        """
+        Hash the content of a file.
+
+        :param file: path of the file
+        :return: hex digest of the file's content
+        """
+        content_hash = hashlib.sha256()
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                content_hash.update(chunk)
+        return content_hash.hexdigest()
+
+    def get(
+        self,
+        content_hash: str
+    ) -> Optional[List[PIIProblem]]:
+        """
+        Return the cached problems of a content, None if it isn't cached.
+
+        :param content_hash: hash of the content, from `get_content_hash`
+        """
+        try:
+            with open(self._get_path(content_hash), encoding="utf-8") as f:
+                problems = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return [PIIProblem.from_dict(problem) for problem in problems]
+
+    def set(
+        self,
+        content_hash: str,
+        problems: List[PIIProblem]
+    ) -> None:
+        """
+        Cache the problems of a content.
+
+        :param content_hash: hash of the content, from `get_content_hash`
+        :param problems: problems found in the content
+        """
+        try:
+            serialized = json.dumps([problem.to_dict() for problem in problems])
+        except (TypeError, ValueError):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Written to a temporary file first, so that concurrent runs
+        # never read a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(serialized)
+            os.replace(tmp_path, self._get_path(content_hash))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _get_path(
+        self,
+        content_hash: str
+    ) -> str:
+        return os.path.join(self.directory, content_hash + ".json")
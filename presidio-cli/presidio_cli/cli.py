@@ -1,15 +1,24 @@
 import argparse
+import collections
 import os
 import sys
 import io
 import locale
 import platform
 import json
+import multiprocessing
 import traceback
-from typing import Generator, List
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Generator, Iterable, List, Optional, Tuple, Union
 
 from presidio_cli import SHELL_NAME, APP_DESCRIPTION, APP_VERSION
 from presidio_cli.analyzer import analyze, PIIProblem
+from presidio_cli.cache import ResultsCache
 from presidio_cli.config import PresidioCLIConfig, PresidioCLIConfigError
 
 
@@ -159,17 +168,24 @@ def show_problems(
 
 def find_files_recursively(
     items: List[str],
-    conf: PresidioCLIConfig
+    conf: PresidioCLIConfig,
+    skip_dirs: Optional[List[str]] = None
 ) -> Generator[str, None, None]:
     """
     Generate all file names inside the directories.
 
     :param items: List of directories containing files to be analyzed.
     :param conf: PresidioCLIConfig object
+    :param skip_dirs: Directories not to descend into, e.g. the cache directory
     """
+    skip_dirs = {os.path.realpath(d) for d in skip_dirs or []}
     for item in items:
         if os.path.isdir(item):
             for root, dirnames, filenames in os.walk(item):
+                dirnames[:] = [
+                    d for d in dirnames
+                    if os.path.realpath(os.path.join(root, d)) not in skip_dirs
+                ]
                 for f in filenames:
                     filepath = os.path.join(root, f)
                     if conf.is_text_file(filepath):
@@ -179,6 +195,45 @@ def find_files_recursively(
                 yield item
 
 
+def analyze_files(
+    files: Iterable[str],
+    conf: PresidioCLIConfig,
+    jobs: int = 1,
+    cache: Optional[ResultsCache] = None
+) -> Generator[Tuple[str, List[PIIProblem]], None, None]:
+    """
+    Analyze files, in parallel processes if jobs > 1.
+
+    Files whose content is in the cache aren't analyzed again. Files failing
+    to be analyzed are reported on stderr and skipped.
+
+    :param files: paths of the files to analyze
+    :param conf: PresidioCLIConfig object
+    :param jobs: number of processes analyzing the files
+    :param cache: cache of the problems found in previous runs
+    :return: generator of the files and their problems, in the order of files
+    """
+    executor = _create_executor(conf, jobs) if jobs > 1 else None
+    # Files submitted ahead of the one being reported, two per process keep them
+    # busy without holding the futures of all the files
+    max_pending = 2 * jobs if executor is not None else 1
+    try:
+        pending = collections.deque()
+        for file in files:
+            pending.append(_start_analysis(file, conf, cache, executor))
+            if len(pending) >= max_pending:
+                result = _finish_analysis(pending.popleft(), cache)
+                if result is not None:
+                    yield result
+        while pending:
+            result = _finish_analysis(pending.popleft(), cache)
+            if result is not None:
+                yield result
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
 def run() -> None:
     """
     Entrypoint of Presidio CLI.
@@ -230,6 +285,21 @@ def run() -> None:
         help="output only error level problems",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes analyzing the files in parallel",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        action="store",
+        help="directory caching the results, to skip unchanged files on re-runs",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -250,15 +320,15 @@ def run() -> None:
     if conf.locale is not None:
         locale.setlocale(locale.LC_ALL, conf.locale)
 
+    cache = None
+    skip_dirs = []
+    if args.cache_dir is not None:
+        cache = ResultsCache(args.cache_dir, conf)
+        skip_dirs.append(args.cache_dir)
+
     prob_num = 0
-    for file in find_files_recursively(args.files, conf):
-        filepath = file[2:] if file.startswith("./") or file.startswith(".\\") else file
-        try:
-            with io.open(file, newline="", encoding="utf-8") as f:
-                problems = analyze(f, conf, filepath)
-        except Exception:
-            traceback.print_exc()
-            continue
+    files = find_files_recursively(args.files, conf, skip_dirs)
+    for file, problems in analyze_files(files, conf, args.jobs, cache):
         prob_num = show_problems(
             problems, file, args_format=args.format, no_warn=args.no_warnings
         )
@@ -281,3 +351,97 @@ def run() -> None:
     else:
         return_code = 0
     sys.exit(return_code)
+
+
+# Configuration of the analyzing worker processes
+_worker_conf: Optional[PresidioCLIConfig] = None
+
+
+def _set_worker_conf(conf: PresidioCLIConfig) -> None:
+    global _worker_conf
+    _worker_conf = conf
+
+
+def _create_executor(
+    conf: PresidioCLIConfig,
+    jobs: int
+) -> Executor:
+    if "fork" in multiprocessing.get_all_start_methods():
+        # Forked workers inherit the loaded models instead of loading them again
+        return ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_set_worker_conf,
+            initargs=(conf,),
+        )
+    print("fork is not available, analyzing files using threads", file=sys.stderr)
+    _set_worker_conf(conf)
+    return ThreadPoolExecutor(max_workers=jobs)
+
+
+def _get_filepath(
+    file: str
+) -> str:
+    return file[2:] if file.startswith("./") or file.startswith(".\\") else file
+
+
+def _analyze_file(
+    file: str,
+    conf: Optional[PresidioCLIConfig] = None
+) -> Optional[List[PIIProblem]]:
+    """Return the problems found in a file, None if it fails to be analyzed."""
+    conf = conf or _worker_conf
+    try:
+        with io.open(file, newline="", encoding="utf-8") as f:
+            return list(analyze(f, conf, _get_filepath(file)))
+    except Exception:
+        traceback.print_exc()
+        return None
+
+
+def _start_analysis(
+    file: str,
+    conf: PresidioCLIConfig,
+    cache: Optional[ResultsCache],
+    executor: Optional[Executor]
+) -> Tuple[str, Optional[str], Union[List[PIIProblem], Future, None]]:
+    """
+    Start analyzing a file, unless its problems are cached.
+
+    :return: the file, the hash to cache its problems under (None if they
+    shouldn't be cached) and its problems or a future of them
+    """
+    content_hash = None
+    # Ignored files have no problems regardless of their content
+    if cache is not None and not conf.is_file_ignored(_get_filepath(file)):
+        try:
+            content_hash = ResultsCache.get_content_hash(file)
+        except OSError:
+            pass
+        else:
+            problems = cache.get(content_hash)
+            if problems is not None:
+                return file, None, problems
+
+    if executor is None:
+        return file, content_hash, _analyze_file(file, conf)
+    return file, content_hash, executor.submit(_analyze_file, file)
+
+
+def _finish_analysis(
+    task: Tuple[str, Optional[str], Union[List[PIIProblem], Future, None]],
+    cache: Optional[ResultsCache]
+) -> Optional[Tuple[str, List[PIIProblem]]]:
+    """
+    Wait for a file's analysis started by `_start_analysis`, and cache its problems.
+
+    :return: the file and its problems, None if it failed to be analyzed
+    """
+    file, content_hash, problems = task
+    if isinstance(problems, Future):
+        problems = problems.result()
+    if problems is None:
+        return None
+    if content_hash is not None:
+        cache.set(content_hash, problems)
+    return file, problems
@@ -1,7 +1,11 @@
+import hashlib
+import json
 import yaml
 import pathspec
 import os
+from importlib import metadata
 from presidio_analyzer import AnalyzerEngine
+from presidio_cli import APP_VERSION
 from typing import Optional
 
 
@@ -43,6 +47,28 @@ class PresidioCLIConfig(object):
         """
         return self.ignore and filepath and self.ignore.match_file(filepath)
 
+    def get_hash(self) -> str:
+        """
+        Return a hash of the configuration options affecting analysis results.
+
+        Includes the analyzer's spec and the package versions, so that results
+        are invalidated when the recognizers, models or their code change.
+        """
+        try:
+            analyzer_version = metadata.version("presidio-analyzer")
+        except metadata.PackageNotFoundError:
+            analyzer_version = None
+        options = {
+            "versions": [APP_VERSION, analyzer_version],
+            "entities": sorted(self.entities),
+            "language": self.language,
+            "threshold": self.threshold,
+            "allow_list": self.allow_list,
+            "analyzer": self.analyzer.to_spec(),
+        }
+        serialized = json.dumps(options, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
     def is_text_file(
         self,
         filepath: str
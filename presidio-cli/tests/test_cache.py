@@ -0,0 +1,37 @@
+import os
+
+from presidio_analyzer import RecognizerResult
+from presidio_cli.analyzer import PIIProblem
+from presidio_cli.cache import ResultsCache
+from presidio_cli.config import PresidioCLIConfig
+
+
+def test_cache_round_trip(temp_workspace, config):
+    cache = ResultsCache(temp_workspace, config)
+    problem = PIIProblem(3, RecognizerResult("CREDIT_CARD", 5, 24, 1.0))
+
+    cache.set("hash", [problem])
+    cached = cache.get("hash")
+
+    assert len(cached) == 1
+    assert cached[0].to_dict() == problem.to_dict()
+    assert (cached[0].line, cached[0].column, cached[0].type) == (3, 6, "CREDIT_CARD")
+    assert cache.get("other-hash") is None
+
+
+def test_cache_content_hash(temp_workspace):
+    file = os.path.join(temp_workspace, "errorfile")
+    content_hash = ResultsCache.get_content_hash(file)
+    assert content_hash == ResultsCache.get_content_hash(file)
+
+    with open(file, "a") as f:
+        f.write("changed\n")
+    assert ResultsCache.get_content_hash(file) != content_hash
+
+
+def test_cache_is_separated_by_config(temp_workspace, config):
+    ResultsCache(temp_workspace, config).set("hash", [])
+    other_config = PresidioCLIConfig(content="extends: default\nthreshold: 0.5")
+
+    assert ResultsCache(temp_workspace, config).get("hash") == []
+    assert ResultsCache(temp_workspace, other_config).get("hash") is None
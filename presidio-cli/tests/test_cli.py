@@ -36,6 +36,62 @@ def test_find_files_recursively(temp_workspace, config):
     ]
 
 
+def test_find_files_recursively_skip_dirs(temp_workspace, config):
+    files = cli.find_files_recursively(
+        [temp_workspace], config, skip_dirs=[os.path.join(temp_workspace, "s")]
+    )
+    assert sorted(files) == [
+        os.path.join(temp_workspace, "dos.yml"),
+        os.path.join(temp_workspace, "empty.txt"),
+        os.path.join(temp_workspace, "errorfile"),
+        os.path.join(temp_workspace, "non-ascii", "éçäγλνπ¥", "utf-8"),
+        os.path.join(temp_workspace, "sub", "directory.txt", "empty.txt"),
+    ]
+
+
+def _as_tuples(analyzed_files):
+    return [
+        (file, [(p.line, p.column, p.type, p.score) for p in problems])
+        for file, problems in analyzed_files
+    ]
+
+
+def test_analyze_files_with_jobs(temp_workspace, config):
+    files = sorted(cli.find_files_recursively([temp_workspace], config))
+
+    expected = _as_tuples(cli.analyze_files(files, config))
+    assert _as_tuples(cli.analyze_files(files, config, jobs=2)) == expected
+    assert [file for file, _ in expected] == files
+    assert any(problems for _, problems in expected)
+
+
+def test_analyze_files_with_jobs_submits_bounded_files_ahead(temp_workspace, config):
+    files = sorted(cli.find_files_recursively([temp_workspace], config)) * 4
+    started = []
+
+    def iterate_files():
+        for file in files:
+            started.append(file)
+            yield file
+
+    results = cli.analyze_files(iterate_files(), config, jobs=2)
+    next(results)
+    results.close()
+
+    assert len(started) <= 4 < len(files)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_files_with_cache(jobs, temp_workspace, config, mocker):
+    files = sorted(cli.find_files_recursively([temp_workspace], config))
+    cache = cli.ResultsCache(os.path.join(temp_workspace, ".cache"), config)
+
+    expected = _as_tuples(cli.analyze_files(files, config, jobs, cache))
+    analyze_file = mocker.patch("presidio_cli.cli._analyze_file")
+    assert _as_tuples(cli.analyze_files(files, config, jobs, cache)) == expected
+    analyze_file.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "arg_format",
     [
@@ -90,8 +146,21 @@ def test_run_with_config(temp_workspace, mocker):
     ec.assert_called_once_with(0)
 
 
+def test_run_with_jobs_and_cache(temp_workspace, mocker):
+    os.chdir(temp_workspace)
+    mocker.patch("sys.argv", ["", "-j", "2", "--cache-dir", ".cache", "."])
+    ec = mocker.patch("sys.exit")
+    cli.run()
+    cli.run()
+    assert ec.call_count == 2
+    ec.assert_called_with(0)
+    assert os.listdir(".cache")
+
+
 def test_run_with_stdin(mocker):
-    mocked_args = mocker.Mock(stdin=True, config_data=None, config_file=None, files="")
+    mocked_args = mocker.Mock(
+        stdin=True, config_data=None, config_file=None, files="", jobs=1, cache_dir=None
+    )
     ec = mocker.patch("sys.exit")
     with mocker.patch("argparse.ArgumentParser.parse_args", return_value=mocked_args):
         with mocker.patch("sys.stdin", StringIO("Example input")):